@@ -0,0 +1,11 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""
+This package contains benchmarks of the code generation pipeline.
+
+:mod:`project_generator` creates synthetic C++ projects, :mod:`run_benchmark`
+runs `Py++` on them and reports time and peak memory of every phase.
+"""
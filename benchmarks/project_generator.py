@@ -0,0 +1,170 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""generates synthetic C++ projects, used to benchmark the code generation pipeline"""
+
+import os
+
+class project_t( object ):
+    """describes synthetic C++ project
+
+    :param classes: number of classes
+    :param methods: number of non virtual member functions of every class
+    :param overloads: number of overloads of every non virtual member function
+    :param virtual_methods: number of virtual member functions of every class hierarchy
+    :param hierarchy_depth: number of classes in every class hierarchy, 1 - no hierarchies
+    :param templates: number of class template instantiations
+    :param containers: number of std containers instantiations
+    :param files: number of header files, the classes are distributed between
+    """
+    def __init__( self
+                  , classes=100
+                  , methods=10
+                  , overloads=2
+                  , virtual_methods=2
+                  , hierarchy_depth=3
+                  , templates=10
+                  , containers=10
+                  , files=10 ):
+        object.__init__( self )
+        self.classes = classes
+        self.methods = methods
+        self.overloads = max( overloads, 1 )
+        self.virtual_methods = virtual_methods
+        self.hierarchy_depth = max( hierarchy_depth, 1 )
+        self.templates = min( templates, classes )
+        self.containers = min( containers, classes )
+        self.files = max( min( files, classes ), 1 )
+
+    def to_dict( self ):
+        return dict( classes=self.classes
+                     , methods=self.methods
+                     , overloads=self.overloads
+                     , virtual_methods=self.virtual_methods
+                     , hierarchy_depth=self.hierarchy_depth
+                     , templates=self.templates
+                     , containers=self.containers
+                     , files=self.files )
+
+class generator_t( object ):
+    """writes the project header files to the directory
+
+    The classes are distributed evenly between the files. Every file includes
+    the previous one, so the last file includes the whole project. The file
+    content depends only on the project description, so the files are not
+    rewritten, if they were not changed.
+    """
+    def __init__( self, project, directory ):
+        object.__init__( self )
+        self.project = project
+        self.directory = directory
+
+    def __file_name( self, index ):
+        return os.path.join( self.directory, 'bench_%d.hpp' % index )
+
+    def __file_index( self, class_index ):
+        return class_index * self.project.files // self.project.classes
+
+    def __base_class( self, index ):
+        if index % self.project.hierarchy_depth:
+            return index - 1
+        return None
+
+    def __create_class( self, index ):
+        project = self.project
+        name = 'class_%d' % index
+        base = self.__base_class( index )
+        code = []
+        if None is base:
+            code.append( 'struct %s{' % name )
+        else:
+            code.append( 'struct %s : public class_%d{' % ( name, base ) )
+        code.append( '    %s() : value_%d( %d ){}' % ( name, index, index ) )
+        code.append( '    virtual ~%s(){}' % name )
+        code.append( '    bool operator==( const %s& other ) const { return value_%d == other.value_%d; }'
+                     % ( name, index, index ) )
+        code.append( '    bool operator<( const %s& other ) const { return value_%d < other.value_%d; }'
+                     % ( name, index, index ) )
+        for i in range( project.virtual_methods ):
+            code.append( '    virtual int vmethod_%d( int x ) const { return x + %d; }' % ( i, index ) )
+        for i in range( project.methods ):
+            for j in range( project.overloads ):
+                args = [ 'int x%d' % arg for arg in range( j + 1 ) ]
+                body = ' + '.join( [ 'x%d' % arg for arg in range( j + 1 ) ] )
+                code.append( '    int method_%d( %s ) const { return %s; }'
+                             % ( i, ', '.join( args ), body ) )
+        code.append( '    const %s& self() const { return *this; }' % name )
+        code.append( '    int value_%d;' % index )
+        code.append( '};' )
+        return code
+
+    def __create_instantiations( self, index ):
+        code = []
+        name = 'class_%d' % index
+        if index < self.project.templates:
+            code.append( 'typedef holder_t< %s > %s_holder_t;' % ( name, name ) )
+            code.append( 'inline int instantiate_%s_holder(){ return sizeof( %s_holder_t ); }'
+                         % ( name, name ) )
+        if index < self.project.containers:
+            code.append( 'typedef std::vector< %s > %s_vector_t;' % ( name, name ) )
+            code.append( 'inline %s_vector_t get_%s_vector(){ return %s_vector_t(); }'
+                         % ( name, name, name ) )
+            if index % 2:
+                code.append( 'typedef std::map< std::string, %s > %s_map_t;' % ( name, name ) )
+                code.append( 'inline %s_map_t get_%s_map(){ return %s_map_t(); }'
+                             % ( name, name, name ) )
+        return code
+
+    def __create_file( self, index, classes ):
+        guard = '__bench_%d_hpp__' % index
+        code = [ '// This file has been generated by Py++ benchmark project generator.'
+                 , ''
+                 , '#ifndef %s' % guard
+                 , '#define %s' % guard
+                 , '' ]
+        if index:
+            code.append( '#include "bench_%d.hpp"' % ( index - 1 ) )
+        else:
+            code.extend( [ '#include <map>', '#include <string>', '#include <vector>' ] )
+        code.extend( [ '', 'namespace bench{', '' ] )
+        if not index:
+            code.extend( [ 'template< class T >'
+                           , 'struct holder_t{'
+                           , '    const T& get() const { return value; }'
+                           , '    void set( const T& new_value ){ value = new_value; }'
+                           , '    T value;'
+                           , '};'
+                           , '' ] )
+        for class_index in classes:
+            code.extend( self.__create_class( class_index ) )
+            code.extend( self.__create_instantiations( class_index ) )
+            code.append( '' )
+        code.extend( [ '}', '', '#endif//%s' % guard, '' ] )
+        return os.linesep.join( code )
+
+    def __write_file( self, file_name, content ):
+        if os.path.exists( file_name ):
+            f = file( file_name, 'r' )
+            old_content = f.read()
+            f.close()
+            if old_content == content:
+                return
+        f = file( file_name, 'w+' )
+        f.write( content )
+        f.close()
+
+    def generate( self ):
+        """writes the project files and returns the list of their names"""
+        if not os.path.exists( self.directory ):
+            os.makedirs( self.directory )
+        file2classes = [ [] for i in range( self.project.files ) ]
+        for class_index in range( self.project.classes ):
+            file2classes[ self.__file_index( class_index ) ].append( class_index )
+        files = []
+        for index, classes in enumerate( file2classes ):
+            file_name = self.__file_name( index )
+            self.__write_file( file_name, self.__create_file( index, classes ) )
+            files.append( file_name )
+        return files
@@ -0,0 +1,128 @@
+#! /usr/bin/python
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""runs `Py++` on the synthetic project and reports time and peak memory of every phase
+
+Usage example::
+
+    python run_benchmark.py --classes=2000 --snapshot=bench.pypp.bin --report=bench.json
+
+The script generates the project, parses it, builds the code creators tree
+and writes the generated code to multiple files. When GCC-XML is not installed,
+the declarations tree is loaded from the snapshot, created by the previous run
+on the machine with GCC-XML.
+"""
+
+import os
+import sys
+import optparse
+
+this_module_dir_path = os.path.abspath( os.path.dirname( sys.modules[__name__].__file__ ) )
+sys.path.append( os.path.dirname( this_module_dir_path ) )
+
+from environment import gccxml
+from pyplusplus import utils
+from pyplusplus import module_builder
+
+import project_generator
+
+def run( project, work_dir, snapshot=None, jobs=1 ):
+    """runs the code generation pipeline and returns the benchmark report
+
+    The report is a dictionary, which contains the project description, the
+    builder phases( see :class:`utils.statistics_t` ) and the phases of the
+    benchmark itself: builder construction, code creators tree construction
+    and writing.
+    """
+    include_dir = os.path.join( work_dir, 'include' )
+    generated_dir = os.path.join( work_dir, 'generated' )
+    if not os.path.exists( generated_dir ):
+        os.makedirs( generated_dir )
+
+    steps = utils.statistics_t()
+    steps.start( 'project_generation' )
+    files = project_generator.generator_t( project, include_dir ).generate()
+    steps.stop( 'project_generation', len( files ) )
+
+    steps.start( 'builder' )
+    mb = module_builder.module_builder_t( files
+                                          , gccxml_path=gccxml.executable
+                                          , working_directory=include_dir
+                                          , include_paths=[ include_dir ]
+                                          , snapshot=snapshot
+                                          , jobs=jobs )
+    steps.stop( 'builder', project.classes )
+
+    steps.start( 'code_creators' )
+    mb.build_code_creator( 'bench' )
+    steps.stop( 'code_creators', project.classes )
+
+    steps.start( 'split_module' )
+    written_files = mb.split_module( generated_dir, jobs=jobs )
+    steps.stop( 'split_module', len( written_files ) )
+
+    return dict( project=project.to_dict()
+                 , phases=mb.stats.to_dict()[ 'phases' ]
+                 , steps=steps.to_dict()[ 'phases' ] )
+
+def print_report( report, writer=sys.stdout.write ):
+    """prints the benchmark report as a table"""
+    def format_memory( peak_memory ):
+        if None is peak_memory:
+            return 'n/a'
+        return '%.1f' % ( peak_memory / 1024.0 / 1024.0 )
+
+    row = '%-20s %8s %10s %10s %10s %12s' + os.linesep
+    for title in ( 'steps', 'phases' ):
+        writer( os.linesep + title + ':' + os.linesep )
+        writer( row % ( 'name', 'calls', 'items', 'wall(s)', 'cpu(s)', 'peak mem(MB)' ) )
+        for phase in report[ title ]:
+            writer( row % ( phase[ 'name' ]
+                            , phase[ 'calls' ]
+                            , phase[ 'items' ]
+                            , '%.3f' % phase[ 'wall_time' ]
+                            , '%.3f' % phase[ 'cpu_time' ]
+                            , format_memory( phase[ 'peak_memory' ] ) ) )
+
+def main():
+    defaults = project_generator.project_t()
+    parser = optparse.OptionParser( usage='%prog [options]' )
+    for option in ( 'classes', 'methods', 'overloads', 'virtual_methods'
+                    , 'hierarchy_depth', 'templates', 'containers', 'files' ):
+        parser.add_option( '--' + option.replace( '_', '-' )
+                           , dest=option
+                           , type='int'
+                           , default=getattr( defaults, option )
+                           , help='default: %default' )
+    parser.add_option( '--work-dir', dest='work_dir'
+                       , default=os.path.join( this_module_dir_path, 'temp' )
+                       , help='directory for the project and the generated code, default: %default' )
+    parser.add_option( '--snapshot', dest='snapshot', default=None
+                       , help='declarations snapshot file, see module_builder_t "snapshot" argument' )
+    parser.add_option( '--jobs', dest='jobs', type='int', default=1
+                       , help='number of processes, which run GCC-XML and render the classes files, default: %default' )
+    parser.add_option( '--report', dest='report', default=None
+                       , help='JSON file, the report will be written to' )
+    options, args = parser.parse_args()
+
+    project = project_generator.project_t( classes=options.classes
+                                           , methods=options.methods
+                                           , overloads=options.overloads
+                                           , virtual_methods=options.virtual_methods
+                                           , hierarchy_depth=options.hierarchy_depth
+                                           , templates=options.templates
+                                           , containers=options.containers
+                                           , files=options.files )
+    report = run( project, options.work_dir, options.snapshot, options.jobs )
+    print_report( report )
+    if options.report:
+        import json
+        f = file( options.report, 'w+' )
+        f.write( json.dumps( report, indent=4 ) )
+        f.close()
+
+if __name__ == '__main__':
+    main()
@@ -18,12 +18,15 @@ The base class for all code creators is :class:`code_creators.code_creator_t`.
 from code_creator import code_creator_t
 from code_creator import separator_t
 from compound import compound_t
+from sink import sink_t
 
 from algorithm import (make_flatten, make_flatten_list, make_flatten_generator)
 from algorithm import creator_finder
 from algorithm import create_identifier
 from algorithm import creators_affect_on_me
 
+from creators_index import creators_index_t
+
 from custom import custom_t
 from custom import custom_text_t
 
@@ -15,29 +15,24 @@ import types
 import namespace
 
 def _make_flatten_list( creator_or_creators ):
-    import compound
-    def proceed_single( creator ):
-        answer = [ creator ]
-        if not isinstance( creator, compound.compound_t):
-            return answer
-        for internal in creator.creators:
-            if isinstance( creator, compound.compound_t):
-                answer.extend( proceed_single( internal ) )
-            else:
-                answer.append( internal )
-        return answer
-
-    creators = []
+    found = _find_creators_index( creator_or_creators )
+    if found:
+        creators_index, scope, include_scope = found
+        return creators_index.flatten( scope, include_scope )
     if isinstance( creator_or_creators, types.ListType ):
-        creators.extend( creator_or_creators )
-    else:
-        creators.append( creator_or_creators )
-    answer = []
-    for creator in creators:
-        answer.extend( proceed_single( creator ) )
-    return answer
+        answer = []
+        for creator in creator_or_creators:
+            answer.extend( _make_flatten_list( creator ) )
+        return answer
+    return list( walk( creator_or_creators ) )
 
 def make_flatten_generator( creator_or_creators ):
+    if _find_creators_index( creator_or_creators ):
+        return iter( _make_flatten_list( creator_or_creators ) )
+    return walk( creator_or_creators )
+
+def walk( creator_or_creators ):
+    """traverses the code creators tree, without using the tree index"""
     import compound
     def proceed_single( creator ):
         yield creator
@@ -60,10 +55,29 @@ def make_flatten_generator( creator_or_creators ):
 
 """
 make_flatten - function that will create flat representation of code creators tree.
+The flat representation of the tree, which has an index( :class:`code_creators.module_t` ),
+is taken from the index, so the tree is not traversed again, until it is changed.
 """
 make_flatten_list = _make_flatten_list
 make_flatten = _make_flatten_list
 
+def _find_creators_index( where ):
+    """returns the code creators tree index, the scope and whether the scope
+    itself is searched, or None, if the search area could not be given by the
+    index"""
+    include_scope = True
+    scope = where
+    if isinstance( where, types.ListType ):
+        #the index answers only the queries on all children of a single creator
+        if not where or None is where[0].parent or where[0].parent.creators is not where:
+            return None
+        scope = where[0].parent
+        include_scope = False
+    creators_index = getattr( scope.top_parent, 'creators_index', None )
+    if not creators_index:
+        return None
+    return creators_index, scope, include_scope
+
 class creator_finder:
     """
     This class is used as container for different find algorithms.
@@ -86,6 +100,24 @@ class creator_finder:
                                     and declaration_matcher( inst.declaration )
                        , search_area )
 
+    @staticmethod
+    def find_by_declaration_instance( declaration, where, recursive=True, ordered=True ):
+        """Finds code creators of the declaration.
+        where - code creator or list of code creators
+        This function returns a list of all relevant code creators.
+        The code creators tree index is used, if it is possible. If ordered is
+        False, the creators, found by the index, are not sorted in the tree
+        traversal order.
+        """
+        if recursive:
+            found = _find_creators_index( where )
+            if found:
+                creators_index, scope, include_scope = found
+                return creators_index.find_by_declaration( declaration, scope, include_scope, ordered )
+        return creator_finder.find_by_declaration( lambda decl: decl is declaration
+                                                   , where
+                                                   , recursive )
+
     @staticmethod
     def find_by_declaration_single( declaration_matcher, where, recursive=True ):
         answer = creator_finder.find_by_declaration( declaration_matcher, where, recursive )
@@ -97,6 +129,10 @@ class creator_finder:
     def find_by_class_instance( what, where, recursive=True ):
         search_area = where
         if recursive:
+            found = _find_creators_index( where )
+            if found:
+                creators_index, scope, include_scope = found
+                return creators_index.find_by_class( what, scope, include_scope )
             search_area = make_flatten_generator( where )
         return filter( lambda inst: isinstance( inst, what ), search_area )
 
@@ -123,14 +123,14 @@ class class_t( scoped.scoped_t, registration_based.registration_based_t ):
             if hierarchy_info.access_type == declarations.ACCESS_TYPES.PRIVATE:
                 continue
             base_classes[ id( hierarchy_info.related_class ) ] = hierarchy_info
-        base_classes_size = len( base_classes )
         creators = {}
-        creators_len = 0
-        for creator in algorithm.make_flatten_generator( self.top_parent.body.creators ):
-            if isinstance( creator, class_t ) and id(creator.declaration) in base_classes:
-                creators[ id(creator.declaration) ] = creator
-                if len( creators ) == base_classes_size:
-                    break #all classes has been found
+        find = algorithm.creator_finder.find_by_declaration_instance
+        body_creators = self.top_parent.body.creators
+        for hierarchy_info in base_classes.itervalues():
+            found = filter( lambda creator: isinstance( creator, class_t )
+                            , find( hierarchy_info.related_class, body_creators ) )
+            if found:
+                creators[ id( hierarchy_info.related_class ) ] = found[0]
         return base_classes, creators
 
     def _get_base_operators(self, base_classes, base_creators):
@@ -255,6 +255,26 @@ class class_t( scoped.scoped_t, registration_based.registration_based_t ):
         result.append( ';' )
         return ''.join( result )
 
+    def _render_code_no_scope(self, sink):
+        base_classes, base_creators = self._exported_base_classes()
+        class_definition = self._generate_class_definition(base_creators)
+        class_constructor, used_init = self._generate_constructor()
+        sink.write( class_definition + class_constructor )
+        creators = self.creators
+        if self.declaration.redefine_operators:
+            creators = self.creators + self._get_base_operators(base_classes, base_creators)
+        sink.indent()
+        for x in creators:
+            if not ( x is used_init ):
+                code = x.create()
+                tmpl = '%s%s.%s'
+                if self.is_comment( code ):
+                    tmpl = '%s%s%s'
+                if code:
+                    sink.write( tmpl % ( sink.INDENTATION, os.linesep, code ) )
+        sink.dedent()
+        sink.write( ';' )
+
     @property
     def class_var_name(self):
         return self.declaration.class_var_name
@@ -311,6 +331,40 @@ class class_t( scoped.scoped_t, registration_based.registration_based_t ):
 
         return os.linesep.join( result )
 
+    def _render_code_with_scope(self, sink):
+        scope_var_name = self.alias + '_scope'
+        base_classes, base_creators = self._exported_base_classes()
+        sink.write( '{ //%s' % declarations.full_name( self.declaration, with_defaults=False ) )
+        sink.indent()
+        sink.write( os.linesep + 'typedef ' + self._generate_class_definition(base_creators) + ' ' + self.typedef_name + ';')
+        class_constructor, used_init = self._generate_constructor()
+        sink.write( os.linesep + self.typedef_name + ' ' + self.class_var_name
+                    + ' = ' + self.typedef_name + class_constructor + ';' )
+        sink.write( os.linesep + algorithm.create_identifier( self, '::boost::python::scope' )
+                    + ' ' + scope_var_name + '( %s );' % self.class_var_name )
+
+        creators = self.creators
+        if self.declaration.redefine_operators:
+            creators = self.creators + self._get_base_operators(base_classes, base_creators)
+
+        for x in creators:
+            if x is used_init:
+                continue
+            if isinstance( x, ( calldef.calldef_t, calldef.calldef_overloads_t ) ):
+                x.works_on_instance = False
+                code = x.create()
+                if code:
+                    sink.write( os.linesep + code )
+                continue
+            if not x.works_on_instance:
+                code = x.create()
+                if code:
+                    sink.write( os.linesep + code )
+            else:
+                sink.write( os.linesep + '%s.%s;' % ( self.class_var_name, x.create() ) )
+        sink.dedent()
+        sink.write( os.linesep + '}' )
+
     def is_exposed_using_scope(self):
         if self.declaration.always_expose_using_scope:
             return True
@@ -324,6 +378,14 @@ class class_t( scoped.scoped_t, registration_based.registration_based_t ):
         else:
             return self._generate_code_no_scope()
 
+    def _render_impl(self, sink):
+        if self.declaration.already_exposed:
+            return
+        if self.is_exposed_using_scope():
+            self._render_code_with_scope( sink )
+        else:
+            self._render_code_no_scope( sink )
+
     def _get_system_files_impl( self ):
         return []
 
@@ -398,6 +460,14 @@ class class_wrapper_t( scoped.scoped_t ):
         answer.append( '};' )
         return os.linesep.join( answer )
 
+    def _render_impl(self, sink):
+        if self.declaration.already_exposed:
+            return
+        sink.write( 'struct %s : %s {' % ( self.wrapper_alias, self._create_bases() )
+                    + os.linesep + os.linesep )
+        self.render_internal_code( self.creators, sink )
+        sink.write( os.linesep + os.linesep + '};' )
+
     def _get_system_files_impl( self ):
         return []
 
@@ -27,6 +27,14 @@ class code_creator_t(object):
     PARAM_SEPARATOR = ', '
     CODE_GENERATOR_TYPES = decl_wrappers.CODE_GENERATOR_TYPES
 
+    #the created code is cached only within code caching session, see
+    #:meth:`begin_code_caching` method
+    _code_caching_depth = 0
+    _code_caching_session = 0
+    _code = None
+    _code_session = None
+    _replaced_code = None
+
     def __init__(self):
         """Constructor.
 
@@ -48,6 +56,8 @@ class code_creator_t(object):
     def _get_works_on_instance(self):
         return self._works_on_instance
     def _set_works_on_instance(self, works_on_instance):
+        if self._works_on_instance != works_on_instance:
+            self.invalidate_code()
         self._works_on_instance = works_on_instance
     works_on_instance = property( _get_works_on_instance, _set_works_on_instance )
 
@@ -66,6 +76,8 @@ class code_creator_t(object):
     def _get_target_configuration( self ):
         return self._target_configuration
     def _set_target_configuration( self, config ):
+        if self._target_configuration is not config:
+            self.invalidate_code()
         self._target_configuration = config
     """target_configuration - reference to target_configuration_t class instance"""
     target_configuration = property( _get_target_configuration, _set_target_configuration,
@@ -102,11 +114,89 @@ class code_creator_t(object):
         """
         generates source code
 
+        Within code caching session the code is created only once, unless the
+        creator was changed.
+
         :rtype: str
         """
+        if None is not self._replaced_code:
+            return self._replaced_code
+        if code_creator_t._code_caching_depth \
+           and self._code_session == code_creator_t._code_caching_session:
+            return self._code
         code = self._create_impl()
         assert isinstance( code, types.StringTypes )
-        return self.beautify( code )
+        code = self.beautify( code )
+        if code_creator_t._code_caching_depth:
+            self._code = code
+            self._code_session = code_creator_t._code_caching_session
+        return code
+
+    @staticmethod
+    def begin_code_caching():
+        """
+        starts code caching session: the code, created by the code creators,
+        is reused till the end of the session. The file writers use the session,
+        because declarations are not changed, while the code is written. The
+        sessions could be nested.
+        """
+        if not code_creator_t._code_caching_depth:
+            code_creator_t._code_caching_session += 1
+        code_creator_t._code_caching_depth += 1
+
+    @staticmethod
+    def end_code_caching():
+        """ends code caching session, started by :meth:`begin_code_caching`"""
+        assert code_creator_t._code_caching_depth
+        code_creator_t._code_caching_depth -= 1
+
+    def invalidate_code( self ):
+        """marks the cached code of the creator and its parents as changed"""
+        creator = self
+        while creator:
+            creator._code_session = None
+            creator = creator.parent
+
+    def replace_code( self, code ):
+        """
+        replaces the code, created by the creator, with the given one. The file
+        writers use it to replace the code, which was already written to other
+        file. If the code is None, the creator generates its code again.
+
+        :param code: C++ source code
+        :type code: str
+        """
+        self._replaced_code = code
+        self.invalidate_code()
+
+    @property
+    def replaced_code( self ):
+        """the code, given to :meth:`replace_code` method, or None"""
+        return self._replaced_code
+
+    def render( self, sink ):
+        """
+        writes generated source code to the sink
+
+        :param sink: the code receiver
+        :type sink: :class:`code_creators.sink_t`
+        """
+        if None is not self._replaced_code or 'create' in self.__dict__:
+            #the code of the creator was replaced
+            sink.write( self.create() )
+        elif code_creator_t._code_caching_depth \
+             and self._code_session == code_creator_t._code_caching_session:
+            sink.write( self._code )
+        else:
+            self._render_impl( sink )
+
+    def _render_impl( self, sink ):
+        """
+        function that derived classes could implement, to write the code to the
+        sink without creating it as a single string. The default implementation
+        writes the code, returned by :meth:`create`.
+        """
+        sink.write( self.create() )
 
     @staticmethod
     def unique_headers( headers ):
@@ -15,8 +15,33 @@ class compound_t(code_creator.code_creator_t):
         """
         code_creator.code_creator_t.__init__( self )
         self._creators = []
+        #id( anchor ) -> ( anchor, creators, which should be inserted before it )
+        self._insertions = {}
+        #id( child ) -> position in the children list, calculated on demand
+        self._children_positions = None
+        #[ ( position, namespace alias creator ) ], calculated on demand
+        self._namespace_aliases = None
+        #( ( ( alias, full namespace name ), ... ), full name ) -> identifier
+        self._identifiers = None
+
+    def _children_changed( self ):
+        self.invalidate_code()
+        self._children_positions = None
+        self._namespace_aliases = None
+        self._identifiers = None
+
+    def _flush_insertions( self ):
+        """inserts the creators, adopted by :meth:`adopt_creator_before`, into the children list"""
+        if not self._insertions:
+            return
+        insertions = self._insertions
+        self._insertions = {}
+        for anchor, creators in insertions.itervalues():
+            index = self._creators.index( anchor )
+            self._creators[ index:index ] = creators
 
     def _get_creators(self):
+        self._flush_insertions()
         return self._creators
     creators = property(_get_creators,
                         doc="""A list of children nodes.
@@ -30,11 +55,16 @@ class compound_t(code_creator.code_creator_t):
         :param index: Desired position of the creator or None to append it to the end of the list
         :type index: int
         """
+        self._flush_insertions()
+        self._children_changed()
         creator.parent = self
         if index or index == 0:
             self._creators.insert( index, creator )
         else:
             self._creators.append( creator )
+        creators_index = self._get_creators_index()
+        if creators_index:
+            creators_index.register( creator )
 
     def adopt_creators( self, creators, index=None):
         """Add a creators to the list of children creators.
@@ -50,6 +80,40 @@ class compound_t(code_creator.code_creator_t):
             else:
                 self.adopt_creator( creator )
 
+    def adopt_creator_before( self, creator, anchor ):
+        """Add a creator to the list of children creators, right before the anchor.
+
+        The creators, adopted before the same anchor, keep the adoption order.
+        The operation takes constant time: the children list is updated, only
+        when it is accessed next time.
+
+        :param creator: Creator object
+        :type creator: :class:`code_creators.code_creator_t`
+        :param anchor: children creator, the creator should be inserted before
+        :type anchor: :class:`code_creators.code_creator_t`
+        """
+        assert anchor.parent is self
+        self._children_changed()
+        creator.parent = self
+        if id( anchor ) in self._insertions:
+            self._insertions[ id( anchor ) ][1].append( creator )
+        else:
+            self._insertions[ id( anchor ) ] = ( anchor, [ creator ] )
+        creators_index = self._get_creators_index()
+        if creators_index:
+            creators_index.register( creator )
+
+    def adopt_creators_before( self, creators, anchor ):
+        """Add a creators to the list of children creators, right before the anchor.
+
+        :param creators: list of creators object
+        :type creator: :class:`code_creators.code_creator_t`
+        :param anchor: children creator, the creators should be inserted before
+        :type anchor: :class:`code_creators.code_creator_t`
+        """
+        for creator in creators:
+            self.adopt_creator_before( creator, anchor )
+
     def remove_creator( self, creator ):
         """Remove a children code creator object.
 
@@ -57,9 +121,49 @@ class compound_t(code_creator.code_creator_t):
         :param creator: The creator node to remove
         :type creator: :class:`code_creators.code_creator_t`
         """
+        self._flush_insertions()
+        self._children_changed()
+        creators_index = self._get_creators_index()
+        if creators_index:
+            creators_index.unregister( creator )
         creator.parent = None
         del self._creators[ self._creators.index( creator ) ]
 
+    def get_child_index( self, child ):
+        """returns the position of the child in the :attr:`creators` list"""
+        if None is self._children_positions:
+            self._children_positions \
+                = dict( [ ( id( cc ), index ) for index, cc in enumerate( self.creators ) ] )
+        try:
+            return self._children_positions[ id( child ) ]
+        except KeyError:
+            raise ValueError( 'The creator is not a child of the compound creator.' )
+
+    def get_namespace_aliases_before( self, child ):
+        """returns namespace alias creators, which precede the child, in the children order"""
+        if None is self._namespace_aliases:
+            import namespace
+            self._namespace_aliases \
+                = [ ( index, cc ) for index, cc in enumerate( self.creators )
+                    if isinstance( cc, namespace.namespace_alias_t ) ]
+        if not self._namespace_aliases:
+            return []
+        child_index = self.get_child_index( child )
+        return [ cc for index, cc in self._namespace_aliases if index < child_index ]
+
+    def get_identifiers( self ):
+        """returns the identifiers, created for the children by :func:`decl_wrappers.algorithm.create_identifier`
+
+        The dictionary is dropped, when the children list is changed.
+        """
+        if None is self._identifiers:
+            self._identifiers = {}
+        return self._identifiers
+
+    def _get_creators_index( self ):
+        """returns the index of the code creators tree, if the creator belongs to one"""
+        return getattr( self.top_parent, 'creators_index', None )
+
     @staticmethod
     def create_internal_code( creators, indent_code=True ):
         """
@@ -78,10 +182,37 @@ class compound_t(code_creator.code_creator_t):
             internals[index] = internals[index] + os.linesep
         return os.linesep.join( internals )
 
+    @staticmethod
+    def render_internal_code( creators, sink, indent_code=True ):
+        """
+        writes the code of a list of code creators to the sink.
+
+        The result is the same as the result of :meth:`create_internal_code`.
+
+        :param creators: A list with code creators
+        :type creators: list of :class:`code_creators.code_creator_t`
+        :param sink: the code receiver
+        :type sink: :class:`code_creators.sink_t`
+        """
+        written = False
+        for creator in creators:
+            if written:
+                sink.set_separator( os.linesep * 2 )
+            before = sink.written
+            if indent_code:
+                sink.indent()
+            creator.render( sink )
+            if indent_code:
+                sink.dedent()
+            if before != sink.written:
+                written = True
+        if written:
+            sink.clear_separator()
+
     def get_system_files( self, recursive=False, unique=False, language='any' ):
         files = super( compound_t, self ).get_system_files(recursive, unique=False, language=language)
         if recursive:
-            for creator in self._creators:
+            for creator in self.creators:
                 files.extend( creator.get_system_files(recursive, unique=False, language=language) )
         files = filter( None, files )
         if unique:
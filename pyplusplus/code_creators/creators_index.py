@@ -0,0 +1,178 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which indexes code creators tree by declaration and code creator class"""
+
+import bisect
+import compound
+import algorithm
+import declaration_based
+
+class creators_index_t( object ):
+    """index of the code creators tree by declaration and code creator class
+
+    The index is owned by the root of the tree - :class:`code_creators.module_t`.
+    It is updated by :meth:`code_creators.compound_t.adopt_creator` and
+    :meth:`code_creators.compound_t.remove_creator` methods, so lookups do not
+    traverse the whole tree. The creators are returned in the order of the tree
+    traversal, same as :func:`code_creators.make_flatten` does.
+
+    The flat representation of the tree and the positions of the creators of
+    every queried class are built on demand and reused, until the tree is
+    changed, so "all creators of the class" queries do not traverse the tree.
+    """
+
+    def __init__( self, root ):
+        object.__init__( self )
+        self.__root = root
+        #id( declaration ) -> [ creators ]
+        self.__decl2creators = {}
+        #code creator class -> [ creators ]
+        self.__type2creators = {}
+        #the tree traversal, calculated on demand
+        self.__flatten = None
+        #id( creator ) -> position in the tree traversal, calculated on demand
+        self.__positions = None
+        #id( creator ) -> position, which follows the creator sub-tree
+        self.__ends = None
+        #code creator class -> sorted positions of its instances
+        self.__class2positions = {}
+        self.register( root )
+
+    @property
+    def root( self ):
+        """reference to the root of the code creators tree"""
+        return self.__root
+
+    def register( self, creator ):
+        """adds the creator and all its children to the index"""
+        for cc in algorithm.walk( creator ):
+            self.__type2creators.setdefault( cc.__class__, [] ).append( cc )
+            if isinstance( cc, declaration_based.declaration_based_t ):
+                self.__decl2creators.setdefault( id( cc.declaration ), [] ).append( cc )
+        self.__reset()
+
+    def unregister( self, creator ):
+        """removes the creator and all its children from the index"""
+        for cc in algorithm.walk( creator ):
+            self.__remove( self.__type2creators, cc.__class__, cc )
+            if isinstance( cc, declaration_based.declaration_based_t ):
+                self.__remove( self.__decl2creators, id( cc.declaration ), cc )
+        self.__reset()
+
+    def __reset( self ):
+        self.__flatten = None
+        self.__positions = None
+        self.__ends = None
+        self.__class2positions = {}
+
+    @staticmethod
+    def __remove( db, key, creator ):
+        creators = db[ key ]
+        for index, cc in enumerate( creators ):
+            if cc is creator:
+                del creators[ index ]
+                break
+        if not creators:
+            del db[ key ]
+
+    def __build( self ):
+        flatten = []
+        positions = {}
+        ends = {}
+        to_be_visited = [ ( self.__root, False ) ]
+        while to_be_visited:
+            creator, visited = to_be_visited.pop()
+            if visited:
+                ends[ id( creator ) ] = len( flatten )
+                continue
+            positions[ id( creator ) ] = len( flatten )
+            flatten.append( creator )
+            if isinstance( creator, compound.compound_t ):
+                to_be_visited.append( ( creator, True ) )
+                to_be_visited.extend( [ ( child, False ) for child in reversed( creator.creators ) ] )
+            else:
+                ends[ id( creator ) ] = len( flatten )
+        self.__flatten = flatten
+        self.__positions = positions
+        self.__ends = ends
+
+    def __get_positions( self ):
+        if None is self.__positions:
+            self.__build()
+        return self.__positions
+
+    def __get_range( self, scope, include_scope ):
+        """returns the positions range of the scope sub-tree"""
+        start = self.__get_positions()[ id( scope ) ]
+        if not include_scope:
+            start += 1
+        return start, self.__ends[ id( scope ) ]
+
+    def flatten( self, scope=None, include_scope=True ):
+        """returns the creators of the scope sub-tree, in the tree traversal order"""
+        start, end = self.__get_range( scope or self.__root, include_scope )
+        return self.__flatten[ start:end ]
+
+    @staticmethod
+    def __tree_path( creator ):
+        """returns the positions of the creator and its parents in their parents children lists, from the root"""
+        path = []
+        while creator.parent:
+            path.append( creator.parent.get_child_index( creator ) )
+            creator = creator.parent
+        path.reverse()
+        return path
+
+    def __select( self, creators, scope, include_scope, ordered ):
+        """returns creators, which belong to the scope sub-tree
+
+        If `ordered` is True, the creators are sorted in the tree traversal order,
+        otherwise they are returned in the order they were added to the tree.
+        Only the children lists of the creators parents are used to sort them,
+        so the tree traversal is not built.
+        """
+        selected = []
+        for creator in creators:
+            if creator is scope:
+                if include_scope:
+                    selected.append( creator )
+                continue
+            parent = creator.parent
+            while parent and parent is not scope:
+                parent = parent.parent
+            if parent:
+                selected.append( creator )
+        if ordered and 1 < len( selected ):
+            selected.sort( key=self.__tree_path )
+        return selected
+
+    def find_by_declaration( self, decl, scope=None, include_scope=True, ordered=True ):
+        """returns declaration based creators of the declaration from the scope sub-tree
+
+        If the caller does not need the creators in the tree traversal order,
+        `ordered` argument could be set to False.
+        """
+        return self.__select( self.__decl2creators.get( id( decl ), [] )
+                              , scope or self.__root
+                              , include_scope
+                              , ordered )
+
+    def find_by_class( self, class_, scope=None, include_scope=True ):
+        """returns instances of the code creator class from the scope sub-tree"""
+        positions = self.__get_positions()
+        if class_ not in self.__class2positions:
+            class_positions = []
+            for type_, type_creators in self.__type2creators.iteritems():
+                if issubclass( type_, class_ ):
+                    class_positions.extend( [ positions[ id( cc ) ] for cc in type_creators ] )
+            class_positions.sort()
+            self.__class2positions[ class_ ] = class_positions
+        class_positions = self.__class2positions[ class_ ]
+        start, end = self.__get_range( scope or self.__root, include_scope )
+        flatten = self.__flatten
+        return [ flatten[ position ] for position
+                 in class_positions[ bisect.bisect_left( class_positions, start )
+                                     : bisect.bisect_left( class_positions, end ) ] ]
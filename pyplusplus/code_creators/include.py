@@ -37,6 +37,8 @@ class include_t(code_creator.code_creator_t):
     def _get_include_dirs_optimization(self):
         return self._include_dirs_optimization
     def _set_include_dirs_optimization(self, include_dirs):
+        if self._include_dirs_optimization is not include_dirs:
+            self.invalidate_code()
         self._include_dirs_optimization = include_dirs
     include_dirs_optimization = property( _get_include_dirs_optimization, _set_include_dirs_optimization )
 
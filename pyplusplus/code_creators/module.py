@@ -11,6 +11,7 @@ import compound
 import namespace
 import algorithm
 import module_body
+import creators_index
 import library_reference
 import declaration_based
 import include_directories
@@ -29,6 +30,12 @@ class module_t(compound.compound_t):
         compound.compound_t.__init__(self)
         self.__global_ns = global_ns
         self._code_generator = code_generator_type
+        self.__creators_index = creators_index.creators_index_t( self )
+
+    @property
+    def creators_index(self):
+        "reference to :class:`code_creators.creators_index_t` of the code creators tree"
+        return self.__creators_index
 
     @property
     def global_ns(self):
@@ -206,6 +213,21 @@ class bpmodule_t(module_t):
         code.append( os.linesep )
         return os.linesep.join( code )
 
+    def _render_impl( self, sink ):
+        self.do_include_dirs_optimization()
+        index = 0
+        includes = []
+        for index in range( len( self.creators ) ):
+            if not isinstance( self.creators[index], include.include_t ):
+                break
+            else:
+                includes.append( self.creators[index].create() )
+        if includes:
+            sink.write( os.linesep.join( includes ) )
+            sink.set_separator( os.linesep * 4 )
+        self.render_internal_code( self.creators[index:], sink, indent_code=False )
+        sink.clear_separator()
+
     def add_include( self, header, user_defined=True, system=False ):
         creator = include.include_t( header=header, user_defined=user_defined, system=system )
         self.adopt_include( creator )
@@ -221,7 +243,10 @@ class bpmodule_t(module_t):
                             , self.last_include_index() + 1 )
 
     def adopt_declaration_creator( self, creator ):
-        self.adopt_creator( creator, self.creators.index( self.body ) )
+        self.adopt_creator_before( creator, self.body )
+
+    def adopt_declaration_creators( self, creators ):
+        self.adopt_creators_before( creators, self.body )
 
     def add_declaration_code( self, code, position ):
         self.adopt_declaration_creator( custom.custom_text_t( code ) )
@@ -242,6 +267,9 @@ class ctypes_module_t(module_t):
     def _create_impl(self):
         return self.create_internal_code( self.creators, indent_code=False )
 
+    def _render_impl( self, sink ):
+        self.render_internal_code( self.creators, sink, indent_code=False )
+
     @utils.cached
     def library_var_name(self):
         for creator in self.creators:
@@ -0,0 +1,92 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, the generated source code is rendered to"""
+
+import os
+import code_creator
+
+class sink_t( object ):
+    """receives the generated source code fragments and indents them
+
+    The code creators write their code to the sink, using
+    :meth:`code_creators.code_creator_t.render` method. The sink tracks the
+    indentation level and the separator between the code fragments, so the
+    code is not copied on every level of the code creators tree. The result
+    is the same as the one, :meth:`code_creators.code_creator_t.create` method
+    returns.
+
+    :param stream: file-like object, the code is written to. If it is not
+                   given, the code is accumulated and could be retrieved
+                   using :meth:`getvalue` method.
+    """
+
+    INDENTATION = code_creator.code_creator_t.indent( '' )
+
+    def __init__( self, stream=None ):
+        object.__init__( self )
+        self.__fragments = []
+        if None is stream:
+            self.__write = self.__fragments.append
+        else:
+            self.__write = stream.write
+        self.__prefixes = [ '' ]
+        self.__at_line_start = True
+        self.__separator = None
+        self.__written = 0
+
+    @property
+    def written( self ):
+        """the number of non empty code fragments, written to the sink"""
+        return self.__written
+
+    def getvalue( self ):
+        """returns the code, accumulated by the sink"""
+        return ''.join( self.__fragments )
+
+    def indent( self ):
+        """increases the indentation level of the code, written after the call"""
+        self.__prefixes.append( self.__prefixes[-1] + self.INDENTATION )
+
+    def dedent( self ):
+        """restores the previous indentation level"""
+        self.__prefixes.pop()
+
+    def set_separator( self, separator ):
+        """sets the separator, which is written right before the next non empty code fragment"""
+        self.__separator = ( separator, self.__prefixes[-1] )
+
+    def clear_separator( self ):
+        """removes the separator, if it was not written yet"""
+        self.__separator = None
+
+    def write( self, code ):
+        """writes the code fragment, every line of it is indented"""
+        if not code:
+            return
+        if self.__separator:
+            separator, prefix = self.__separator
+            self.__separator = None
+            self.__write_lines( separator, prefix )
+        self.__write_lines( code, self.__prefixes[-1] )
+        self.__written += 1
+
+    def __write_lines( self, code, prefix ):
+        write = self.__write
+        lines = code.split( os.linesep )
+        last = len( lines ) - 1
+        for index, line in enumerate( lines ):
+            if index:
+                write( os.linesep )
+                self.__at_line_start = True
+            #the indentation of the last line is written with its content,
+            #may be on the next indentation level
+            if self.__at_line_start and ( line or index != last ):
+                if prefix:
+                    write( prefix )
+                self.__at_line_start = False
+            if line:
+                write( line )
+                self.__at_line_start = False
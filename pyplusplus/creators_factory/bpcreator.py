@@ -3,6 +3,7 @@
 # accompanying file LICENSE_1_0.txt or copy at
 # http://www.boost.org/LICENSE_1_0.txt)
 
+import readme_report
 import types_database
 import creators_wizard
 import sort_algorithms
@@ -12,6 +13,7 @@ import call_policies_resolver
 import fake_constructors_manager
 
 from pygccxml import declarations
+from pyplusplus import utils
 from pyplusplus import decl_wrappers
 from pyplusplus import code_creators
 from pyplusplus import code_repository
@@ -37,7 +39,12 @@ class bpcreator_t( declarations.decl_visitor_t ):
                   , call_policies_resolver_=None
                   , types_db=None
                   , target_configuration=None
-                  , enable_indexing_suite=True ):
+                  , enable_indexing_suite=True
+                  , stats=None
+                  , used_smart_ptr_converters_only=False
+                  , readme_report_file=None
+                  , decls_digest=None
+                  , jobs=1 ):
         """Constructor.
 
         :param decls: Declarations that should be exposed in the final module.
@@ -47,6 +54,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
         :param types_db: ...todo...
         :param target_configuration: A target configuration object can be used to customize the generated source code to a particular compiler or a particular version of Boost.Python.
         :param already_exposed_dbs: list of files/directories other modules, this module depends on, generated their code too
+        :param stats: the object, which collects time and counters of the code creators tree construction phases
+        :param used_smart_ptr_converters_only: if True, smart pointer converters are created only between the classes, which smart pointers are used in the exposed declarations
+        :param readme_report_file: the file, the declarations diagnostics are stored in. The stored diagnostics are reused, if the declarations tree digest and the declarations settings were not changed
+        :param decls_digest: digest, which identifies the declarations tree, or None, if the stored diagnostics should not be reused
+        :param jobs: number of processes, which calculate the declarations diagnostics
         :type decls: list of declaration_t
         :type module_name: str
         :type boost_python_ns_name: str
@@ -54,12 +66,26 @@ class bpcreator_t( declarations.decl_visitor_t ):
         :type types_db: L:class:`types_database.types_database_t`
         :type target_configuration: :class:`code_creators.target_configuration_t`
         :type already_exposed_dbs: list of strings
+        :type stats: :class:`utils.statistics_t`
+        :type used_smart_ptr_converters_only: bool
+        :type readme_report_file: str
+        :type decls_digest: str
+        :type jobs: int
         """
         declarations.decl_visitor_t.__init__(self)
         self.logger = _logging_.loggers.module_builder
         self.decl_logger = _logging_.loggers.declarations
 
+        self.__stats = stats
+        if None is self.__stats:
+            self.__stats = utils.statistics_t()
+
+        self.__readme_report_file = readme_report_file
+        self.__decls_digest = decls_digest
+        self.__jobs = jobs
+
         self.__enable_indexing_suite = enable_indexing_suite
+        self.__used_smart_ptr_converters_only = used_smart_ptr_converters_only
         self.__target_configuration = target_configuration
         if not self.__target_configuration:
             self.__target_configuration = code_creators.target_configuration_t()
@@ -88,8 +114,12 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.__opaque_types_manager = opaque_types_manager.manager_t( self.__extmodule )
         self.__dependencies_manager = dependencies_manager.manager_t(self.decl_logger)
 
+        self.__stats.start( 'prepare_decls' )
         prepared_decls = self._prepare_decls( decls )
+        self.__stats.stop( 'prepare_decls', len( prepared_decls ) )
+        self.__stats.start( 'sorting' )
         self.__decls = sort_algorithms.sort( prepared_decls )
+        self.__stats.stop( 'sorting', len( self.__decls ) )
 
         self.curr_code_creator = self.__module_body
         self.curr_decl = None
@@ -99,6 +129,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
         self.__exposed_free_fun_overloads = set()
         self.__fc_manager = fake_constructors_manager.manager_t( global_ns )
 
+    @property
+    def stats( self ):
+        """time and counters of the code creators tree construction phases"""
+        return self.__stats
+
     def __print_readme( self, decl ):
         readme = decl.readme()
         if not readme:
@@ -112,9 +147,29 @@ class bpcreator_t( declarations.decl_visitor_t ):
         for msg in readme:
             self.decl_logger.warn( "%s;%s" % ( decl, msg ) )
 
+    def __print_readme_report( self, decls, readme_decls ):
+        """prints the diagnostics of the declarations, using the stored report, if it is up to date"""
+        self.__stats.start( 'readme' )
+        key = None
+        if self.__readme_report_file and self.__decls_digest:
+            key = readme_report.create_key( self.__decls_digest, decls )
+        report = None
+        if self.__readme_report_file:
+            report = readme_report.readme_report_t.load( self.__readme_report_file, key )
+        if None is report:
+            report = readme_report.create( readme_decls, key, self.__jobs )
+            if self.__readme_report_file:
+                report.save( self.__readme_report_file )
+        id2decl = dict( readme_decls )
+        for decl_id, msg_id, text in report.entries:
+            self.decl_logger.warn( "%s;%s" % ( id2decl[ decl_id ], text ) )
+        self.__stats.stop( 'readme', len( readme_decls ) )
+
     def _prepare_decls( self, decls ):
         to_be_exposed = []
-        for decl in declarations.make_flatten( decls ):
+        #( position in the declarations tree traversal, declaration ) tuples
+        readme_decls = []
+        for decl_id, decl in enumerate( declarations.make_flatten( decls ) ):
             if decl.ignore:
                 continue
 
@@ -127,7 +182,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
 
             if not decl.exportable:
                 #leave only decls that user wants to export and that could be exported
-                self.__print_readme( decl )
+                readme_decls.append( ( decl_id, decl ) )
                 continue
 
             if decl.already_exposed:
@@ -149,8 +204,9 @@ class bpcreator_t( declarations.decl_visitor_t ):
             #if isinstance( decl, declarations.variable_t ):
                 #self.__types_db.update( decl )
 
-            self.__print_readme( decl )
+            readme_decls.append( ( decl_id, decl ) )
 
+        self.__print_readme_report( decls, readme_decls )
         return to_be_exposed
 
     def _adopt_free_operator( self, operator ):
@@ -170,27 +226,19 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 pass
             else:
                 assert not "Found %d class code creators" % len(creator)
-        find = code_creators.creator_finder.find_by_declaration
+        find = code_creators.creator_finder.find_by_declaration_instance
         if operator.target_class and operator.target_class.ignore == False:
-            found = find( lambda decl: operator.target_class is decl
-                          , self.__extmodule.body.creators )
+            found = find( operator.target_class, self.__extmodule.body.creators, ordered=False )
             adopt_operator_impl( operator, found )
 
-    def _is_registered_smart_pointer_creator( self, creator, db ):
-        for registered in db:
-            if not isinstance( creator, registered.__class__ ):
-                continue
-            elif registered.smart_ptr != creator.smart_ptr:
-                continue
-            elif isinstance( creator, code_creators.smart_pointer_registrator_t ):
-                if creator.declaration is registered.declaration:
-                    return True
-            elif isinstance( creator, code_creators.smart_pointers_converter_t ):
-                if ( creator.source is registered.source ) \
-                   and ( creator.target is registered.target ):
-                    return True
-            else:
-                assert not "unknown instace of registrator: " % str( registered )
+    def _smart_pointer_creator_key( self, creator ):
+        """returns the key, which identifies the registered smart pointer or converter"""
+        if isinstance( creator, code_creators.smart_pointer_registrator_t ):
+            return ( creator.__class__, creator.smart_ptr, id( creator.declaration ) )
+        elif isinstance( creator, code_creators.smart_pointers_converter_t ):
+            return ( creator.__class__, creator.smart_ptr, id( creator.source ), id( creator.target ) )
+        else:
+            assert not "unknown instace of registrator: " % str( creator )
 
     def _treat_smart_pointers( self ):
         """
@@ -201,16 +249,18 @@ class bpcreator_t( declarations.decl_visitor_t ):
         class_creators = find_classes( what=code_creators.class_t
                                        , where=self.__extmodule.body.creators
                                        , recursive=True )
-        registrators_db = []
+        registrators_db = set()
         for creator in class_creators:
             if None is creator.held_type:
                 if not creator.declaration.is_abstract:
                     creator.held_type = self.__types_db.create_holder( creator.declaration )
-            registrators = self.__types_db.create_registrators( creator )
+            registrators = self.__types_db.create_registrators( creator
+                                                                , self.__used_smart_ptr_converters_only )
             for r in registrators:
-                if not self._is_registered_smart_pointer_creator( r, registrators_db ):
+                key = self._smart_pointer_creator_key( r )
+                if key not in registrators_db:
                     creator.adopt_creator(r)
-                    registrators_db.append(r)
+                    registrators_db.add( key )
 
     def _append_user_code( self ):
         find_classes = code_creators.creator_finder.find_by_class_instance
@@ -235,8 +285,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
                 cls_creator.wrapper.adopt_creators( uc_creators )
 
             uc_creators = map( lambda uc: ctext_t( uc.text ), cls_decl.declaration_code )
-            insert_pos = self.__extmodule.creators.index( self.__module_body )
-            self.__extmodule.adopt_creators( uc_creators, insert_pos )
+            self.__extmodule.adopt_declaration_creators( uc_creators )
             cls_creator.associated_decl_creators.extend( uc_creators )
 
     def __get_exposed_containers(self):
@@ -318,14 +367,18 @@ class bpcreator_t( declarations.decl_visitor_t ):
         :rtype: :class:`code_creators.module_t`
         """
         # Invoke the appropriate visit_*() method on all decls
+        self.__stats.start( 'visiting' )
         for decl in self.__decls:
             self.curr_decl = decl
             declarations.apply_visitor( self, decl )
         for operator in self.__free_operators:
             self._adopt_free_operator( operator )
         self._treat_smart_pointers()
+        self.__stats.stop( 'visiting', len( self.__decls ) )
         if self.__enable_indexing_suite:
+            self.__stats.start( 'indexing_suite' )
             self._treat_indexing_suite()
+            self.__stats.stop( 'indexing_suite', len( self.__types_db.used_containers ) )
         for creator in code_creators.make_flatten_generator( self.__extmodule ):
             creator.target_configuration = self.__target_configuration
         #last action.
@@ -342,7 +395,9 @@ class bpcreator_t( declarations.decl_visitor_t ):
         map( lambda header: add_include( header, user_defined=False, system=False )
              , decl_headers )
 
+        self.__stats.start( 'dependencies' )
         self.__dependencies_manager.inform_user()
+        self.__stats.stop( 'dependencies' )
 
         return self.__extmodule
 
@@ -465,10 +520,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
 
         elif self.curr_decl.use_overload_macro:
             parent_decl = self.curr_decl.parent
-            names = set( map( lambda decl: decl.name
-                              , parent_decl.free_functions( allow_empty=True, recursive=False ) ) )
+            free_functions, name2overloads \
+                = parent_decl.get_calldefs_groups( declarations.free_function_t )
+            names = set( map( lambda decl: decl.name, free_functions ) )
             for name in names:
-                overloads = parent_decl.free_functions( name, allow_empty=True, recursive=False )
+                overloads = name2overloads[ name ]
                 overloads = filter( lambda decl: decl.ignore == False and decl.use_overload_macro, overloads )
                 if not overloads:
                     continue
@@ -491,8 +547,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
                     ctext_t = code_creators.custom_text_t
                     for f in overloads:
                         uc_creators = map( lambda uc: ctext_t( uc.text ), f.declaration_code )
-                        insert_pos = self.__extmodule.creators.index( self.__module_body )
-                        self.__extmodule.adopt_creators( uc_creators, insert_pos )
+                        self.__extmodule.adopt_declaration_creators( uc_creators )
                         overloads_reg.associated_decl_creators.extend( uc_creators )
         else:
             self.__types_db.update( self.curr_decl )
@@ -513,8 +568,7 @@ class bpcreator_t( declarations.decl_visitor_t ):
 
             ctext_t = code_creators.custom_text_t
             uc_creators = map( lambda uc: ctext_t( uc.text ), self.curr_decl.declaration_code )
-            insert_pos = self.__extmodule.creators.index( self.__module_body )
-            self.__extmodule.adopt_creators( uc_creators, insert_pos )
+            self.__extmodule.adopt_declaration_creators( uc_creators )
             maker.associated_decl_creators.extend( uc_creators )
 
     def visit_free_operator( self ):
@@ -537,10 +591,11 @@ class bpcreator_t( declarations.decl_visitor_t ):
     def expose_overloaded_mem_fun_using_macro( self, cls, cls_creator ):
         #returns set of exported member functions
         exposed = set()
-        names = set( map( lambda decl: decl.name
-                          , cls.member_functions( allow_empty=True, recursive=False ) ) )
+        member_functions, name2overloads \
+            = cls.get_calldefs_groups( declarations.member_function_t )
+        names = set( map( lambda decl: decl.name, member_functions ) )
         for name in names:
-            overloads = cls.member_functions( name, allow_empty=True, recursive=False )
+            overloads = name2overloads[ name ]
             overloads = filter( lambda decl: decl.ignore == False and decl.use_overload_macro
                                 , overloads )
             if not overloads:
@@ -0,0 +1,177 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which keeps the diagnostics `Py++` reports for the declarations
+
+The diagnostics are the messages, returned by :meth:`decl_wrappers.decl_wrapper_t.readme`
+method. They are calculated in one pass, optionally by a pool of processes,
+created by "fork", and could be stored on disk. The stored report is reused, if
+it was created for the same key: the declarations tree and the `Py++` settings
+of the declarations were not changed.
+"""
+
+import os
+import time
+import multiprocessing
+try:
+    from hashlib import md5
+except:
+    from md5 import new as md5
+
+from pygccxml import declarations
+from pyplusplus import messages
+from pyplusplus import _logging_
+from pyplusplus import decl_wrappers
+
+def is_supported():
+    """returns True, if the pool processes could inherit the declarations tree"""
+    return hasattr( os, 'fork' )
+
+def create_key( decls_digest, decls ):
+    """creates key, which identifies the diagnostics of the declarations
+
+    The key is built from the digest of the declarations tree, for example
+    :attr:`module_builder.decls_snapshot.snapshot_t.digest`, and the `Py++`
+    settings of the declarations, the diagnostics depend on. The call policies
+    are not resolved: only whether they were set, or will be resolved by default,
+    is taken into account.
+    """
+    key = md5()
+    key.update( str( readme_report_t.FORMAT_VERSION ) )
+    key.update( decls_digest )
+    key.update( str( sorted( map( messages.find_out_message_id, messages.DISABLE_MESSAGES ) ) ) )
+    key.update( str( ( decl_wrappers.calldef_t.BOOST_PYTHON_MAX_ARITY
+                       , decl_wrappers.decl_wrapper_t.SPECIAL_TYPEDEF_PICK_ANY ) ) )
+    for decl in declarations.make_flatten( decls ):
+        settings = [ decl.__class__.__name__
+                     , decl.name
+                     , decl.ignore
+                     , decl.already_exposed
+                     , decl.alias
+                     , decl.config_version
+                     , sorted( map( messages.find_out_message_id, decl.disabled_messages ) ) ]
+        if isinstance( decl, declarations.calldef_t ):
+            settings.append( decl.call_policies_state )
+            settings.append( len( decl.transformations ) )
+            if decl.transformations:
+                ft = decl.transformations[0]
+                settings.append( ( ft.alias, ft.unique_name ) )
+        elif isinstance( decl, decl_wrappers.class_t ):
+            settings.append( map( str, decl.fake_constructors ) )
+        key.update( str( settings ) )
+    return key.hexdigest()
+
+class readme_report_t( object ):
+    """diagnostics, `Py++` reports for the declarations
+
+    Every entry is a tuple: the declaration id - its position in the
+    declarations tree traversal, the message id and the message text. The
+    entries are kept in the order, the messages are reported in.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__( self, key=None, entries=None ):
+        object.__init__( self )
+        self.__key = key
+        self.__entries = []
+        if entries:
+            self.__entries.extend( entries )
+
+    @property
+    def key( self ):
+        """the key, the report was created for, or None"""
+        return self.__key
+
+    @property
+    def entries( self ):
+        """list of ( declaration id, message id, message text ) tuples"""
+        return self.__entries
+
+    def add( self, decl_id, msgs ):
+        """appends the declaration messages"""
+        for msg_id, text in msgs:
+            self.__entries.append( ( decl_id, msg_id, text ) )
+
+    def save( self, file_name ):
+        """writes the report, as JSON, to the file"""
+        import json
+        f = file( file_name, 'w+' )
+        try:
+            json.dump( dict( format_version=self.FORMAT_VERSION
+                             , key=self.key
+                             , entries=self.entries )
+                       , f
+                       , indent=1 )
+        finally:
+            f.close()
+
+    @staticmethod
+    def load( file_name, key ):
+        """returns the report, stored in the file, or None
+
+        None is returned, if the file does not exist or the report was created
+        for different key.
+        """
+        import json
+        logger = _logging_.loggers.module_builder
+        if None is key or not os.path.isfile( file_name ):
+            return None
+        try:
+            f = file( file_name, 'r' )
+            try:
+                data = json.load( f )
+            finally:
+                f.close()
+        except Exception, error:
+            logger.info( 'unable to load diagnostics report "%s": %s' % ( file_name, str( error ) ) )
+            return None
+        if readme_report_t.FORMAT_VERSION != data.get( 'format_version' ) or key != data.get( 'key' ):
+            logger.info( 'diagnostics report "%s" is out of date' % file_name )
+            return None
+        entries = [ ( decl_id, msg_id and str( msg_id ), str( text ) )
+                    for decl_id, msg_id, text in data[ 'entries' ] ]
+        logger.info( 'diagnostics were loaded from report "%s"' % file_name )
+        return readme_report_t( key, entries )
+
+#the declarations. Pool processes, created by "fork", inherit them
+_decls = None
+
+def _readme( index ):
+    return [ ( messages.find_out_message_id( msg ), str( msg ) ) for msg in _decls[ index ][1].readme() ]
+
+def create( decls, key=None, jobs=1 ):
+    """runs `readme` method of the declarations and returns :class:`readme_report_t`
+
+    :param decls: list of ( declaration id, declaration ) tuples, in the order
+                  the messages are reported in
+    :param jobs: number of processes. The pool is used only if :func:`is_supported`
+                 returns True.
+    """
+    global _decls
+    logger = _logging_.loggers.module_builder
+    start_time = time.clock()
+    if not is_supported() or len( decls ) < 2:
+        jobs = 1
+    logger.debug( 'creating diagnostics of %d declarations using %d processes - started' % ( len( decls ), jobs ) )
+    _decls = decls
+    try:
+        if 1 < jobs:
+            pool = multiprocessing.Pool( jobs )
+            try:
+                readmes = pool.map( _readme, range( len( decls ) ) )
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            readmes = map( _readme, range( len( decls ) ) )
+    finally:
+        _decls = None
+    report = readme_report_t( key )
+    for ( decl_id, decl ), msgs in zip( decls, readmes ):
+        report.add( decl_id, msgs )
+    logger.debug( 'creating diagnostics of %d declarations using %d processes - done( %f seconds )'
+                  % ( len( decls ), jobs, time.clock() - start_time ) )
+    return report
@@ -138,12 +138,23 @@ class types_database_t( object ):
             if not already_registered:
                 registered.append( spregistrator_t( smart_ptr=smart_ptr, class_creator=class_creator) )
 
-    def create_registrators( self, class_creator ):
+    def _is_used_smart_ptr( self, class_decl, smart_ptr ):
+        dbs = [ self.__arguments_types, self.__return_types, self.__variables ]
+        for db in dbs:
+            found = self._find_smart_ptrs( db, class_decl )
+            if found and filter( lambda inst: inst[0] == smart_ptr, found ):
+                return True
+        return False
+
+    def create_registrators( self, class_creator, used_converters_only=False ):
         """
         looks for all places where the class may be used as smart pointer.
 
         If found, then creates :class:`code_creators.smart_pointer_registrator_t`
         for that class and pointer type.
+
+        If `used_converters_only` is True, implicit converters are created only
+        between the classes, which are both used with the smart pointer.
         """
         spconverter_t = code_creators.smart_pointers_converter_t
         registrators = []
@@ -158,12 +169,18 @@ class types_database_t( object ):
             answer.append( registrator )
             decl = registrator.declaration
             for hierarchy_info in decl.recursive_bases:
+                if used_converters_only \
+                   and not self._is_used_smart_ptr( hierarchy_info.related_class, registrator.smart_ptr ):
+                    continue
                 if hierarchy_info.access_type != declarations.ACCESS_TYPES.PRIVATE:
                     converter = spconverter_t( smart_ptr=registrator.smart_ptr
                                                , source=class_creator.declaration
                                                , target=hierarchy_info.related_class )
                     answer.append( converter )
             for hierarchy_info in decl.recursive_derived:
+                if used_converters_only \
+                   and not self._is_used_smart_ptr( hierarchy_info.related_class, registrator.smart_ptr ):
+                    continue
                 if hierarchy_info.access_type != declarations.ACCESS_TYPES.PRIVATE:
                     converter = spconverter_t( smart_ptr=registrator.smart_ptr
                                                , source=hierarchy_info.related_class
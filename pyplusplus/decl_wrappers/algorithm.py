@@ -33,8 +33,7 @@ def creators_affect_on_me( me ):
         def _get_left_siblings( self, child ):
             if not child or not child.parent:
                 return []
-            ids = map( id, child.parent.creators )
-            child_index = ids.index( id( child ) )
+            child_index = child.parent.get_child_index( child )
             return child.parent.creators[:child_index]
 
         def _get_definition_set( self, child ):
@@ -85,16 +84,35 @@ def create_valid_name(name):
 
 
 def create_identifier(creator, full_name ):
-    """Return new full name, which takes into account namespace aliases"""
-
-    from pyplusplus import code_creators
-    dset = creators_affect_on_me( creator )
-    dset = filter( lambda x: isinstance( x, code_creators.namespace_alias_t ), dset )
+    """Return new full name, which takes into account namespace aliases
+
+    The namespace aliases, which affect the creator, are the same ones
+    :func:`creators_affect_on_me` returns, but they are looked up using
+    the aliases list, every compound creator keeps, so only the creator
+    parents are visited. The result is cached by the creator parent, see
+    :meth:`code_creators.compound_t.get_identifiers`, by the aliases and
+    the name.
+    """
+    if not ( creator and creator.parent ):
+        return __create_identifier( [], full_name )
+    aliases = []
+    child = creator
+    while child and child.parent:
+        for nsalias in child.parent.get_namespace_aliases_before( child ):
+            aliases.append( ( nsalias.alias, nsalias.full_namespace_name ) )
+        child = child.parent
+    identifiers = creator.parent.get_identifiers()
+    key = ( tuple( aliases ), full_name )
+    if key not in identifiers:
+        identifiers[ key ] = __create_identifier( aliases, full_name )
+    return identifiers[ key ]
+
+def __create_identifier( aliases, full_name ):
     full_name = full_name.lstrip( '::' )
-    for nsalias in dset:
-        fnsname = nsalias.full_namespace_name + '::'
+    for alias, full_namespace_name in aliases:
+        fnsname = full_namespace_name + '::'
         if full_name.startswith( fnsname ):
-            new_name = nsalias.alias + '::' + full_name[ len(fnsname) :  ]
+            new_name = alias + '::' + full_name[ len(fnsname) :  ]
             return new_name
     else:
         return full_name
@@ -139,7 +157,13 @@ class registration_order:
         if declarations.is_calldef_pointer( arg_type ):
             return []
         problematics = []
-        for f in calldef.overloads:
+        overloads = None
+        if hasattr( calldef.parent, 'get_calldefs_groups' ):
+            overloads = calldef.parent.get_calldefs_groups( declarations.calldef_t )[1].get( calldef.name, [] )
+            overloads = filter( lambda f: f is not calldef, overloads )
+        else:
+            overloads = calldef.overloads
+        for f in overloads:
             if 1 != len( f.required_args ):
                 continue
             if f.ignore:
@@ -24,25 +24,54 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
     For more information see: http://mail.python.org/pipermail/c++-sig/2002-June/001554.html
     """
 
+    _call_policies = None
+    _call_policies_resolver = None
+    _use_keywords = True
+    _use_default_arguments = True
+    _create_with_signature = None
+    _overridable = None
+    _non_overridable_reason = None
+    _transformations = None
+
     def __init__(self, *arguments, **keywords):
         decl_wrapper.decl_wrapper_t.__init__( self, *arguments, **keywords )
 
-        self._call_policies = None
-        self._use_keywords = True
-        self._use_default_arguments = True
-        self._create_with_signature = None
-        self._overridable = None
-        self._non_overridable_reason = None
-        self._transformations = None
-
     def get_call_policies(self):
+        if self._call_policies_resolver:
+            resolver = self._call_policies_resolver
+            self._call_policies_resolver = None
+            self._call_policies = resolver( self )
         return self._call_policies
     def set_call_policies(self, call_policies):
+        self._call_policies_resolver = None
         self._call_policies = call_policies
     call_policies = property( get_call_policies, set_call_policies
                               , doc="reference to :class:`decl_wrappers.call_policy_t` class." \
                                    +"Default value is calculated at runtime, based on return value.")
 
+    def set_call_policies_resolver( self, resolver ):
+        """defer default call policies calculation
+
+        The resolver will be called, when the call policies are accessed for the
+        first time, unless they were set explicitly before.
+        """
+        self._call_policies_resolver = resolver
+
+    @property
+    def call_policies_state( self ):
+        """describes the call policies, without calculating the default ones
+
+        'deferred' - the default call policies will be calculated on the first
+        access, 'set' - the call policies were set or calculated, 'not set' -
+        the call policies are None.
+        """
+        if self._call_policies_resolver:
+            return 'deferred'
+        elif None is self._call_policies:
+            return 'not set'
+        else:
+            return 'set'
+
     def _get_use_keywords(self):
         return self._use_keywords and bool( self.arguments )
     def _set_use_keywords(self, use_keywords):
@@ -118,6 +147,8 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
         return self._overridable
 
     def set_overridable( self, overridable ):
+        if self._overridable != overridable:
+            self._config_changed()
         self._overridable = overridable
 
     overridable = property( get_overridable, set_overridable
@@ -155,6 +186,7 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
         keywd - keyword arguments for :class:`function_transformers.function_transformation_t` class initialization
         """
         self.transformations.append( ft.function_transformation_t( self, transformer_creators, **keywd ) )
+        self._config_changed()
 
     def _exportable_impl_derived( self ):
         return ''
@@ -246,14 +278,16 @@ class calldef_t(decl_wrapper.decl_wrapper_t):
 
 class member_function_t( declarations.member_function_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the member function"""
+
+    _use_overload_macro = False
+    _override_precall_code = None
+    _overide_native_precall_code = None
+    _default_precall_code = None
+    _adaptor = None
+
     def __init__(self, *arguments, **keywords):
         declarations.member_function_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._use_overload_macro = False
-        self._override_precall_code = []
-        self._overide_native_precall_code = []
-        self._default_precall_code =  []
-        self._adaptor = None
 
     def _get_adaptor(self):
         return self._adaptor
@@ -267,29 +301,35 @@ class member_function_t( declarations.member_function_t, calldef_t ):
 
     def add_override_precall_code(self, code):
         """add code, which should be executed, before overridden member function call"""
-        self._override_precall_code.append( code )
+        self.override_precall_code.append( code )
 
     @property
     def override_precall_code(self):
         """code, which should be executed, before overrided member function call"""
+        if None is self._override_precall_code:
+            self._override_precall_code = []
         return self._override_precall_code
 
     def add_override_native_precall_code(self, code):
         """add code, which should be executed, before native member function call"""
-        self._overide_native_precall_code.append( code )
+        self.override_native_precall_code.append( code )
 
     @property
     def override_native_precall_code(self):
         """code, which should be executed, before overrided member function call"""
+        if None is self._overide_native_precall_code:
+            self._overide_native_precall_code = []
         return self._overide_native_precall_code
 
     def add_default_precall_code(self, code):
         """add code, which should be executed, before this member function call"""
-        self._default_precall_code.append( code )
+        self.default_precall_code.append( code )
 
     @property
     def default_precall_code(self):
         """code, which should be executed, before this member function call"""
+        if None is self._default_precall_code:
+            self._default_precall_code = []
         return self._default_precall_code
 
     def get_use_overload_macro(self):
@@ -315,15 +355,19 @@ class member_function_t( declarations.member_function_t, calldef_t ):
 
 class constructor_t( declarations.constructor_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the constructor"""
+
+    _body = ''
+    _allow_implicit_conversion = True
+
     def __init__(self, *arguments, **keywords):
         declarations.constructor_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._body = ''
-        self._allow_implicit_conversion = True
 
     def _get_body(self):
         return self._body
     def _set_body(self, body):
+        if self._body != body:
+            self._config_changed()
         self._body = body
     body = property( _get_body, _set_body
                      , doc="string, class-wrapper constructor body" )
@@ -462,34 +506,42 @@ class operators_helper:
 
 class member_operator_t( declarations.member_operator_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the member operator"""
+
+    _override_precall_code = None
+    _default_precall_code = None
+    _overide_native_precall_code = None
+
     def __init__(self, *arguments, **keywords):
         declarations.member_operator_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._override_precall_code = []
-        self._default_precall_code =  []
-        self._overide_native_precall_code = []
-        
+
     def add_override_precall_code(self, code):
-        self._override_precall_code.append( code )
+        self.override_precall_code.append( code )
 
     @property
     def override_precall_code(self):
+        if None is self._override_precall_code:
+            self._override_precall_code = []
         return self._override_precall_code
 
     def add_default_precall_code(self, code):
-        self._default_precall_code.append( code )
+        self.default_precall_code.append( code )
 
     @property
     def default_precall_code(self):
+        if None is self._default_precall_code:
+            self._default_precall_code = []
         return self._default_precall_code
 
     def add_override_native_precall_code(self, code):
         """add code, which should be executed, before native member function call"""
-        self._overide_native_precall_code.append( code )
+        self.override_native_precall_code.append( code )
 
     @property
     def override_native_precall_code(self):
         """code, which should be executed, before overrided member function call"""
+        if None is self._overide_native_precall_code:
+            self._overide_native_precall_code = []
         return self._overide_native_precall_code
 
 
@@ -595,12 +647,14 @@ class casting_operator_t( declarations.casting_operator_t, calldef_t ):
 
 class free_function_t( declarations.free_function_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the free function"""
+
+    _use_overload_macro = False
+    _declaration_code = None
+    _adaptor = None
+
     def __init__(self, *arguments, **keywords):
         declarations.free_function_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._use_overload_macro = False
-        self._declaration_code = []
-        self._adaptor = None
 
     def _get_adaptor(self):
         return self._adaptor
@@ -621,6 +675,8 @@ class free_function_t( declarations.free_function_t, calldef_t ):
         the same file in which the registration code for the function will be
         generated
         """
+        if None is self._declaration_code:
+            self._declaration_code = []
         return self._declaration_code
 
     def get_use_overload_macro(self):
@@ -634,10 +690,12 @@ class free_function_t( declarations.free_function_t, calldef_t ):
 
 class free_operator_t( declarations.free_operator_t, calldef_t ):
     """defines a set of properties, that will instruct `Py++` how to expose the free operator"""
+
+    _target_class = None
+
     def __init__(self, *arguments, **keywords):
         declarations.free_operator_t.__init__( self, *arguments, **keywords )
         calldef_t.__init__( self )
-        self._target_class = None
 
     def _exportable_impl_derived( self ):
         return operators_helper.exportable( self )
@@ -26,6 +26,43 @@ class impl_details:
         ALWAYS_TRUE = 'always true'
         all = [ TRUE,  FALSE, ALWAYS_TRUE ]
 
+    class signatures_t( object ):
+        """functions, grouped by signature key
+
+        :func:`declarations.is_same_function` returns True only for functions
+        with the same key, so a function is compared only with the functions
+        from its group.
+        """
+        def __init__( self, functions=None ):
+            object.__init__( self )
+            self.__groups = {}
+            for f in functions or []:
+                self.add( f )
+
+        @staticmethod
+        def key( f ):
+            has_const = None
+            if isinstance( f, declarations.member_calldef_t ):
+                has_const = f.has_const
+            return ( f.__class__, has_const, f.name, len( f.arguments ) )
+
+        def add( self, f ):
+            self.__groups.setdefault( self.key( f ), [] ).append( f )
+
+        def remove( self, f ):
+            group = self.__groups[ self.key( f ) ]
+            for index, f_impl in enumerate( group ):
+                if f_impl is f:
+                    del group[ index ]
+                    break
+
+        def find( self, f ):
+            """returns the "same" function or None"""
+            for f_impl in self.__groups.get( self.key( f ), [] ):
+                if declarations.is_same_function( f, f_impl ):
+                    return f_impl
+            return None
+
 
 always_expose_using_scope_documentation = \
 """boolean, configures how `Py++` should generate code for class.
@@ -56,14 +93,16 @@ class class_common_details_t( object ):
     defines :class:`pygccxml.declarations.class_declaration_t` and :class:`pygccxml.declarations.class_t`
     classes common properties
     """
+
+    _always_expose_using_scope = None
+    _indexing_suite = None
+    _equality_comparable = None
+    _less_than_comparable = None
+    _isuite_version = 1
+    _opaque = False
+
     def __init__(self):
         object.__init__( self )
-        self._always_expose_using_scope = None
-        self._indexing_suite = None
-        self._equality_comparable = None
-        self._less_than_comparable = None
-        self._isuite_version = 1
-        self._opaque = False
 
     def _get_indexing_suite_version( self ):
         return self._isuite_version
@@ -172,33 +211,40 @@ class class_t( class_common_details_t
     FAKE_CONSTRUCTOR_TYPES = ( declarations.member_function_t, declarations.free_function_t )
     FAKE_CONSTRUCTOR_TYPE_NAMES = 'member and free functions'
 
+    _redefine_operators = False
+    _held_type = None
+    _noncopyable = None
+    _wrapper_alias = None
+    _registration_code_head = None
+    _registration_code_tail = None
+    _declaration_code = None
+    _wrapper_code = None
+    _destructor_code = None
+    _exception_translation_code = None
+    _properties = None
+    _redefined_funcs = None
+    _overridable_funcs = None
+    #sort algorithm -> ( config_version, members ), see get_exportable_members
+    _exportable_members = None
+    #( config_version, ... ), explanation, see is_wrapper_needed
+    _wrapper_needed = None
+    _require_self_reference  = False
+    _exposed_class_type = EXPOSED_CLASS_TYPE.DECLARED
+    _expose_this = None
+    _expose_sizeof = None
+    _fake_constructors = None
+    _no_init = None
+
     def __init__(self, *arguments, **keywords):
         class_common_details_t.__init__( self )
         declarations.class_t.__init__(self, *arguments, **keywords )
         scopedef_wrapper.scopedef_t.__init__( self )
 
-        self._redefine_operators = False
-        self._held_type = None
-        self._noncopyable = None
-        self._wrapper_alias = None
-        self._registration_code_head = []
-        self._registration_code_tail = []
-        self._declaration_code = []
-        self._wrapper_code = []
-        self._destructor_code = []
-        self._exception_translation_code = None
-        self._properties = []
-        self._redefined_funcs = None
-        self._require_self_reference  = False
-        self._exposed_class_type = self.EXPOSED_CLASS_TYPE.DECLARED
-        self._expose_this = None
-        self._expose_sizeof = None
-        self._fake_constructors = []
-        self._no_init = None
-
     @property
     def fake_constructors(self):
         """list of fake constructors"""
+        if None is self._fake_constructors:
+            self._fake_constructors = []
         return self._fake_constructors
 
     def add_fake_constructors( self, f ):
@@ -208,9 +254,10 @@ class class_t( class_common_details_t
         class constructor.
         """
         if isinstance( f, declarations.calldef_t ):
-            self._fake_constructors.append( f )
+            self.fake_constructors.append( f )
         else:
-            self._fake_constructors.extend( f )
+            self.fake_constructors.extend( f )
+        self._config_changed()
 
     def _get_redefine_operators( self ):
         return self._redefine_operators
@@ -261,6 +308,8 @@ class class_t( class_common_details_t
         List of strings, that contains valid C++ code, that will be added to
         the class declaration section
         """
+        if None is self._declaration_code:
+            self._declaration_code = []
         return self._declaration_code
 
     @property
@@ -269,6 +318,8 @@ class class_t( class_common_details_t
         List of strings, that contains valid C++ code, that will be added to
         the head of the class registration section
         """
+        if None is self._registration_code_head:
+            self._registration_code_head = []
         return self._registration_code_head
 
     @property
@@ -277,6 +328,8 @@ class class_t( class_common_details_t
         List of strings, that contains valid C++ code, that will be added to
         the tail of the class registration section
         """
+        if None is self._registration_code_tail:
+            self._registration_code_tail = []
         return self._registration_code_tail
 
     @property
@@ -293,6 +346,8 @@ class class_t( class_common_details_t
         List of strings, that contains valid C++ code, that will be added to
         the class wrapper.
         """
+        if None is self._wrapper_code:
+            self._wrapper_code = []
         return self._wrapper_code
 
     def _get_null_constructor_body(self):
@@ -325,11 +380,14 @@ class class_t( class_common_details_t
     @property
     def destructor_code(self):
         """list of code to be added to wrapper destructor"""
+        if None is self._destructor_code:
+            self._destructor_code = []
         return self._destructor_code
 
     def add_destructor_code(self, code):
         """adds code to the class-wrapper destructor"""
-        self._destructor_code.append( code )
+        self.destructor_code.append( code )
+        self._config_changed()
 
     @property
     def exception_argument_name( self ):
@@ -392,6 +450,7 @@ class class_t( class_common_details_t
     def add_wrapper_code( self, code ):
         """adds code to the class wrapper class definition"""
         self.wrapper_code.append( user_text.user_text_t( code ) )
+        self._config_changed()
 
     def set_constructors_body( self, body ):
         """Sets the body for all constructors"""
@@ -420,7 +479,19 @@ class class_t( class_common_details_t
         return ''
 
     def get_exportable_members( self, sort=None ):
-        """returns list of internal declarations that should\\could be exported"""
+        """returns list of internal declarations that should\\could be exported
+
+        The result is calculated again, only if :attr:`config_version` was changed.
+        """
+        if None is self._exportable_members:
+            self._exportable_members = {}
+        version, members = self._exportable_members.get( sort, ( None, None ) )
+        if version != self.config_version:
+            members = self._get_exportable_members_impl( sort )
+            self._exportable_members[ sort ] = ( self.config_version, members )
+        return members[:]
+
+    def _get_exportable_members_impl( self, sort ):
         #TODO: obviously this function should be shorter. Almost all logic of this class
         #      should be spread between decl_wrapper classes
         members = filter( lambda mv: mv.ignore == False and mv.exportable, self.public_members )
@@ -458,6 +529,8 @@ class class_t( class_common_details_t
     @property
     def properties( self ):
         """list of properties"""
+        if None is self._properties:
+            self._properties = []
         return self._properties
 
     def add_property( self, name, fget, fset=None, doc='' ):
@@ -470,7 +543,7 @@ class class_t( class_common_details_t
         :param fset: reference to the class member function, could be None
         :param doc: documentation string
         """
-        self._properties.append( properties.property_t( name, fget, fset, doc ) )
+        self.properties.append( properties.property_t( name, fget, fset, doc ) )
 
     def add_properties( self, recognizer=None, exclude_accessors=False ):
         props = properties.find_properties( self, recognizer, exclude_accessors )
@@ -478,7 +551,7 @@ class class_t( class_common_details_t
 
     def add_static_property( self, name, fget, fset=None, doc='' ):
         """adds new static property to the class"""
-        self._properties.append( properties.property_t( name, fget, fset, doc, True ) )
+        self.properties.append( properties.property_t( name, fget, fset, doc, True ) )
 
     def redefined_funcs( self ):
         """
@@ -508,57 +581,38 @@ class class_t( class_common_details_t
         if isinstance( self._redefined_funcs, list ):
             return self._redefined_funcs
 
-        all_included = declarations.custom_matcher_t( lambda decl: decl.ignore == False and decl.exportable )
-        all_protected = declarations.access_type_matcher_t( 'protected' ) & all_included
         all_pure_virtual = declarations.virtuality_type_matcher_t( VIRTUALITY_TYPES.PURE_VIRTUAL )
-        all_virtual = declarations.virtuality_type_matcher_t( VIRTUALITY_TYPES.VIRTUAL ) \
-                      & ( declarations.access_type_matcher_t( 'public' ) \
-                          | declarations.access_type_matcher_t( 'protected' ))
-        all_not_pure_virtual = ~all_pure_virtual
-
-        query = all_protected | all_pure_virtual
-        mf_query = query | all_virtual
-        relevant_opers = declarations.custom_matcher_t( lambda decl: decl.symbol in ('()', '[]') )
         funcs = []
         defined_funcs = []
 
         for base in self.recursive_bases:
             if base.access == ACCESS_TYPES.PRIVATE:
                 continue
-            base_cls = base.related_class
-
-            funcs.extend( base_cls.member_functions( mf_query, recursive=False, allow_empty=True ) )
-            funcs.extend( base_cls.member_operators( relevant_opers & query, recursive=False, allow_empty=True ) )
-
-            defined_funcs.extend( base_cls.member_functions( all_not_pure_virtual, recursive=False, allow_empty=True ) )
-            defined_funcs.extend( base_cls.member_operators( all_not_pure_virtual & relevant_opers, recursive=False, allow_empty=True ) )
+            base_funcs, base_defined_funcs = base.related_class._get_overridable_funcs()
+            funcs.extend( base_funcs )
+            defined_funcs.extend( base_defined_funcs )
 
+        this_funcs = impl_details.signatures_t( self.calldefs( recursive=False, allow_empty=True ) )
+        defined_funcs = impl_details.signatures_t( defined_funcs )
+        not_reimplemented = impl_details.signatures_t()
         not_reimplemented_funcs = set()
-        is_same_function = declarations.is_same_function
         for f in funcs:
-            cls_fs = self.calldefs( name=f.name, recursive=False, allow_empty=True )
-            for cls_f in cls_fs:
-                if is_same_function( f, cls_f ):
-                    break
-            else:
-                #should test whether this function has been added or not
-                for f_impl in not_reimplemented_funcs:
-                    if is_same_function( f, f_impl ):
-                        if declarations.is_base_and_derived( f_impl.parent, f.parent ):
-                            #add function from the most derived class
-                            not_reimplemented_funcs.remove( f_impl )
-                            not_reimplemented_funcs.add( f )
-                        break
-                else:
-                    #should test whether this function is implemented in base class
-                    if f.virtuality != VIRTUALITY_TYPES.PURE_VIRTUAL:
-                        not_reimplemented_funcs.add( f )
-                    else:
-                        for f_defined in defined_funcs:
-                            if is_same_function( f, f_defined ):
-                                break
-                        else:
-                            not_reimplemented_funcs.add( f )
+            if None is not this_funcs.find( f ):
+                continue
+            #should test whether this function has been added or not
+            f_impl = not_reimplemented.find( f )
+            if None is not f_impl:
+                if declarations.is_base_and_derived( f_impl.parent, f.parent ):
+                    #add function from the most derived class
+                    not_reimplemented_funcs.remove( f_impl )
+                    not_reimplemented.remove( f_impl )
+                    not_reimplemented_funcs.add( f )
+                    not_reimplemented.add( f )
+            #should test whether this function is implemented in base class
+            elif f.virtuality != VIRTUALITY_TYPES.PURE_VIRTUAL \
+                 or None is defined_funcs.find( f ):
+                not_reimplemented_funcs.add( f )
+                not_reimplemented.add( f )
         functions = filter( lambda f: ( False == f.ignore and True == f.exportable )
                                       or all_pure_virtual( f )
                             , list( not_reimplemented_funcs ) )
@@ -576,21 +630,19 @@ class class_t( class_common_details_t
             if f.virtuality != VIRTUALITY_TYPES.NOT_VIRTUAL:
                 return False
             #we need to check that we don't have "same" function in this class
-            this_funs = self.decls( name=f.name
-                                    , decl_type=declarations.calldef_t
-                                    , recursive=False
-                                    , allow_empty=True )
-            for this_f in this_funs:
-                if is_same_function( this_f, f ):
-                    #there is already the function in the class, so no need to redefined it
-                    return False
+            if None is not this_funcs.find( f ):
+                #there is already the function in the class, so no need to redefined it
+                return False
             else:
                 return True
 
         tmp = {} # id : f
         for redefined_f in functions:
             #redefined is virtual, I am not interested in virtual functions
-            for rfo in redefined_f.overloads:
+            overloads = redefined_f.parent.get_calldefs_groups( declarations.calldef_t )[1]
+            for rfo in overloads.get( redefined_f.name, [] ):
+                if rfo is redefined_f:
+                    continue
                 if id(rfo) in tmp:
                     continue
                 if buggy_bpl_filter( rfo ):
@@ -603,11 +655,56 @@ class class_t( class_common_details_t
         self._redefined_funcs = functions
         return self._redefined_funcs
 
+    def _get_overridable_funcs( self ):
+        """returns member functions, which could be redefined in the derived
+        classes wrappers, and member functions, which are not pure virtual.
+
+        The functions are shared by all derived classes. They are calculated
+        again, when :attr:`config_version` of the class is changed, for example
+        one of its members was excluded.
+        """
+        if None is not self._overridable_funcs \
+           and self._overridable_funcs[0] == self.config_version:
+            return self._overridable_funcs[1:]
+
+        all_included = declarations.custom_matcher_t( lambda decl: decl.ignore == False and decl.exportable )
+        all_protected = declarations.access_type_matcher_t( 'protected' ) & all_included
+        all_pure_virtual = declarations.virtuality_type_matcher_t( VIRTUALITY_TYPES.PURE_VIRTUAL )
+        all_virtual = declarations.virtuality_type_matcher_t( VIRTUALITY_TYPES.VIRTUAL ) \
+                      & ( declarations.access_type_matcher_t( 'public' ) \
+                          | declarations.access_type_matcher_t( 'protected' ))
+        all_not_pure_virtual = ~all_pure_virtual
+
+        query = all_protected | all_pure_virtual
+        mf_query = query | all_virtual
+        relevant_opers = declarations.custom_matcher_t( lambda decl: decl.symbol in ('()', '[]') )
+
+        funcs = []
+        funcs.extend( self.member_functions( mf_query, recursive=False, allow_empty=True ) )
+        funcs.extend( self.member_operators( relevant_opers & query, recursive=False, allow_empty=True ) )
+
+        defined_funcs = []
+        defined_funcs.extend( self.member_functions( all_not_pure_virtual, recursive=False, allow_empty=True ) )
+        defined_funcs.extend( self.member_operators( all_not_pure_virtual & relevant_opers, recursive=False, allow_empty=True ) )
+
+        self._overridable_funcs = ( self.config_version, funcs, defined_funcs )
+        return self._overridable_funcs[1:]
+
     def is_wrapper_needed(self):
         """returns an explanation( list of str ) why wrapper is needed.
 
-        If wrapper is not needed than [] will be returned.
+        If wrapper is not needed than [] will be returned. The explanation is
+        calculated again, only if :attr:`config_version` was changed.
         """
+        #wrapper and destructor code lists could be changed directly
+        key = ( self.config_version, len( self.wrapper_code ), len( self.destructor_code ) )
+        if None is self._wrapper_needed or self._wrapper_needed[0] != key:
+            explanation = self._is_wrapper_needed_impl()
+            key = ( self.config_version, len( self.wrapper_code ), len( self.destructor_code ) )
+            self._wrapper_needed = ( key, explanation )
+        return self._wrapper_needed[1][:]
+
+    def _is_wrapper_needed_impl( self ):
         explanation = []
         if self.wrapper_code:
             explanation.append( messages.W1020 )
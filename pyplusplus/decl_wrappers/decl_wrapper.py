@@ -23,17 +23,39 @@ class decl_wrapper_t(object):
 
     SPECIAL_TYPEDEF_PICK_ANY = True
 
+    #Default values of the configuration properties. They are defined on the
+    #class level, so the instance keeps only the values set by the user.
+    #Mutable values( lists, sets ) are created on the first access.
+    _alias = None
+    _ignore = False
+    _already_exposed = False
+    _exportable = None
+    _exportable_reason = None
+    _documentation = None
+    __msgs_to_ignore = None
+    __alias_directives = None
+    _include_files = None
+    _code_generator = None
+    _config_version = 0
+
     def __init__(self):
         object.__init__(self)
-        self._alias = None
-        self._ignore = False
-        self._already_exposed = False
-        self._exportable = None
-        self._exportable_reason = None
-        self._documentation = None
-        self.__msgs_to_ignore = set()
-        self._include_files = []
-        self._code_generator = None
+
+    @property
+    def config_version( self ):
+        """number, which is changed every time the configuration of the
+        declaration or of one of its children, relevant to the code generation,
+        is changed. It is used to invalidate the values, calculated from the
+        configuration, like :meth:`decl_wrappers.class_t.is_wrapper_needed`.
+        """
+        return self._config_version
+
+    def _config_changed( self ):
+        """changes :attr:`config_version` of the declaration and of its parents"""
+        decl = self
+        while isinstance( decl, decl_wrapper_t ):
+            decl._config_version += 1
+            decl = decl.parent
 
     @property
     def code_generator( self ):
@@ -57,24 +79,36 @@ class decl_wrapper_t(object):
             name = self.name
         return algorithm.create_valid_name( name )
 
+    def __get_alias_directives( self ):
+        """returns the alias directives of the class and the longest of them
+
+        The directives are calculated once and calculated again only if
+        the class aliases were added or removed.
+        """
+        aliases = self.aliases
+        if None is self.__alias_directives or self.__alias_directives[0] != len( aliases ):
+            typedefs = list( set( filter( lambda typedef: typedef.is_directive, aliases ) ) )
+            longest_name_len = 0
+            longest_typedef = None
+            for typedef in typedefs:
+                typedef_name_len = len( typedef.name )
+                if longest_name_len < typedef_name_len:
+                    longest_name_len = typedef_name_len
+                    longest_typedef = typedef
+            self.__alias_directives = ( len( aliases ), typedefs, longest_typedef )
+        return self.__alias_directives[1:]
+
     def __select_alias_directives( self, be_smart ):
         if not isinstance( self, declarations.class_types ):
             return []
-        typedefs = list( set( filter( lambda typedef: typedef.is_directive, self.aliases ) ) )
+        typedefs, longest_typedef = self.__get_alias_directives()
         if decl_wrapper_t.SPECIAL_TYPEDEF_PICK_ANY:
             if typedefs and be_smart:
-                longest_name_len = 0
-                longest_typedef = None
-                for typedef in typedefs:
-                    typedef_name_len = len( typedef.name )
-                    if longest_name_len < typedef_name_len:
-                        longest_name_len = typedef_name_len
-                        longest_typedef = typedef
                 return [longest_typedef]
             else:
-                return typedefs
+                return typedefs[:]
         else:
-            return typedefs
+            return typedefs[:]
 
     def _get_alias(self):
         if not self._alias:
@@ -111,6 +145,8 @@ class decl_wrapper_t(object):
     def _get_ignore( self ):
         return self._ignore
     def _set_ignore( self, value ):
+        if self._ignore != value:
+            self._config_changed()
         self._ignore = value
     ignore = property( _get_ignore, _set_ignore
                        , doc="Boolean flag, which says whether to export declaration to Python or not. Code generators: ctypes, Boost.Python" )
@@ -171,6 +207,8 @@ class decl_wrapper_t(object):
 
         This function should be use in case `Py++` made a mistake and signed the
         declaration as non-exportable."""
+        if self._exportable != exportable:
+            self._config_changed()
         self._exportable = exportable
 
     exportable = property( get_exportable, set_exportable
@@ -206,6 +244,8 @@ class decl_wrapper_t(object):
     @property
     def disabled_messages( self ):
         """list of messages to ignore"""
+        if None is self.__msgs_to_ignore:
+            self.__msgs_to_ignore = set()
         return self.__msgs_to_ignore
     disabled_messaged = disabled_messages
 
@@ -222,10 +262,12 @@ class decl_wrapper_t(object):
             msg_id = messages.find_out_message_id( msg )
             if not msg_id:
                 raise RuntimeError( "Unable to find out message id. The message is: " + msg )
-            self.__msgs_to_ignore.add( msg )
+            self.disabled_messages.add( msg )
     disable_warnings = disable_messages
 
     @property
     def include_files( self ):
         """list of header files, to be included from the file, the generated code will be placed-in"""
+        if None is self._include_files:
+            self._include_files = []
         return self._include_files
@@ -14,21 +14,24 @@ class enumeration_t(decl_wrapper.decl_wrapper_t, declarations.enumeration_t):
 
     By default, `Py++` will export all enumeration values.
     """
+
+    # A dict with new names for particular enumeration values
+    # Key: Original name as it appears in the C++ source file
+    # Value: New name as it should appear in the Python bindings
+    _value_aliases = None
+
+    # A list of enumeration names (C++ names, not aliases!) that should be
+    # exported.
+    # By default, export all values
+    _export_values = None
+
     def __init__(self, *arguments, **keywords):
         declarations.enumeration_t.__init__(self, *arguments, **keywords )
         decl_wrapper.decl_wrapper_t.__init__( self )
 
-        # A dict with new names for particular enumeration values
-        # Key: Original name as it appears in the C++ source file
-        # Value: New name as it should appear in the Python bindings
-        self._value_aliases = {}
-
-        # A list of enumeration names (C++ names, not aliases!) that should be
-        # exported.
-        # By default, export all values
-        self._export_values = None
-
     def _get_value_aliases(self):
+        if None is self._value_aliases:
+            self._value_aliases = {}
         return self._value_aliases
     def _set_value_aliases(self, value_aliases):
         self._value_aliases = value_aliases
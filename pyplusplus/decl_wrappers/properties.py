@@ -71,6 +71,15 @@ class property_recognizer_i(object):
     def create_read_only_property( sefl, fget ):
         raise NotImplementedError()
 
+    def property_name_keys( self, mem_fun, is_getter ):
+        """returns the set of keys, the accessor could be paired by, or None
+
+        :meth:`create_property` should return None for getter and setter, which
+        do not have a common key. None means, the accessor could be paired with
+        any other one.
+        """
+        return None
+
     def is_accessor( self, mem_fun ):
         if mem_fun.ignore:
             return False
@@ -182,13 +191,43 @@ class name_based_recognizer_t( property_recognizer_i ):
             gprefix = convert( gprefix )
         return ( gprefix, convert( sprefix ) )
 
-    def find_out_prefixes( self, gname, sname ):
-        convention_makers = [
-            self.make_std_convention #longest first
-          , self.make_u_camel_convention
-          , self.make_l_camel_convention ]
+    def convention_makers( self ):
+        return [ self.make_std_convention #longest first
+                 , self.make_u_camel_convention
+                 , self.make_l_camel_convention ]
+
+    def __names_rules_overridden( self ):
+        """returns True, if the names compatibility rules were redefined"""
+        for name in ( 'create_property', 'find_out_prefixes', 'check_name_compatibility' ):
+            method = getattr( self, name )
+            if getattr( method, 'im_func', None ) is not getattr( name_based_recognizer_t, name ).im_func:
+                return True
+        return False
+
+    def property_name_keys( self, mem_fun, is_getter ):
+        """returns the names, which are left after the accessor name prefix is removed
+
+        Getter and setter, which do not have a common key, are not compatible.
+        If a derived class redefines :meth:`create_property`, :meth:`find_out_prefixes`
+        or :meth:`check_name_compatibility` methods, None is returned, so
+        every getter is tried with every setter.
+        """
+        if self.__names_rules_overridden():
+            return None
+        keys = set()
+        for convention_maker in self.convention_makers():
+            for g, s in self.prefixes():
+                gc, sc = convention_maker( g, s )
+                if is_getter:
+                    prefix = gc
+                else:
+                    prefix = sc
+                if self.check_prefix( mem_fun.name, prefix ):
+                    keys.add( mem_fun.name[ len( prefix ): ] )
+        return keys
 
-        for convention_maker in convention_makers:
+    def find_out_prefixes( self, gname, sname ):
+        for convention_maker in self.convention_makers():
             for g, s in self.prefixes():
                 gc, sc = convention_maker( g, s )
                 if self.check_name_compatibility( gname, sname, gc, sc ):
@@ -196,12 +235,7 @@ class name_based_recognizer_t( property_recognizer_i ):
         return None
 
     def find_out_ro_prefixes( self, gname ):
-        convention_makers = [
-            self.make_std_convention #longest first
-          , self.make_u_camel_convention
-          , self.make_l_camel_convention ]
-
-        for convention_maker in convention_makers:
+        for convention_maker in self.convention_makers():
             for g, unused in self.prefixes():
                 if not g:
                     continue
@@ -259,6 +293,8 @@ class properties_finder_t:
         self.exclude_accessors = exclude_accessors
         self.getters, self.setters = recognizer.class_accessors( cls )
         self.inherited_getters, self.inherited_setters = recognizer.inherited_accessors( cls )
+        #alias -> declarations of the class and its base classes, calculated on demand
+        self.__alias2decls = None
 
     def __report_illegal_property( self, property_ ):
         logger = _logging_.loggers.declarations
@@ -266,36 +302,59 @@ class properties_finder_t:
             return #user disabled property warning        
         logger.warn( "%s;%s" % ( property_.fget.parent, messages.W1041 % property_ ) )
         
-    def __is_legal_property( self, property_ ):
-        """property is legal if it does not hide other declarations"""
-        def is_relevant( decl ):
+    def __get_alias2decls( self ):
+        """returns declarations of the class and its base classes, a property could hide, by alias"""
+        if None is self.__alias2decls:
             irrelevant_classes = ( declarations.constructor_t
                                    , declarations.destructor_t
                                    , declarations.typedef_t )
-                                    
-            if isinstance( decl, irrelevant_classes ):
-                return False
-            if decl.ignore:
-                return False
-            if decl.alias != property_.name:
-                return False
+            self.__alias2decls = {}
+            relevant_classes = [self.cls] + self.recognizer.base_classes( self.cls )
+            for cls in relevant_classes:
+                for decl in cls.declarations:
+                    if isinstance( decl, irrelevant_classes ):
+                        continue
+                    if decl.ignore:
+                        continue
+                    self.__alias2decls.setdefault( decl.alias, [] ).append( decl )
+        return self.__alias2decls
+
+    def __is_legal_property( self, property_ ):
+        """property is legal if it does not hide other declarations"""
+        for decl in self.__get_alias2decls().get( property_.name, [] ):
             if self.exclude_accessors \
                and ( decl is property_.fget or decl is property_.fset ):
-                return False
-            return True
+                continue
+            return False
+        return True
 
-        relevant_decls = []
-        relevant_classes = [self.cls] + self.recognizer.base_classes( self.cls )
-        for cls in relevant_classes:           
-            relevant_decls.extend( cls.decls( is_relevant, recursive=False, allow_empty=True ) )
-        return not bool( relevant_decls )
+    def __index_accessors( self, accessors, is_getter ):
+        """returns key -> accessors positions dictionary or None, if the recognizer does not define keys"""
+        key2positions = {}
+        for position, accessor in enumerate( accessors ):
+            keys = self.recognizer.property_name_keys( accessor, is_getter )
+            if None is keys:
+                return None
+            for key in keys:
+                key2positions.setdefault( key, [] ).append( position )
+        return key2positions
 
     def find_properties( self, getters, setters, used_getters, used_setters ):
         properties = []
+        key2setters = self.__index_accessors( setters, False )
         for fget in getters:
             if fget in used_getters:
                 continue
-            for fset in setters:
+            candidates = setters
+            keys = None
+            if None is not key2setters:
+                keys = self.recognizer.property_name_keys( fget, True )
+            if None is not keys:
+                positions = set()
+                for key in keys:
+                    positions.update( key2setters.get( key, [] ) )
+                candidates = [ setters[ position ] for position in sorted( positions ) ]
+            for fset in candidates:
                 if fset in used_setters:
                     continue
                 property_ = self.recognizer.create_property( fget, fset )
@@ -15,9 +15,54 @@ class scopedef_t(decl_wrapper.decl_wrapper_t):
     (not) to be exported.
     """
 
+    #declaration type -> ( calldefs, { name : calldefs } ), calculated on demand
+    _calldefs_groups = None
+
     def __init__(self):
         decl_wrapper.decl_wrapper_t.__init__( self )
 
+    def get_calldefs_groups( self, decl_type ):
+        """returns calldefs of the type, defined in the scope, and the calldefs grouped by name
+
+        The calldefs are not searched recursively and are kept in the declaration
+        order. The groups are calculated once for the scope and are reset together
+        with the query optimizer state or when the scope declarations are adopted
+        or removed, see :meth:`adopt_declaration` and :meth:`remove_declaration`.
+        The declarations count is checked too, for the declarations list changed
+        directly.
+        """
+        declarations_count = len( self.declarations )
+        if None is self._calldefs_groups or self._calldefs_groups[0] != declarations_count:
+            self._calldefs_groups = ( declarations_count, {} )
+        groups = self._calldefs_groups[1]
+        if decl_type not in groups:
+            calldefs = filter( lambda decl: isinstance( decl, decl_type ), self.declarations )
+            name2calldefs = {}
+            for calldef in calldefs:
+                name2calldefs.setdefault( calldef.name, [] ).append( calldef )
+            groups[ decl_type ] = ( calldefs, name2calldefs )
+        return groups[ decl_type ]
+
+    def adopt_declaration( self, decl, *args, **keywds ):
+        """adds the declaration to the scope, the calldefs groups are calculated again"""
+        self._calldefs_groups = None
+        super( scopedef_t, self ).adopt_declaration( decl, *args, **keywds )
+
+    def remove_declaration( self, decl ):
+        """removes the declaration from the scope, the calldefs groups are calculated again"""
+        self._calldefs_groups = None
+        super( scopedef_t, self ).remove_declaration( decl )
+
+    def clear_optimizer( self ):
+        """cleans query optimizer state and the calldefs groups"""
+        self._calldefs_groups = None
+        super( scopedef_t, self ).clear_optimizer()
+
+    def init_optimizer( self ):
+        """initializes query optimizer state, the calldefs groups are calculated again"""
+        self._calldefs_groups = None
+        super( scopedef_t, self ).init_optimizer()
+
     def exclude( self, compilation_errors=False ):
         """exclude "self" and child declarations from being exposed.
         
@@ -16,10 +16,11 @@ class typedef_t(decl_wrapper.decl_wrapper_t, declarations.typedef_t):
     future, `Py++` will generate code, that will register all those aliases.
     """
 
+    __is_directive = None
+
     def __init__(self, *arguments, **keywords):
         declarations.typedef_t.__init__(self, *arguments, **keywords )
         decl_wrapper.decl_wrapper_t.__init__( self )
-        self.__is_directive = None
 
     @property
     def is_directive( self ):
@@ -15,16 +15,18 @@ from pygccxml import declarations
 class variable_t(decl_wrapper.decl_wrapper_t, declarations.variable_t):
     """defines a set of properties, that will instruct `Py++` how to expose the variable"""
 
+    _getter_call_policies = None
+    _setter_call_policies = None
+    _call_policies_resolver = None
+    _apply_smart_ptr_wa = False
+    _is_read_only = None
+    _use_make_functions = None
+    _expose_address = None
+    _expose_value = None
+
     def __init__(self, *arguments, **keywords):
         declarations.variable_t.__init__(self, *arguments, **keywords )
         decl_wrapper.decl_wrapper_t.__init__( self )
-        self._getter_call_policies = None
-        self._setter_call_policies = None
-        self._apply_smart_ptr_wa = False
-        self._is_read_only = None
-        self._use_make_functions = None
-        self._expose_address = None
-        self._expose_value = None
 
     __call_policies_doc__ = \
     """There are usecase, when exporting member variable forces `Py++` to
@@ -36,7 +38,23 @@ class variable_t(decl_wrapper.decl_wrapper_t, declarations.variable_t):
     use this property to change it.
     """
 
+    def set_call_policies_resolver( self, resolver ):
+        """defer default getter and setter call policies calculation
+
+        The resolver will be called, when the call policies are accessed for the
+        first time.
+        """
+        self._call_policies_resolver = resolver
+
+    def __resolve_call_policies( self ):
+        if self._call_policies_resolver:
+            resolver = self._call_policies_resolver
+            self._call_policies_resolver = None
+            self._getter_call_policies = resolver( self, 'get' )
+            self._setter_call_policies = resolver( self, 'set' )
+
     def get_getter_call_policies( self ):
+        self.__resolve_call_policies()
         if None is self._getter_call_policies:
             if self.apply_smart_ptr_wa:
                 value_policy = ''
@@ -51,16 +69,19 @@ class variable_t(decl_wrapper.decl_wrapper_t, declarations.variable_t):
                 pass
         return self._getter_call_policies
     def set_getter_call_policies( self, call_policies ):
+        self.__resolve_call_policies()
         self._getter_call_policies = call_policies
     getter_call_policies = property( get_getter_call_policies, set_getter_call_policies
                                      , doc=__call_policies_doc__ )
 
     def get_setter_call_policies( self ):
+        self.__resolve_call_policies()
         if None is self._getter_call_policies:
             if self.apply_smart_ptr_wa or self.use_make_functions:
                 self._setter_call_policies = call_policies.default_call_policies()
         return self._setter_call_policies
     def set_setter_call_policies( self, call_policies ):
+        self.__resolve_call_policies()
         self._setter_call_policies = call_policies
     setter_call_policies = property( get_setter_call_policies, set_setter_call_policies
                                      , doc=__call_policies_doc__ )
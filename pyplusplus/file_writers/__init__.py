@@ -31,20 +31,20 @@ def write_file( data, file_path, encoding='ascii' ):
         sf = single_file_t( data, file_path, encoding=encoding )
         sf.write()
 
-def write_multiple_files( extmodule, dir_path, files_sum_repository=None, encoding='ascii' ):
+def write_multiple_files( extmodule, dir_path, files_sum_repository=None, encoding='ascii', jobs=1 ):
     """writes extmodule to multiple files"""
-    mfs = multiple_files_t( extmodule, dir_path, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = multiple_files_t( extmodule, dir_path, files_sum_repository=files_sum_repository, encoding=encoding, jobs=jobs )
     mfs.write()
     return mfs.written_files
 
-def write_balanced_files( extmodule, dir_path, number_of_buckets, files_sum_repository=None, encoding='ascii' ):
+def write_balanced_files( extmodule, dir_path, number_of_buckets, files_sum_repository=None, encoding='ascii', jobs=1 ):
     """writes extmodule to fixed number of multiple .cpp files"""
-    mfs = balanced_files_t( extmodule, dir_path, number_of_buckets, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = balanced_files_t( extmodule, dir_path, number_of_buckets, files_sum_repository=files_sum_repository, encoding=encoding, jobs=jobs )
     mfs.write()
     return mfs.written_files
 
-def write_class_multiple_files( extmodule, dir_path, huge_classes, files_sum_repository, encoding='ascii' ):
+def write_class_multiple_files( extmodule, dir_path, huge_classes, files_sum_repository, encoding='ascii', jobs=1 ):
     """writes extmodule to multiple files and splits huge classes to few source files"""
-    mfs = class_multiple_files_t( extmodule, dir_path, huge_classes, files_sum_repository=files_sum_repository, encoding=encoding )
+    mfs = class_multiple_files_t( extmodule, dir_path, huge_classes, files_sum_repository=files_sum_repository, encoding=encoding, jobs=jobs )
     mfs.write()
     return mfs.written_files
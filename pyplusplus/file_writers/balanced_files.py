@@ -30,7 +30,8 @@ class balanced_files_t(multiple_files.multiple_files_t):
                   , number_of_buckets
                   , write_main=True
                   , files_sum_repository=None
-                  , encoding='ascii'):
+                  , encoding='ascii'
+                  , jobs=1):
         """Constructor.
 
         :param extmodule: The root of a code creator tree
@@ -41,8 +42,11 @@ class balanced_files_t(multiple_files.multiple_files_t):
         :param write_main:  if it is True, the class will write out a main file
             that calls all the registration methods.
         :type write_main: boolean
+
+        :param jobs: number of processes, which render the classes source files
+        :type jobs: int
         """
-        multiple_files.multiple_files_t.__init__( self, extmodule, directory_path, write_main, files_sum_repository, encoding)
+        multiple_files.multiple_files_t.__init__( self, extmodule, directory_path, write_main, files_sum_repository, encoding, jobs)
         self.number_of_buckets = number_of_buckets
 
     def split_classes( self ):
@@ -57,6 +61,10 @@ class balanced_files_t(multiple_files.multiple_files_t):
             buckets[len(buckets)-2] += buckets[len(buckets)-1]
             buckets = buckets[:len(buckets)-1]
 
+        self.prerender_sources( [ ( self.extmodule.body.name + '_classes_%d' % (index+1)
+                                    , 'register_classes_%d' % (index+1)
+                                    , bucket )
+                                  for index, bucket in enumerate( buckets ) if bucket ] )
         for index, bucket in enumerate( buckets ):
             self.split_creators( bucket
                                  , '_classes_%d' % (index+1)
@@ -39,12 +39,14 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
                   , huge_classes
                   , num_of_functions_per_file=20
                   , files_sum_repository=None
-                  , encoding='ascii'):
+                  , encoding='ascii'
+                  , jobs=1):
         multiple_files.multiple_files_t.__init__(self
                                                  , extmodule
                                                  , directory_path
                                                  , files_sum_repository=files_sum_repository
-                                                 , encoding=encoding)
+                                                 , encoding=encoding
+                                                 , jobs=jobs)
         self.huge_classes = huge_classes
         self.num_of_functions_per_file = num_of_functions_per_file
         self.internal_splitters = [
@@ -79,8 +81,8 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
         answer.append( self.create_namespaces_code( creators ) )
 
         if class_creator.wrapper:
-            answer.append( class_creator.wrapper.create() )
-            class_creator.wrapper.create = lambda: ''
+            answer.append( self.render( class_creator.wrapper ) )
+            class_creator.wrapper.replace_code( '' )
 
         answer.append( '' )
         answer.append( class_creator.create_typedef_code() )
@@ -127,7 +129,7 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
                 source_code.append( '' )
                 source_code.append( decl_creator.create() )
                 if not isinstance( decl_creator, self.ref_count_creators ):
-                    decl_creator.create = lambda: ''
+                    decl_creator.replace_code( '' )
 
         # Write the register() function...
         source_code.append( '' )
@@ -137,9 +139,9 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
             source_code.append( code_creators.code_creator_t.indent( creator.create() ) )
             source_code.append( '' )
             if 0 == index:
-                creator.create = lambda: function_name + '(%s);' % class_creator.class_var_name
+                creator.replace_code( function_name + '(%s);' % class_creator.class_var_name )
             else:
-                creator.create = lambda: ''
+                creator.replace_code( '' )
         source_code.append( '}' )
         self.write_file( file_path + self.SOURCE_EXT, os.linesep.join( source_code ) )
 
@@ -207,6 +209,11 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
         self.split_internal_creators( class_creator, creators, 'memvars' )
         return 'memvars'
 
+    def get_class_source( self, class_creator ):
+        if class_creator.declaration in self.huge_classes:
+            return None #huge classes are written to few files
+        return super( class_multiple_files_t, self ).get_class_source( class_creator )
+
     def split_class_impl( self, class_creator):
         if not class_creator.declaration in self.huge_classes:
             return super( class_multiple_files_t, self ).split_class_impl( class_creator )
@@ -246,22 +253,22 @@ class class_multiple_files_t(multiple_files.multiple_files_t):
 
         for creator in class_creator.associated_decl_creators:
             source_code.append( '' )
-            source_code.append( creator.create() )
+            source_code.append( self.render( creator ) )
             if not isinstance( creator, self.ref_count_creators ):
-                creator.create = lambda: ''
+                creator.replace_code( '' )
 
         # Write the register() function...
         source_code.append( '' )
         source_code.append( 'void %s(){' % function_name )
         source_code.append( '' )
-        source_code.append( class_creator.create() )
+        source_code.append( self.render( class_creator ) )
         source_code.append( '' )
         source_code.append( '}' )
         self.write_file( file_path + self.SOURCE_EXT, os.linesep.join( source_code ) )
 
-        # Replace the create() method so that only the register() method is called
+        # Replace the code of the creator so that only the register() method is called
         # (this is called later for the main source file).
-        class_creator.create = lambda: function_name +'();'
+        class_creator.replace_code( function_name +'();' )
         self.include_creators.append( code_creators.include_t( header_name ) )
         self.split_header_names.append(header_name)
         self.split_method_names.append(function_name)
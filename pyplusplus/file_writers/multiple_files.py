@@ -7,6 +7,7 @@
 
 import os
 import writer
+import parallel_renderer
 from pyplusplus import messages
 from pyplusplus import _logging_
 from pygccxml import declarations
@@ -22,7 +23,7 @@ class multiple_files_t(writer.writer_t):
     HEADER_EXT = '.pypp.hpp'
     SOURCE_EXT = '.pypp.cpp'
 
-    def __init__(self, extmodule, directory_path, write_main=True, files_sum_repository=None, encoding='ascii'):
+    def __init__(self, extmodule, directory_path, write_main=True, files_sum_repository=None, encoding='ascii', jobs=1):
         """
         :param extmodule: code creators tree root
         :type extmodule: :class:`code_creators.bpmodule_t`
@@ -30,6 +31,10 @@ class multiple_files_t(writer.writer_t):
         :type directory_path: str
         :param write_main:  if True, the class will write out a main file that calls all the registration methods.
         :type write_main: boolean
+        :param jobs: number of processes, which render the classes source files.
+                     The processes are forked, so the option is ignored on the
+                     platforms without "fork".
+        :type jobs: int
         """
         writer.writer_t.__init__( self, extmodule, files_sum_repository, encoding=encoding )
         self.__directory_path = directory_path
@@ -45,6 +50,9 @@ class multiple_files_t(writer.writer_t):
                       , self.extmodule.creators )
         self.__value_traits = filter( lambda x: isinstance(x, code_creators.value_traits_t)
                                       , self.extmodule.creators )
+        self.jobs = jobs
+        #( file name, function name ) -> ( creators, their replaced code, source code )
+        self.__rendered_sources = {}
 
 
     def write_file( self, fpath, content ):
@@ -210,10 +218,20 @@ class multiple_files_t(writer.writer_t):
         else:
             return os.linesep.join( map( lambda creator: creator.create(), ns_creators ) )
 
+    def get_declaration_creators( self, registration_creators ):
+        """returns unique declaration code creators, the registration creators depend on"""
+        declaration_creators = []
+        for rc in registration_creators:
+            declaration_creators.extend( self.associated_decl_creators( rc ) )
+        return self.get_unique_creators( declaration_creators )
+
     def create_source( self, file_name, function_name, registration_creators ):
         """
         return the content of a cpp file.
 
+        The declaration code creators, written to the file, are not written
+        to other files.
+
         :param file_name: The base name of the corresponding include file (without extension)
         :type file_name: str
 
@@ -224,11 +242,25 @@ class multiple_files_t(writer.writer_t):
         :type creators: list of :class:`code_creators.code_creator_t`
         :rtype: str
         """
-        declaration_creators = []
-        for rc in registration_creators:
-            declaration_creators.extend( self.associated_decl_creators( rc ) )
-        declaration_creators = self.get_unique_creators( declaration_creators )
+        declaration_creators = self.get_declaration_creators( registration_creators )
+        source = self.__take_rendered_source( file_name
+                                              , function_name
+                                              , registration_creators + declaration_creators )
+        if None is source:
+            source = self.render_source( file_name, function_name, registration_creators, declaration_creators )
+        for creator in declaration_creators:
+            if not isinstance( creator, self.ref_count_creators ):
+                creator.replace_code( '' )
+        return source
+
+    def render_source( self, file_name, function_name, registration_creators, declaration_creators, skipped=None ):
+        """
+        return the content of a cpp file, without changing the code creators.
 
+        :param skipped: ids of the declaration code creators, which were
+                        written to other files
+        :type skipped: set
+        """
         creators = registration_creators + declaration_creators
 
         answer = []
@@ -244,9 +276,10 @@ class multiple_files_t(writer.writer_t):
         # Write wrapper classes...
         for creator in declaration_creators:
             answer.append( '' )
-            answer.append( creator.create() )
-            if not isinstance( creator, self.ref_count_creators ):
-                creator.create = lambda: ''
+            if skipped and id( creator ) in skipped:
+                answer.append( '' )
+            else:
+                answer.append( self.render( creator ) )
 
         # Write the register() function...
         answer.append( '' )
@@ -258,6 +291,56 @@ class multiple_files_t(writer.writer_t):
         answer.append( '}' )
         return os.linesep.join( answer )
 
+    def prerender_sources( self, sources ):
+        """renders the content of the cpp files, using :attr:`jobs` processes
+
+        The files are planned in the order they will be written, so every
+        declaration code creator is rendered in the first file, which uses it,
+        same as :meth:`create_source` does. :meth:`create_source` takes the
+        rendered content, only if the code creators were not changed since.
+
+        :param sources: list of :meth:`create_source` arguments tuples
+        """
+        if self.jobs < 2 or len( sources ) < 2 or not parallel_renderer.is_supported():
+            return
+        consumed = set()
+        tasks = []
+        states = []
+        for file_name, function_name, registration_creators in sources:
+            declaration_creators = self.get_declaration_creators( registration_creators )
+            skipped = set( [ id( creator ) for creator in declaration_creators
+                             if id( creator ) in consumed ] )
+            tasks.append( ( file_name, function_name, registration_creators, declaration_creators, skipped ) )
+            creators = registration_creators + declaration_creators
+            state = []
+            for creator in creators:
+                if id( creator ) in skipped:
+                    state.append( '' )
+                else:
+                    state.append( creator.replaced_code )
+            states.append( ( creators, state ) )
+            consumed.update( [ id( creator ) for creator in declaration_creators
+                               if not isinstance( creator, self.ref_count_creators ) ] )
+        codes = parallel_renderer.render_sources( self, tasks, self.jobs )
+        for task, ( creators, state ), code in zip( tasks, states, codes ):
+            self.__rendered_sources[ ( task[0], task[1] ) ] = ( creators, state, code )
+
+    def __take_rendered_source( self, file_name, function_name, creators ):
+        rendered = self.__rendered_sources.pop( ( file_name, function_name ), None )
+        if None is rendered:
+            return None
+        rendered_creators, state, code = rendered
+        if map( id, rendered_creators ) != map( id, creators ) \
+           or state != [ creator.replaced_code for creator in creators ]:
+            return None
+        return code
+
+    def get_class_source( self, class_creator ):
+        """returns :meth:`create_source` arguments, the class source file is created with, or None"""
+        if class_creator.declaration.already_exposed:
+            return None
+        return ( class_creator.alias, 'register_%s_class' % class_creator.alias, [ class_creator ] )
+
     def split_class_impl( self, class_creator):
         function_name = 'register_%s_class' % class_creator.alias
         file_path = os.path.join( self.directory_path, class_creator.alias )
@@ -272,9 +355,9 @@ class multiple_files_t(writer.writer_t):
 
         self.write_file( file_path + self.SOURCE_EXT, cpp_code )
 
-        # Replace the create() method so that only the register() method is called
+        # Replace the code of the creator so that only the register() method is called
         # (this is called later for the main source file).
-        class_creator.create = lambda: function_name +'();'
+        class_creator.replace_code( function_name +'();' )
         self.include_creators.append( code_creators.include_t( header_name ) )
         self.split_header_names.append(header_name)
         self.split_method_names.append(function_name)
@@ -303,6 +386,7 @@ class multiple_files_t(writer.writer_t):
         # Obtain a list of all class creators...
         class_creators = filter( lambda x: isinstance(x, ( code_creators.class_t, code_creators.class_declaration_t ) )
                                  , self.extmodule.body.creators )
+        self.prerender_sources( filter( None, map( self.get_class_source, class_creators ) ) )
         # ...and write a .h/.cpp file for each class
         map( self.split_class, class_creators )
 
@@ -322,7 +406,7 @@ class multiple_files_t(writer.writer_t):
         self.write_file( file_path
                         , self.create_header( header_name.replace( '.', '_' )
                                               , value_traits.create() ) )
-        value_traits.create = lambda: ''
+        value_traits.replace_code( '' )
 
     def split_values_traits( self ):
         map( self.split_value_traits, self.__value_traits )
@@ -353,7 +437,7 @@ class multiple_files_t(writer.writer_t):
                          , self.create_source( file_pattern, function_name, creators ))
 
         for creator in creators:
-            creator.create = lambda: ''
+            creator.replace_code( '' )
         self.extmodule.body.adopt_creator(
             code_creators.custom_text_t( function_name + '();' )
             , registrator_pos)
@@ -402,16 +486,20 @@ class multiple_files_t(writer.writer_t):
 
         self.extmodule.do_include_dirs_optimization()
 
-        self.split_values_traits()
-        self.split_classes()
-        self.split_enums()
-        self.split_global_variables()
-        self.split_free_functions()
-
-        if self.write_main:
-            self.include_creators.sort( cmp=lambda ic1, ic2: cmp( ic1.header, ic2.header ) )
-            map( lambda creator: self.extmodule.adopt_include( creator )
-                 , self.include_creators )
-            main_cpp = os.path.join( self.directory_path, self.extmodule.body.name + '.main.cpp' )
-            self.write_file( main_cpp, self.extmodule.create() + os.linesep )
+        code_creators.code_creator_t.begin_code_caching()
+        try:
+            self.split_values_traits()
+            self.split_classes()
+            self.split_enums()
+            self.split_global_variables()
+            self.split_free_functions()
+
+            if self.write_main:
+                self.include_creators.sort( cmp=lambda ic1, ic2: cmp( ic1.header, ic2.header ) )
+                map( lambda creator: self.extmodule.adopt_include( creator )
+                     , self.include_creators )
+                main_cpp = os.path.join( self.directory_path, self.extmodule.body.name + '.main.cpp' )
+                self.write_file( main_cpp, self.render( self.extmodule ) + os.linesep )
+        finally:
+            code_creators.code_creator_t.end_code_caching()
         self.files_sum_repository.save_values()
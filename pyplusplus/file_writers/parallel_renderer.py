@@ -0,0 +1,55 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines functionality, which renders the source files content in parallel
+
+The pool of processes is created by "fork", after the code creators tree was
+built, so the processes inherit the tree and the declarations tree and only the
+rendered code is passed back to the main process. The results are returned in
+the order of the tasks, so the files are written in the same order and with the
+same content as without the pool.
+"""
+
+import os
+import time
+import multiprocessing
+from pyplusplus import _logging_
+
+def is_supported():
+    """returns True, if the pool processes could inherit the code creators tree"""
+    return hasattr( os, 'fork' )
+
+#the writer and the tasks. Pool processes, created by "fork", inherit them
+_writer = None
+_tasks = None
+
+def _render_source( index ):
+    return _writer.render_source( *_tasks[ index ] )
+
+def render_sources( writer, tasks, jobs ):
+    """renders the source files content, using pool of `jobs` processes
+
+    Every task is a tuple of :meth:`file_writers.multiple_files_t.render_source`
+    method arguments. Returns list of the rendered code, in the order of the tasks.
+    """
+    global _writer, _tasks
+    logger = _logging_.loggers.file_writer
+    start_time = time.clock()
+    logger.debug( 'rendering %d files using %d processes - started' % ( len( tasks ), jobs ) )
+    _writer = writer
+    _tasks = tasks
+    try:
+        pool = multiprocessing.Pool( jobs )
+        try:
+            codes = pool.map( _render_source, range( len( tasks ) ) )
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _writer = None
+        _tasks = None
+    logger.debug( 'rendering %d files using %d processes - done( %f seconds )'
+                  % ( len( tasks ), jobs, time.clock() - start_time ) )
+    return codes
@@ -7,6 +7,7 @@
 
 import os
 import writer
+from pyplusplus import code_creators
 
 class single_file_t(writer.writer_t):
     """generates all code into single cpp file"""
@@ -29,5 +30,9 @@ class single_file_t(writer.writer_t):
         map( lambda header: self.extmodule.add_include( header )
              , headers )
         self.write_code_repository( target_dir )
-        self.write_file( self.file_name, self.extmodule.create(), encoding=self.encoding )
+        code_creators.code_creator_t.begin_code_caching()
+        try:
+            self.write_file( self.file_name, self.render( self.extmodule ), encoding=self.encoding )
+        finally:
+            code_creators.code_creator_t.end_code_caching()
         self.save_exposed_decls_db( target_dir )
@@ -154,6 +154,13 @@ class writer_t(object):
             files_sum_repository.update_value( fname, new_hash_value )
         writer_t.logger.info( 'file "%s" - updated( %f seconds )' % ( fname, time.clock() - start_time ) )
 
+    @staticmethod
+    def render( creator ):
+        """returns the code of the creator, rendered to :class:`code_creators.sink_t`"""
+        sink = code_creators.sink_t()
+        creator.render( sink )
+        return sink.getvalue()
+
     def get_user_headers( self, creators ):
         headers = []
         creators = filter( lambda creator: isinstance( creator, code_creators.declaration_based_t )
@@ -9,6 +9,8 @@ This package provides simple and convenient interface to `Py++` functionality.
 
 from boost_python_builder import builder_t as module_builder_t
 from ctypes_builder import ctypes_module_builder_t
+from rules_set import rule_t
+from rules_set import rules_set_t
 
 #aliases for functionality located in pygccxml.parser module
 from pygccxml.parser import COMPILATION_MODE
@@ -9,6 +9,8 @@ import time
 import types
 import warnings
 import module_builder
+import decls_snapshot
+import parallel_reader
 
 from pygccxml import parser
 from pygccxml import utils as pygccxml_utils
@@ -44,7 +46,9 @@ class builder_t(module_builder.module_builder_t):
                   , cflags=""
                   , encoding='ascii'
                   , compiler=None
-                  , gccxml_config=None):
+                  , gccxml_config=None
+                  , snapshot=None
+                  , jobs=1):
         """
         :param files: list of files, declarations from them you want to export
         :type files: list of strings or :class:`parser.file_configuration_t` instances
@@ -68,6 +72,23 @@ class builder_t(module_builder.module_builder_t):
         :param gccxml_config: instance of pygccxml.parser.config_t class, holds
                               gccxml( compiler ) configuration. You can use this
                               argument instead of passing the compiler configuration separately.
+
+        :param snapshot: path to the file, which keeps the declarations tree, after
+                         defaults were applied. If the input files, the configuration
+                         and the included files were not changed, the tree will
+                         be loaded from the file, instead of running GCC-XML.
+                         Otherwise, unless `cache` was given, the per file
+                         declarations cache, kept near the snapshot, is used,
+                         so GCC-XML runs only on the files, which include changed headers.
+        :type snapshot: str
+
+        :param jobs: number of processes, which will run GCC-XML. It is taken into
+                     account only in `COMPILATION_MODE.FILE_BY_FILE` mode. The
+                     files, found in the declarations cache, are not parsed by
+                     the processes. On Windows, the script, which creates the
+                     builder, should be protected by `if __name__ == '__main__'`
+                     condition.
+        :type jobs: int
         """
         module_builder.module_builder_t.__init__( self, global_ns=None, encoding=encoding )
 
@@ -88,11 +109,35 @@ class builder_t(module_builder.module_builder_t):
         tmp = map( lambda file_: os.path.split( file_ )[0], self.__parsed_files )
         self.__parsed_dirs = filter( None, tmp )
 
-        self.global_ns = self.__parse_declarations( files
-                                                    , gccxml_config
-                                                    , compilation_mode
-                                                    , cache
-                                                    , indexing_suite_version)
+        global_ns = None
+        if snapshot:
+            snapshot = decls_snapshot.snapshot_t( snapshot )
+            snapshot_key = decls_snapshot.create_key( files
+                                                      , gccxml_config
+                                                      , compilation_mode
+                                                      , indexing_suite_version
+                                                      , self.__parsed_files )
+            self.stats.start( 'snapshot_loading' )
+            global_ns = snapshot.load( snapshot_key )
+            self.stats.stop( 'snapshot_loading', int( None is not global_ns ) )
+            if None is global_ns and None is cache:
+                cache = snapshot.create_files_cache()
+        if None is global_ns:
+            global_ns = self.__parse_declarations( files
+                                                   , gccxml_config
+                                                   , compilation_mode
+                                                   , cache
+                                                   , indexing_suite_version
+                                                   , jobs)
+            if snapshot:
+                self.stats.start( 'snapshot_saving' )
+                snapshot.dump( snapshot_key, global_ns )
+                self.stats.stop( 'snapshot_saving', 1 )
+        #identifies the declarations tree, if it was loaded from or stored in the snapshot
+        self.__decls_digest = None
+        if snapshot:
+            self.__decls_digest = snapshot.digest
+        self.global_ns = global_ns
         self.global_ns.decls(recursive=True, allow_empty=True)._code_generator = decl_wrappers.CODE_GENERATOR_TYPES.CTYPES
 
         self.__code_creator = None
@@ -107,6 +152,15 @@ class builder_t(module_builder.module_builder_t):
 
 
 
+    @property
+    def decls_digest( self ):
+        """digest, which identifies the declarations tree, or None
+
+        It is available, if the declarations tree was loaded from or stored in
+        the snapshot.
+        """
+        return self.__decls_digest
+
     def register_module_dependency( self, other_module_generated_code_dir ):
         """
         `already_exposed` solution is pretty good when you mix hand-written
@@ -127,15 +181,19 @@ class builder_t(module_builder.module_builder_t):
         db.update_decls( self.global_ns )
 
 
-    def __parse_declarations( self, files, gccxml_config, compilation_mode, cache, indexing_suite_version ):
+    def __parse_declarations( self, files, gccxml_config, compilation_mode, cache, indexing_suite_version, jobs=1 ):
         if None is gccxml_config:
             gccxml_config = parser.config_t()
         if None is compilation_mode:
             compilation_mode = parser.COMPILATION_MODE.FILE_BY_FILE
+        self.stats.start( 'parsing' )
+        if 1 < jobs and parser.COMPILATION_MODE.FILE_BY_FILE == compilation_mode:
+            cache = parallel_reader.read_files( files, gccxml_config, jobs, cache )
         start_time = time.clock()
         self.logger.debug( 'parsing files - started' )
         reader = parser.project_reader_t( gccxml_config, cache, decl_wrappers.dwfactory_t() )
         decls = reader.read_files( files, compilation_mode )
+        self.stats.stop( 'parsing', len( files ) )
 
         self.logger.debug( 'parsing files - done( %f seconds )' % ( time.clock() - start_time ) )
         self.logger.debug( 'settings declarations defaults - started' )
@@ -156,37 +214,28 @@ class builder_t(module_builder.module_builder_t):
         return global_ns
 
     def __filter_by_location( self, flatten_decls ):
+        parsed_locations = utils.path_index_t( self.__parsed_files
+                                               , self.__parsed_dirs
+                                               , pygccxml_utils.normalize_path )
         for decl in flatten_decls:
             if not decl.location:
                 continue
-            fpath = pygccxml_utils.normalize_path( decl.location.file_name )
-            if pygccxml_utils.contains_parent_dir( fpath, self.__parsed_dirs ):
-                continue
-            if fpath in self.__parsed_files:
-                continue
-            found = False
-            for pfile in self.__parsed_files:
-                if fpath.endswith( pfile ):
-                    found = True
-                    break
-            if not found:
+            if decl.location.file_name not in parsed_locations:
                 decl.exclude()
 
     def __apply_decls_defaults(self, decls):
+        self.stats.start( 'defaults' )
         flatten_decls = decls_package.make_flatten( decls )
         self.__filter_by_location( flatten_decls )
+        #call policies are calculated on demand, most of declarations are excluded
         call_policies_resolver = creators_factory.built_in_resolver_t()
-        calldefs = filter( lambda decl: isinstance( decl, decls_package.calldef_t )
-                           , flatten_decls )
-        map( lambda calldef: calldef.set_call_policies( call_policies_resolver( calldef ) )
-             , calldefs )
-        mem_vars = filter( lambda decl: isinstance( decl, decls_package.variable_t )
-                                        and isinstance( decl.parent, decls_package.class_t )
-                           , flatten_decls )
-        map( lambda mem_var: mem_var.set_getter_call_policies( call_policies_resolver( mem_var, 'get' ) )
-             , mem_vars )
-        map( lambda mem_var: mem_var.set_setter_call_policies( call_policies_resolver( mem_var, 'set' ) )
-             , mem_vars )
+        for decl in flatten_decls:
+            if isinstance( decl, decls_package.calldef_t ):
+                decl.set_call_policies_resolver( call_policies_resolver )
+            elif isinstance( decl, decls_package.variable_t ) \
+                 and isinstance( decl.parent, decls_package.class_t ):
+                decl.set_call_policies_resolver( call_policies_resolver )
+        self.stats.stop( 'defaults', len( flatten_decls ) )
 
     @property
     def declarations_code_head( self ):
@@ -215,7 +264,10 @@ class builder_t(module_builder.module_builder_t):
                        , types_db=None
                        , target_configuration=None
                        , enable_indexing_suite=True
-                       , doc_extractor=None):
+                       , doc_extractor=None
+                       , used_smart_ptr_converters_only=False
+                       , readme_report_file=None
+                       , jobs=1):
         """
         Creates :class:`code_creators.bpmodule_t` code creator.
 
@@ -230,6 +282,20 @@ class builder_t(module_builder.module_builder_t):
 
         :param doc_extractor: callable, that takes as argument reference to declaration and returns documentation string
         :type doc_extractor: callable or None
+
+        :param used_smart_ptr_converters_only: if True, smart pointer converters are created only between the classes, which smart pointers are used in the exposed declarations
+        :type used_smart_ptr_converters_only: bool
+
+        :param readme_report_file: the file, the declarations diagnostics are stored in.
+                                   If the declarations tree was loaded from or stored in
+                                   the snapshot and the declarations settings were not
+                                   changed, the stored diagnostics are reported,
+                                   instead of calculating them again.
+        :type readme_report_file: str
+
+        :param jobs: number of processes, which calculate the declarations diagnostics.
+                     The processes are created by "fork", so the pool is not used on Windows.
+        :type jobs: int
         """
 
         creator = creators_factory.bpcreator_t( self.global_ns
@@ -238,7 +304,12 @@ class builder_t(module_builder.module_builder_t):
                                                 , call_policies_resolver_
                                                 , types_db
                                                 , target_configuration
-                                                , enable_indexing_suite )
+                                                , enable_indexing_suite
+                                                , stats=self.stats
+                                                , used_smart_ptr_converters_only=used_smart_ptr_converters_only
+                                                , readme_report_file=readme_report_file
+                                                , decls_digest=self.__decls_digest
+                                                , jobs=jobs )
         self.__code_creator = creator.create()
         self.__code_creator.replace_included_headers(self.__parsed_files)
         self.__code_creator.update_documentation( doc_extractor )
@@ -323,7 +394,9 @@ class builder_t(module_builder.module_builder_t):
 
         """
         self.__merge_user_code()
+        self.stats.start( 'writing' )
         file_writers.write_file( self.code_creator, file_name, encoding=self.encoding )
+        self.stats.stop( 'writing', 1 )
 
     def __work_on_unused_files( self, dir_name, written_files, on_unused_file_found ):
         all_files = os.listdir( dir_name )
@@ -343,7 +416,8 @@ class builder_t(module_builder.module_builder_t):
                       , dir_name
                       , huge_classes=None
                       , on_unused_file_found=os.remove
-                      , use_files_sum_repository=False):
+                      , use_files_sum_repository=False
+                      , jobs=1):
         """
         writes module to multiple files
 
@@ -358,6 +432,11 @@ class builder_t(module_builder.module_builder_t):
         :param use_files_sum_repository: `Py++` can generate file, which will contain `md5` sum of every generated file.
                                           Next time you generate code, md5sum will be loaded from the file and compared.
                                           This could speed-up code generation process by 10-15%.
+
+        :param jobs: number of processes, which render the classes source files.
+                     The processes are forked, so the option is ignored on the
+                     platforms without "fork".
+        :type jobs: int
         """
         self.__merge_user_code()
 
@@ -366,20 +445,24 @@ class builder_t(module_builder.module_builder_t):
             cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
             files_sum_repository = file_writers.cached_repository_t( cache_file )
 
+        self.stats.start( 'writing' )
         written_files = []
         if None is huge_classes:
             written_files = file_writers.write_multiple_files(
                                 self.code_creator
                                 , dir_name
                                 , files_sum_repository=files_sum_repository
-                                , encoding=self.encoding)
+                                , encoding=self.encoding
+                                , jobs=jobs)
         else:
             written_files = file_writers.write_class_multiple_files(
                                 self.code_creator
                                 , dir_name
                                 , huge_classes
                                 , files_sum_repository=files_sum_repository
-                                , encoding=self.encoding)
+                                , encoding=self.encoding
+                                , jobs=jobs)
+        self.stats.stop( 'writing', len( written_files ) )
         self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
 
         return written_files
@@ -388,7 +471,8 @@ class builder_t(module_builder.module_builder_t):
                                , dir_name
                                , number_of_files
                                , on_unused_file_found=os.remove
-                               , use_files_sum_repository=False):
+                               , use_files_sum_repository=False
+                               , jobs=1):
         """
         Writes module to fixed number of multiple cpp files
 
@@ -404,6 +488,9 @@ class builder_t(module_builder.module_builder_t):
         :param use_files_sum_repository: `Py++` can generate file, which will contain md5 sum of every generated file.
                                           Next time you generate code, md5sum will be loaded from the file and compared.
                                           This could speed-up code generation process by 10-15%.
+
+        :param jobs: number of processes, which render the classes source files
+        :type jobs: int
         """
         self.__merge_user_code()
 
@@ -412,11 +499,14 @@ class builder_t(module_builder.module_builder_t):
             cache_file = os.path.join( dir_name, self.code_creator.body.name + '.md5.sum' )
             files_sum_repository = file_writers.cached_repository_t( cache_file )
 
+        self.stats.start( 'writing' )
         written_files = file_writers.write_balanced_files( self.code_creator
                                                            , dir_name
                                                            , number_of_buckets=number_of_files
                                                            , files_sum_repository=files_sum_repository
-                                                           , encoding=self.encoding)
+                                                           , encoding=self.encoding
+                                                           , jobs=jobs)
+        self.stats.stop( 'writing', len( written_files ) )
 
         self.__work_on_unused_files( dir_name, written_files, on_unused_file_found )
 
@@ -59,8 +59,10 @@ class ctypes_module_builder_t(module_builder.module_builder_t):
             compilation_mode = parser.COMPILATION_MODE.FILE_BY_FILE
         start_time = time.clock()
         self.logger.debug( 'parsing files - started' )
+        self.stats.start( 'parsing' )
         reader = parser.project_reader_t( gccxml_config, cache, decl_wrappers.dwfactory_t() )
         decls = reader.read_files( files, compilation_mode )
+        self.stats.stop( 'parsing', len( files ) )
 
         self.logger.debug( 'parsing files - done( %f seconds )' % ( time.clock() - start_time ) )
 
@@ -153,6 +155,8 @@ class ctypes_module_builder_t(module_builder.module_builder_t):
 
         """
         self.__merge_user_code()
+        self.stats.start( 'writing' )
         file_writers.write_file( self.code_creator, file_name, encoding=self.encoding )
+        self.stats.stop( 'writing', 1 )
 
 
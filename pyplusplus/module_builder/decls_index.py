@@ -0,0 +1,142 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which speeds-up declarations queries, restricted to header file or directory"""
+
+import os
+import re
+
+from pygccxml import declarations
+
+class decls_index_t( object ):
+    """index of declarations by header file, header directory, name and type
+
+    The index is used to answer the queries with `header_dir` or `header_file`
+    arguments. It selects the candidates: declarations defined in the files
+    with the same base name or within the directories with the same name,
+    declarations without location. Later, the candidates are checked by the
+    same pygccxml matcher, the query would be evaluated with, so the result
+    does not depend on the index. The declarations are returned in the order
+    of the declarations tree traversal.
+
+    The index does not track declarations, added to or removed from the tree
+    after it was built.
+    """
+
+    __identifier = re.compile( r'^[A-Za-z_]\w*$' )
+
+    def __init__( self, global_ns ):
+        object.__init__( self )
+        self.__decls = []
+        #normalized file name or None -> { name : [ positions ] }
+        self.__file2name2positions = {}
+        #normalized file name or None -> { declaration class : [ positions ] }
+        self.__file2type2positions = {}
+        self.__basename2files = {}
+        self.__dir2files = {}
+        self.__dir_name2files = {}
+        normalized = {}
+        for decl in declarations.make_flatten( global_ns ):
+            if decl is global_ns:
+                continue
+            position = len( self.__decls )
+            self.__decls.append( decl )
+            file_ = None
+            if decl.location:
+                file_name = decl.location.file_name
+                if file_name not in normalized:
+                    normalized[ file_name ] = self.__register_file( file_name )
+                file_ = normalized[ file_name ]
+            name2positions = self.__file2name2positions.setdefault( file_, {} )
+            name2positions.setdefault( decl.name, [] ).append( position )
+            partial_name = decl.partial_name
+            if partial_name != decl.name:
+                name2positions.setdefault( partial_name, [] ).append( position )
+            type2positions = self.__file2type2positions.setdefault( file_, {} )
+            type2positions.setdefault( decl.__class__, [] ).append( position )
+
+    @staticmethod
+    def __normalize( path ):
+        return os.path.normcase( os.path.normpath( os.path.abspath( path ) ) )
+
+    def __register_file( self, file_name ):
+        file_ = self.__normalize( file_name )
+        self.__basename2files.setdefault( os.path.basename( file_ ), set() ).add( file_ )
+        self.__dir2files.setdefault( os.path.dirname( file_ ), set() ).add( file_ )
+        return file_
+
+    def __find_files_by_dir( self, header_dir ):
+        dir_name = os.path.basename( self.__normalize( header_dir ).rstrip( os.sep ) )
+        if dir_name not in self.__dir_name2files:
+            files = set()
+            for dir_, dir_files in self.__dir2files.iteritems():
+                if dir_name in dir_:
+                    files.update( dir_files )
+            self.__dir_name2files[ dir_name ] = files
+        return self.__dir_name2files[ dir_name ]
+
+    def __find_files( self, header_dir, header_file ):
+        files = None
+        if header_file:
+            files = self.__basename2files.get( os.path.basename( self.__normalize( header_file ) ), set() )
+        if header_dir:
+            dir_files = self.__find_files_by_dir( header_dir )
+            if None is files:
+                files = dir_files
+            else:
+                files = files.intersection( dir_files )
+        #declarations without location are not filtered by pygccxml matchers
+        return [ None ] + list( files )
+
+    def __find_positions( self, file_, name, decl_type ):
+        if isinstance( name, str ) and self.__identifier.match( name ):
+            return self.__file2name2positions.get( file_, {} ).get( name, [] )
+        positions = []
+        for type_, type_positions in self.__file2type2positions.get( file_, {} ).iteritems():
+            if None is decl_type or issubclass( type_, decl_type ):
+                positions.extend( type_positions )
+        return positions
+
+    def candidates( self, name=None, decl_type=None, header_dir=None, header_file=None ):
+        """returns declarations, which could match the query"""
+        positions = set()
+        for file_ in self.__find_files( header_dir, header_file ):
+            positions.update( self.__find_positions( file_, name, decl_type ) )
+        positions = list( positions )
+        positions.sort()
+        decls = self.__decls
+        return [ decls[ position ] for position in positions ]
+
+    def __query( self, match_class, keywds ):
+        function = keywds.pop( 'function', None )
+        if callable( keywds.get( 'name' ) ) and None is function:
+            function = keywds[ 'name' ]
+            keywds[ 'name' ] = None
+        decl_matcher = match_class( **keywds )
+        if function:
+            matcher = lambda decl: decl_matcher( decl ) and function( decl )
+        else:
+            matcher = decl_matcher
+        #some matchers( variable_matcher_t ) define the declaration type themselves
+        candidates = self.candidates( name=keywds.get( 'name' )
+                                      , decl_type=getattr( decl_matcher, 'decl_type', None )
+                                      , header_dir=keywds.get( 'header_dir' )
+                                      , header_file=keywds.get( 'header_file' ) )
+        return matcher, candidates
+
+    def find_single( self, match_class, **keywds ):
+        """the same as :meth:`pygccxml.declarations.scopedef_t.decl` recursive query"""
+        matcher, candidates = self.__query( match_class, keywds )
+        return declarations.matcher.get_single( matcher, candidates, False )
+
+    def find_multiple( self, match_class, allow_empty=None, **keywds ):
+        """the same as :meth:`pygccxml.declarations.scopedef_t.decls` recursive query"""
+        matcher, candidates = self.__query( match_class, keywds )
+        found = declarations.matcher.find( matcher, candidates, False )
+        if None is allow_empty:
+            allow_empty = declarations.scopedef_t.ALLOW_EMPTY_MDECL_WRAPPER
+        if not found and not allow_empty:
+            raise RuntimeError( "Multi declaration query returned 0 declarations." )
+        return declarations.mdecl_wrapper_t( found )
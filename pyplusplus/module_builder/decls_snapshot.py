@@ -0,0 +1,159 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines class, which keeps the declarations tree, after defaults were applied, on disk"""
+
+import os
+import cPickle
+try:
+    from hashlib import md5
+except:
+    from md5 import new as md5
+
+import pyplusplus
+from pygccxml import parser
+from pygccxml import declarations
+from pygccxml.parser.declarations_cache import file_signature
+from pygccxml.parser.declarations_cache import configuration_signature
+from pyplusplus import _logging_
+
+def create_key( files, gccxml_config, *args ):
+    """creates key, which identifies the declarations tree
+
+    The key is built from the `Py++` version, the GCC-XML configuration, the
+    input files signatures and all additional arguments, converted to string.
+    """
+    key = md5()
+    key.update( pyplusplus.__version__ )
+    key.update( configuration_signature( gccxml_config ) )
+    for arg in args:
+        key.update( str( arg ) )
+    for file_ in files:
+        if isinstance( file_, parser.file_configuration_t ):
+            key.update( file_.content_type )
+            if file_.content_type == parser.file_configuration_t.CONTENT_TYPE.TEXT:
+                key.update( file_.data )
+                continue
+            file_ = file_.data
+        key.update( file_ )
+        if os.path.isfile( file_ ):
+            key.update( file_signature( file_ ) )
+    return key.hexdigest()
+
+def dependent_files_digest( files ):
+    """returns digest of the files content, missing files are taken into account too"""
+    digest = md5()
+    for file_ in files:
+        digest.update( file_ )
+        if os.path.isfile( file_ ):
+            digest.update( file_signature( file_ ) )
+        else:
+            digest.update( 'missing' )
+    return digest.hexdigest()
+
+class snapshot_t( object ):
+    """keeps the declarations tree, after defaults were applied, on disk
+
+    The snapshot contains the declarations tree with all `Py++` settings:
+    exclusions, call policies, etc. It is valid as long as the key and the
+    content of the files, the declarations were defined in, were not changed.
+
+    Header files, which don't contain declarations, but affect the parsing
+    ( macros only ), are not tracked.
+
+    The snapshot is accompanied by the per file declarations cache. For every
+    input file, it keeps the list of included files and their signatures. When
+    the snapshot is out of date, only the files, which include changed headers,
+    are parsed again.
+    """
+
+    FORMAT_VERSION = 3
+
+    def __init__( self, file_name ):
+        object.__init__( self )
+        self.__file_name = file_name
+        self.__digest = None
+        self.logger = _logging_.loggers.module_builder
+
+    @property
+    def file_name( self ):
+        """snapshot file name"""
+        return self.__file_name
+
+    @property
+    def digest( self ):
+        """digest of the key and the dependent files content or None
+
+        It is available after the snapshot was loaded or written and
+        identifies the declarations tree, kept by the snapshot.
+        """
+        return self.__digest
+
+    @staticmethod
+    def __create_digest( key, files_digest ):
+        digest = md5()
+        digest.update( key )
+        digest.update( files_digest )
+        return digest.hexdigest()
+
+    @property
+    def files_cache_name( self ):
+        """per file declarations cache file name"""
+        return self.file_name + '.files'
+
+    def create_files_cache( self ):
+        """creates per file declarations cache"""
+        return parser.file_cache_t( self.files_cache_name )
+
+    def load( self, key ):
+        """returns the global namespace, stored in the snapshot, or None
+
+        None is returned, if the snapshot does not exist or was created for
+        different key or one of the dependent files was changed.
+        """
+        if not os.path.isfile( self.file_name ):
+            return None
+        self.logger.debug( 'loading declarations snapshot "%s"' % self.file_name )
+        try:
+            f = file( self.file_name, 'rb' )
+            try:
+                header = cPickle.load( f )
+                format_version, cached_key, files, files_digest = header
+                if self.FORMAT_VERSION != format_version or key != cached_key:
+                    self.logger.info( 'declarations snapshot "%s" is out of date: configuration or input files were changed'
+                                      % self.file_name )
+                    return None
+                if files_digest != dependent_files_digest( files ):
+                    self.logger.info( 'declarations snapshot "%s" is out of date: one of included files was changed'
+                                      % self.file_name )
+                    return None
+                global_ns = cPickle.load( f )
+                self.__digest = self.__create_digest( key, files_digest )
+            finally:
+                f.close()
+        except Exception, error:
+            self.logger.info( 'unable to load declarations snapshot "%s": %s' % ( self.file_name, str( error ) ) )
+            return None
+        self.logger.info( 'declarations were loaded from snapshot "%s"' % self.file_name )
+        return global_ns
+
+    def dump( self, key, global_ns ):
+        """stores global namespace in the snapshot"""
+        self.logger.debug( 'writing declarations snapshot "%s"' % self.file_name )
+        files = filter( None, declarations.declaration_files( global_ns ) )
+        files.sort()
+        files_digest = dependent_files_digest( files )
+        header = ( self.FORMAT_VERSION, key, files, files_digest )
+        tmp_file_name = self.file_name + '.tmp'
+        f = file( tmp_file_name, 'wb' )
+        try:
+            cPickle.dump( header, f, cPickle.HIGHEST_PROTOCOL )
+            cPickle.dump( global_ns, f, cPickle.HIGHEST_PROTOCOL )
+        finally:
+            f.close()
+        if os.path.exists( self.file_name ):
+            os.remove( self.file_name )
+        os.rename( tmp_file_name, self.file_name )
+        self.__digest = self.__create_digest( key, files_digest )
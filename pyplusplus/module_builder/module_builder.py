@@ -5,7 +5,11 @@
 
 import os
 import sys
+import rules_set
+import decls_index
 
+from pygccxml import declarations
+from pyplusplus import utils
 from pyplusplus import _logging_
 from pyplusplus import decl_wrappers
 
@@ -19,6 +23,8 @@ class module_builder_t(object):
         self.logger = _logging_.loggers.module_builder
         self.__encoding = encoding
         self.__global_ns = global_ns
+        self.__decls_index = None
+        self.__stats = utils.statistics_t()
 
     def __get_global_ns( self ):
         if not self.__global_ns:
@@ -26,6 +32,7 @@ class module_builder_t(object):
         return self.__global_ns
     def __set_global_ns( self, global_ns ):
         self.__global_ns = global_ns
+        self.__decls_index = None
 
     global_ns = property( __get_global_ns, __set_global_ns
                           ,  doc="""reference to global namespace""" )
@@ -34,13 +41,55 @@ class module_builder_t(object):
     def encoding( self ):
         return self.__encoding
 
+    @property
+    def stats( self ):
+        """time and counters of the code generation phases, see :class:`utils.statistics_t`"""
+        return self.__stats
+
     def run_query_optimizer(self):
         """
         It is possible to optimize time that takes to execute queries. In most cases
         this is done from the :meth:`__init__` method. But there are use-case,
         when you need to disable optimizer and run it later.
+
+        The optimizer also builds an index, which is used to answer queries with
+        `header_dir` or `header_file` arguments. See :class:`decls_index.decls_index_t`.
         """
+        self.stats.start( 'query_optimizer' )
         self.global_ns.init_optimizer()
+        self.__decls_index = decls_index.decls_index_t( self.global_ns )
+        self.stats.stop( 'query_optimizer' )
+
+    def __use_decls_index( self, header_dir, header_file, recursive ):
+        if None is self.__decls_index or not ( header_dir or header_file ):
+            return False
+        if None is recursive:
+            recursive = declarations.scopedef_t.RECURSIVE_DEFAULT
+        return bool( recursive )
+
+    def __build_operator_query( self, name, function, symbol ):
+        """returns operator name and function, built the same way pygccxml builds them"""
+        return ( self.global_ns._build_operator_name( name, function, symbol )
+                 , self.global_ns._build_operator_function( name, function ) )
+
+    def apply_rules( self, rules ):
+        """
+        Includes and excludes declarations, using the rules, in one pass over
+        the declarations tree.
+
+        :param rules: rules to apply
+        :type rules: :class:`rules_set.rules_set_t` or list of :class:`rules_set.rule_t` objects
+
+        :rtype: list, which contains the number of declarations, affected by every rule
+        """
+        if not isinstance( rules, rules_set.rules_set_t ):
+            rules = rules_set.rules_set_t( rules )
+        self.stats.start( 'rules' )
+        affected = rules.apply( self.global_ns )
+        self.stats.stop( 'rules', sum( affected ) )
+        for rule, count in zip( rules.rules, affected ):
+            self.logger.debug( 'rule "%s" affected %d declarations' % ( rule, count ) )
+        return affected
 
     def print_declarations(self, decl=None, detailed=True, recursive=True, writer=sys.stdout.write):
         """
@@ -57,6 +106,12 @@ class module_builder_t(object):
     #select decl(s) interfaces
     def decl( self, name=None, function=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.declaration_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.decl( name=name
                                     , function=function
                                     , header_dir=header_dir
@@ -65,6 +120,12 @@ class module_builder_t(object):
 
     def decls( self, name=None, function=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.declaration_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.decls( name=name
                                      , function=function
                                      , header_dir=header_dir
@@ -73,6 +134,13 @@ class module_builder_t(object):
 
     def class_( self, name=None, function=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.declaration_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , decl_type=declarations.class_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.class_( name=name
                                       , function=function
                                       , header_dir=header_dir
@@ -81,6 +149,13 @@ class module_builder_t(object):
 
     def classes( self, name=None, function=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.declaration_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , decl_type=declarations.class_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.classes( name=name
                                        , function=function
                                        , header_dir=header_dir
@@ -89,6 +164,13 @@ class module_builder_t(object):
 
     def variable( self, name=None, function=None, type=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.variable_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , type=type
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.variable( name=name
                                         , function=function
                                         , type=type
@@ -99,6 +181,13 @@ class module_builder_t(object):
 
     def variables( self, name=None, function=None, type=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.variable_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , type=type
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.variables( name=name
                                          , function=function
                                          , type=type
@@ -109,6 +198,15 @@ class module_builder_t(object):
 
     def calldef( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.calldef_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.calldef_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.calldef( name=name
                                        , function=function
                                        , return_type=return_type
@@ -119,6 +217,15 @@ class module_builder_t(object):
 
     def calldefs( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.calldef_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.calldef_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.calldefs( name=name
                                         , function=function
                                         , return_type=return_type
@@ -129,6 +236,17 @@ class module_builder_t(object):
 
     def operator( self, name=None, symbol=None, return_type=None, arg_types=None, decl_type=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            name, function = self.__build_operator_query( name, None, symbol )
+            return self.__decls_index.find_single( declarations.operator_matcher_t
+                                                 , name=name
+                                                 , symbol=symbol
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.operator_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.operator( name=name
                                         , symbol=symbol
                                         , return_type=return_type
@@ -139,6 +257,17 @@ class module_builder_t(object):
 
     def operators( self, name=None, symbol=None, return_type=None, arg_types=None, decl_type=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            name, function = self.__build_operator_query( name, None, symbol )
+            return self.__decls_index.find_multiple( declarations.operator_matcher_t
+                                                   , name=name
+                                                   , symbol=symbol
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.operator_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.operators( name=name
                                          , symbol=symbol
                                          , return_type=return_type
@@ -149,6 +278,15 @@ class module_builder_t(object):
 
     def member_function( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.calldef_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.member_function_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.member_function( name=name
                                                , function=function
                                                , return_type=return_type
@@ -160,6 +298,15 @@ class module_builder_t(object):
 
     def member_functions( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.calldef_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.member_function_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.member_functions( name=name
                                                 , function=function
                                                 , return_type=return_type
@@ -172,6 +319,15 @@ class module_builder_t(object):
 
     def constructor( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.calldef_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.constructor_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.constructor( name=name
                                            , function=function
                                            , return_type=return_type
@@ -182,6 +338,15 @@ class module_builder_t(object):
 
     def constructors( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.calldef_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.constructor_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.constructors( name=name
                                             , function=function
                                             , return_type=return_type
@@ -192,6 +357,17 @@ class module_builder_t(object):
 
     def member_operator( self, name=None, function=None, symbol=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            name, function = self.__build_operator_query( name, function, symbol )
+            return self.__decls_index.find_single( declarations.operator_matcher_t
+                                                 , name=name
+                                                 , symbol=symbol
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.member_operator_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.member_operator( name=name
                                                , symbol=symbol
                                                , function=function
@@ -203,6 +379,17 @@ class module_builder_t(object):
 
     def member_operators( self, name=None, function=None, symbol=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            name, function = self.__build_operator_query( name, function, symbol )
+            return self.__decls_index.find_multiple( declarations.operator_matcher_t
+                                                   , name=name
+                                                   , symbol=symbol
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.member_operator_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.member_operators( name=name
                                                 , symbol=symbol
                                                 , function=function
@@ -214,6 +401,15 @@ class module_builder_t(object):
 
     def casting_operator( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.calldef_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.casting_operator_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.casting_operator( name=name
                                                 , function=function
                                                 , return_type=return_type
@@ -224,6 +420,15 @@ class module_builder_t(object):
 
     def casting_operators( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.calldef_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.casting_operator_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.casting_operators( name=name
                                                  , function=function
                                                  , return_type=return_type
@@ -234,6 +439,13 @@ class module_builder_t(object):
 
     def enumeration( self, name=None, function=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.declaration_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , decl_type=declarations.enumeration_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.enumeration( name=name
                                            , function=function
                                            , header_dir=header_dir
@@ -243,6 +455,13 @@ class module_builder_t(object):
 
     def enumerations( self, name=None, function=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.scopedef_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.declaration_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , decl_type=declarations.enumeration_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.enumerations( name=name
                                             , function=function
                                             , header_dir=header_dir
@@ -265,6 +484,15 @@ class module_builder_t(object):
 
     def free_function( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.namespace_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_single( declarations.calldef_matcher_t
+                                                 , name=name
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.free_function_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.free_function( name=name
                                              , function=function
                                              , return_type=return_type
@@ -276,6 +504,15 @@ class module_builder_t(object):
 
     def free_functions( self, name=None, function=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.namespace_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            return self.__decls_index.find_multiple( declarations.calldef_matcher_t
+                                                   , name=name
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.free_function_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.free_functions( name=name
                                               , function=function
                                               , return_type=return_type
@@ -287,6 +524,17 @@ class module_builder_t(object):
 
     def free_operator( self, name=None, function=None, symbol=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.namespace_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            name, function = self.__build_operator_query( name, function, symbol )
+            return self.__decls_index.find_single( declarations.operator_matcher_t
+                                                 , name=name
+                                                 , symbol=symbol
+                                                 , function=function
+                                                 , return_type=return_type
+                                                 , arg_types=arg_types
+                                                 , decl_type=declarations.free_operator_t
+                                                 , header_dir=header_dir
+                                                 , header_file=header_file )
         return self.global_ns.free_operator( name=name
                                              , symbol=symbol
                                              , function=function
@@ -298,6 +546,17 @@ class module_builder_t(object):
 
     def free_operators( self, name=None, function=None, symbol=None, return_type=None, arg_types=None, header_dir=None, header_file=None, recursive=None ):
         """Please see :class:`decl_wrappers.namespace_t` class documentation"""
+        if self.__use_decls_index( header_dir, header_file, recursive ):
+            name, function = self.__build_operator_query( name, function, symbol )
+            return self.__decls_index.find_multiple( declarations.operator_matcher_t
+                                                   , name=name
+                                                   , symbol=symbol
+                                                   , function=function
+                                                   , return_type=return_type
+                                                   , arg_types=arg_types
+                                                   , decl_type=declarations.free_operator_t
+                                                   , header_dir=header_dir
+                                                   , header_file=header_file )
         return self.global_ns.free_operators( name=name
                                               , symbol=symbol
                                               , function=function
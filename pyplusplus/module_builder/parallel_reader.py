@@ -0,0 +1,122 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines functionality, which runs GCC-XML on the project files in parallel
+
+The files are parsed by a pool of processes. The declarations are passed back
+to the main process and are fed into `pygccxml.parser.project_reader_t` via
+declarations cache interface, so the declarations trees are merged by pygccxml.
+"""
+
+import time
+import multiprocessing
+
+from pygccxml import parser
+from pygccxml.parser import declarations_cache
+from pyplusplus import _logging_
+from pyplusplus import decl_wrappers
+
+class recorder_cache_t( declarations_cache.cache_base_t ):
+    """declarations cache, which remembers the declarations it was updated with
+
+    If the underlying cache contains the declarations, they are not recorded.
+    The main process will take them from the same cache.
+    """
+    def __init__( self, cache=None ):
+        declarations_cache.cache_base_t.__init__( self )
+        self.__cache = cache
+        self.records = {}
+
+    def flush(self):
+        pass
+
+    def update(self, source_file, configuration, declarations, included_files):
+        self.records[ source_file ] = ( declarations, included_files )
+
+    def cached_value(self, source_file, configuration):
+        if self.__cache:
+            return self.__cache.cached_value( source_file, configuration )
+        return None
+
+class prefetched_cache_t( declarations_cache.cache_base_t ):
+    """declarations cache, which returns the declarations, read by the pool processes
+
+    Every declarations list is returned only once. All other requests are
+    forwarded to the underlying cache, if it was given. The underlying cache
+    is updated with the prefetched declarations too.
+    """
+    def __init__( self, records, cache=None ):
+        declarations_cache.cache_base_t.__init__( self )
+        self.__records = records
+        self.__cache = cache
+
+    def flush(self):
+        if self.__cache:
+            self.__cache.flush()
+
+    def update(self, source_file, configuration, declarations, included_files):
+        if self.__cache:
+            self.__cache.update( source_file, configuration, declarations, included_files )
+
+    def cached_value(self, source_file, configuration):
+        record = self.__records.pop( source_file, None )
+        if record:
+            declarations, included_files = record
+            self.update( source_file, configuration, declarations, included_files )
+            return declarations
+        if self.__cache:
+            return self.__cache.cached_value( source_file, configuration )
+        return None
+
+def is_parallelizable( file_ ):
+    """returns True, if the file could be parsed by the pool process"""
+    if not isinstance( file_, parser.file_configuration_t ):
+        return True
+    return file_.content_type == parser.file_configuration_t.CONTENT_TYPE.STANDARD_SOURCE_FILE \
+           and not file_.start_with_declarations
+
+#the underlying declarations cache. Pool processes, created by "fork", inherit it
+_cache = None
+
+def _read_file( args ):
+    config, file_ = args
+    if isinstance( file_, parser.file_configuration_t ):
+        file_ = file_.data
+    cache = recorder_cache_t( _cache )
+    reader = parser.source_reader_t( config, cache, decl_wrappers.dwfactory_t() )
+    reader.read_file( file_ )
+    return cache.records
+
+def read_files( files, config, jobs, cache=None ):
+    """runs GCC-XML on the files, using pool of `jobs` processes
+
+    Files, found in the declarations `cache`, are not parsed. Returns declarations
+    cache, which should be passed to `pygccxml.parser.project_reader_t` class.
+    If none of the files could be parsed by the pool process, the pool is not
+    created and the given `cache` is returned.
+    """
+    global _cache
+    logger = _logging_.loggers.module_builder
+    start_time = time.clock()
+    logger.debug( 'parsing files using %d processes - started' % jobs )
+    tasks = [ ( config, file_ ) for file_ in files if is_parallelizable( file_ ) ]
+    if not tasks:
+        logger.debug( 'parsing files using %d processes - done: there are no files, the pool could parse' % jobs )
+        return cache
+    records = {}
+    _cache = cache
+    try:
+        pool = multiprocessing.Pool( jobs )
+        try:
+            for file_records in pool.imap( _read_file, tasks ):
+                records.update( file_records )
+        finally:
+            pool.close()
+            pool.join()
+    finally:
+        _cache = None
+    logger.debug( 'parsing files using %d processes - done( %f seconds )'
+                  % ( jobs, time.clock() - start_time ) )
+    return prefetched_cache_t( records, cache )
@@ -0,0 +1,205 @@
+# Copyright 2004-2008 Roman Yakovenko.
+# Distributed under the Boost Software License, Version 1.0. (See
+# accompanying file LICENSE_1_0.txt or copy at
+# http://www.boost.org/LICENSE_1_0.txt)
+
+"""defines classes, which include or exclude many declarations in one pass
+
+Usage example:
+
+.. code-block:: python
+
+   rules = module_builder.rules_set_t()
+   rules.exclude( name='.*' )
+   rules.include( header='*/my_project/*' )
+   rules.exclude( name='impl_.*', decl_type=module_builder.calldef_t )
+   rules.exclude( access_type='private' )
+   affected = mb.apply_rules( rules )
+"""
+
+import os
+import re
+import fnmatch
+
+from pygccxml import declarations
+
+class rule_t( object ):
+    """declarative version of "include" or "exclude" call
+
+    All given criteria should be satisfied by the declaration:
+
+    :param name: regular expression, the whole declaration name should match.
+                 If the expression contains "::", the declaration full name is
+                 used instead of the name.
+    :param header: glob pattern, the declaration header file name should match
+    :param decl_type: declaration class or tuple of classes
+    :param access_type: access type of the class member, one of :class:`declarations.ACCESS_TYPES` values
+    :param function: callable, which takes declaration and returns True or False
+    :param already_exposed: "already_exposed" argument of the "include" action
+    """
+
+    INCLUDE = 'include'
+    EXCLUDE = 'exclude'
+
+    def __init__( self
+                  , action
+                  , name=None
+                  , header=None
+                  , decl_type=None
+                  , access_type=None
+                  , function=None
+                  , already_exposed=False ):
+        object.__init__( self )
+        assert action in ( self.INCLUDE, self.EXCLUDE )
+        self.action = action
+        self.name = name
+        self.header = header
+        self.decl_type = decl_type
+        self.access_type = access_type
+        self.function = function
+        self.already_exposed = already_exposed
+        self.__name_re = None
+        self.__use_full_name = False
+        if None is not name:
+            self.__name_re = re.compile( '(?:%s)\\Z' % name )
+            self.__use_full_name = '::' in name
+        self.__header = None
+        if None is not header:
+            self.__header = os.path.normcase( header )
+
+    def __str__( self ):
+        criteria = []
+        for criterion in ( 'name', 'header', 'decl_type', 'access_type', 'function' ):
+            value = getattr( self, criterion )
+            if None is not value:
+                criteria.append( '%s=%s' % ( criterion, value ) )
+        return '%s( %s )' % ( self.action, ', '.join( criteria ) )
+
+    def match_type( self, decl_class ):
+        """returns True, if declarations of the class could match the rule"""
+        return None is self.decl_type or issubclass( decl_class, self.decl_type )
+
+    def match_header( self, file_name ):
+        """returns True, if declarations from the file could match the rule"""
+        if None is self.__header:
+            return True
+        if not file_name:
+            return False
+        file_name = os.path.normcase( os.path.normpath( file_name ) )
+        return fnmatch.fnmatchcase( file_name, self.__header )
+
+    def match_decl( self, decl ):
+        """checks the criteria, which does not depend on the declaration type and header"""
+        if self.__name_re:
+            if self.__use_full_name:
+                name = declarations.full_name( decl )
+            else:
+                name = decl.name
+            if not self.__name_re.match( name ):
+                return False
+        if None is not self.access_type:
+            if not isinstance( decl.parent, declarations.class_t ):
+                return False
+            if self.access_type != decl.parent.find_out_member_access_type( decl ):
+                return False
+        if self.function and not self.function( decl ):
+            return False
+        return True
+
+class rules_set_t( object ):
+    """ordered list of include and exclude rules, applied in one declarations tree pass
+
+    The result is the same as the result of calling "include" or "exclude"
+    method of every declaration, matched by the rule, rule after rule: the
+    declaration state is defined by the last rule, which matched the declaration
+    or one of its parents.
+    """
+
+    def __init__( self, rules=None ):
+        object.__init__( self )
+        self.__rules = []
+        if rules:
+            self.__rules.extend( rules )
+
+    @property
+    def rules( self ):
+        """list of :class:`rule_t` objects"""
+        return self.__rules
+
+    def add( self, rule ):
+        """appends the rule"""
+        self.__rules.append( rule )
+        return rule
+
+    def include( self, **keywds ):
+        """appends "include" rule, see :class:`rule_t` for the arguments description"""
+        return self.add( rule_t( rule_t.INCLUDE, **keywds ) )
+
+    def exclude( self, **keywds ):
+        """appends "exclude" rule, see :class:`rule_t` for the arguments description"""
+        return self.add( rule_t( rule_t.EXCLUDE, **keywds ) )
+
+    def apply( self, global_ns ):
+        """applies the rules to the declarations tree
+
+        Returns list, which contains the number of declarations, the state of
+        which was defined by the rule, in the order of the rules.
+        """
+        rules = self.__rules
+        affected = [ 0 ] * len( rules )
+        if not rules:
+            return affected
+
+        #indexes of the rules, which could match declarations of the class
+        #or from the file, in descending order
+        type2rules = {}
+        file2rules = {}
+
+        to_be_visited = [ ( global_ns, -1, -1 ) ]
+        while to_be_visited:
+            decl, last, last_include = to_be_visited.pop()
+
+            decl_class = decl.__class__
+            if decl_class not in type2rules:
+                type2rules[ decl_class ] \
+                    = [ index for index in range( len( rules ) - 1, -1, -1 )
+                        if rules[ index ].match_type( decl_class ) ]
+            file_name = None
+            if decl.location:
+                file_name = decl.location.file_name
+            if file_name not in file2rules:
+                file2rules[ file_name ] \
+                    = set( [ index for index, rule in enumerate( rules )
+                             if rule.match_header( file_name ) ] )
+            header_rules = file2rules[ file_name ]
+
+            own_last = own_include = -1
+            for index in type2rules[ decl_class ]:
+                #rules, which are overridden by the parent ones, are not checked
+                need_last = -1 == own_last and last < index
+                need_include = last_include < index
+                if not ( need_last or need_include ):
+                    break
+                rule = rules[ index ]
+                if rule.action == rule_t.EXCLUDE and not need_last:
+                    continue
+                if index not in header_rules or not rule.match_decl( decl ):
+                    continue
+                if need_last:
+                    own_last = index
+                if rule.action == rule_t.INCLUDE:
+                    own_include = index
+                    break
+
+            last = max( last, own_last )
+            last_include = max( last_include, own_include )
+            if -1 != last:
+                affected[ last ] += 1
+                decl.ignore = rules[ last ].action == rule_t.EXCLUDE
+            if -1 != last_include:
+                decl.already_exposed = rules[ last_include ].already_exposed
+
+            if isinstance( decl, declarations.scopedef_t ):
+                for child in reversed( decl.declarations ):
+                    to_be_visited.append( ( child, last, last_include ) )
+        return affected
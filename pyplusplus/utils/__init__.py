@@ -8,7 +8,13 @@ This module is a collection of unrelated algorithms, that works on code creators
 tree.
 """
 import os
+import sys
 import math
+import time
+try:
+    import resource
+except ImportError:
+    resource = None #not available on Windows
 from pygccxml import declarations
 from pyplusplus import code_creators  
 
@@ -53,6 +59,167 @@ def split_sequence(seq, bucket_size):
     return buckets
     
 
+class path_index_t( object ):
+    """answers the question whether the file belongs to one of the files or directories
+
+    The answer is the same as the one given by the following code:
+
+    .. code-block:: python
+
+       fpath = normalize( file_name )
+       pygccxml.utils.contains_parent_dir( fpath, dirs ) \\
+       or bool( filter( lambda pfile: fpath.endswith( pfile ), files ) )
+
+    The files and the directories are grouped by their length, so the question
+    is answered using few dictionary lookups. The answers are memorized.
+    """
+    def __init__( self, files, dirs, normalize=None ):
+        object.__init__( self )
+        self.__files = self.__group_by_len( files )
+        self.__dirs = self.__group_by_len( dirs )
+        self.__normalize = normalize
+        self.__answers = {}
+
+    @staticmethod
+    def __group_by_len( paths ):
+        len2paths = {}
+        for path in paths:
+            len2paths.setdefault( len( path ), set() ).add( path )
+        return len2paths.items()
+
+    def __find( self, fpath ):
+        if self.__normalize:
+            fpath = self.__normalize( fpath )
+        for len_, dirs in self.__dirs:
+            if fpath[:len_] in dirs:
+                return True
+        for len_, files in self.__files:
+            if len_ <= len( fpath ) and fpath[ len( fpath ) - len_: ] in files:
+                return True
+        return False
+
+    def __contains__( self, file_name ):
+        try:
+            return self.__answers[ file_name ]
+        except KeyError:
+            answer = self.__answers[ file_name ] = self.__find( file_name )
+            return answer
+
+class statistics_t( object ):
+    """collects time and counters of the code generation phases
+
+    For every phase, the wall clock time, the CPU time, the number of calls
+    and the number of processed items are kept. The CPU time includes the time
+    of the finished child processes, for example GCC-XML. Phases are reported
+    in the order they were started for the first time.
+
+    Where the platform allows, the peak resident memory of the process, in
+    bytes, is sampled when the phase ends. This is the process high-water mark,
+    so the difference between two consecutive phases shows the memory
+    growth, caused by the later one.
+
+    Usage example:
+
+    .. code-block:: python
+
+       stats.start( 'parsing' )
+       ...
+       stats.stop( 'parsing', items=len( files ) )
+       stats.save( 'generation_stats.json' )
+    """
+
+    class phase_t( object ):
+        """time and counters of a single phase"""
+        def __init__( self, name ):
+            object.__init__( self )
+            self.name = name
+            self.calls = 0
+            self.items = 0
+            self.wall_time = 0.0
+            self.cpu_time = 0.0
+            self.peak_memory = None
+
+        def to_dict( self ):
+            return dict( name=self.name
+                         , calls=self.calls
+                         , items=self.items
+                         , wall_time=self.wall_time
+                         , cpu_time=self.cpu_time
+                         , peak_memory=self.peak_memory )
+
+    def __init__( self ):
+        object.__init__( self )
+        self.__phases = {}
+        self.__order = []
+        self.__started = {}
+
+    @staticmethod
+    def __cpu_time():
+        return sum( os.times()[:4] )
+
+    @staticmethod
+    def peak_memory():
+        """returns peak resident memory of the process in bytes or None, if it is unknown"""
+        if None is resource:
+            return None
+        max_rss = resource.getrusage( resource.RUSAGE_SELF ).ru_maxrss
+        if 'darwin' == sys.platform:
+            return max_rss
+        return max_rss * 1024 #kilobytes
+
+    def __get_phase( self, name ):
+        try:
+            return self.__phases[ name ]
+        except KeyError:
+            phase = self.__phases[ name ] = self.phase_t( name )
+            self.__order.append( name )
+            return phase
+
+    def start( self, name ):
+        """starts measuring the phase"""
+        self.__get_phase( name )
+        self.__started[ name ] = ( time.time(), self.__cpu_time() )
+
+    def stop( self, name, items=0 ):
+        """stops measuring the phase and returns its :class:`phase_t` object"""
+        wall_start, cpu_start = self.__started.pop( name )
+        phase = self.__get_phase( name )
+        phase.calls += 1
+        phase.items += items
+        phase.wall_time += time.time() - wall_start
+        phase.cpu_time += self.__cpu_time() - cpu_start
+        phase.peak_memory = self.peak_memory()
+        return phase
+
+    def add_items( self, name, items ):
+        """adds the number of processed items to the phase"""
+        self.__get_phase( name ).items += items
+
+    def __contains__( self, name ):
+        return name in self.__phases
+
+    def __getitem__( self, name ):
+        return self.__phases[ name ]
+
+    @property
+    def phases( self ):
+        """list of :class:`phase_t` objects, in the order they were started"""
+        return [ self.__phases[ name ] for name in self.__order ]
+
+    def to_dict( self ):
+        return dict( phases=[ phase.to_dict() for phase in self.phases ] )
+
+    def to_json( self ):
+        """returns statistics as JSON string"""
+        import json
+        return json.dumps( self.to_dict(), indent=4 )
+
+    def save( self, file_path ):
+        """writes statistics, as JSON, to the file"""
+        f = file( file_path, 'w+' )
+        f.write( self.to_json() )
+        f.close()
+
 class exposed_decls_db_t( object ):
     DEFAULT_FILE_NAME = 'exposed_decl.pypp.txt'
     class row_t( declarations.decl_visitor_t ):
@@ -10,6 +10,8 @@ import autoconfig
 import pygccxml
 from pygccxml import parser
 from pygccxml import declarations
+from pyplusplus import messages
+from pyplusplus import decl_wrappers
 from pyplusplus import code_creators
 from pyplusplus import creators_factory
 from pyplusplus import module_builder
@@ -220,6 +222,19 @@ class split_sequence_tester_t(unittest.TestCase):
         self.failUnless( [[1,2,3]] == split( seq, 3 ) )
         self.failUnless( [[1,2,3]] == split( seq, 4 ) )
 
+class path_index_tester_t(unittest.TestCase):
+    def test(self):
+        files = [ '/a/b/c.hpp', 'x.hpp', 'b/yy.hpp' ]
+        dirs = [ '/a/b', '/x/y/' ]
+        index = pypp_utils.path_index_t( files, dirs )
+        paths = [ '/a/b/c.hpp', '/a/bc.hpp', '/a/b/d/e.hpp', '/z/x.hpp', '/z/yx.hpp'
+                  , '/z/b/yy.hpp', '/z/b/y.hpp', '/x/y/z.hpp', '/x/yz.hpp', 'hpp', '' ]
+        for path in paths:
+            expected = pygccxml.utils.contains_parent_dir( path, dirs ) \
+                       or bool( filter( lambda f: path.endswith( f ), files ) )
+            self.failUnless( expected == ( path in index ), path )
+            self.failUnless( expected == ( path in index ), path )
+
 class doc_extractor_tester_t( unittest.TestCase ):
     def test( self ):
         escaped_doc = module_builder.doc_extractor_i.escape_doc('Hello "Py++"')
@@ -305,6 +320,640 @@ class constructors_code_tester_t( unittest.TestCase ):
         tmp = code.split( '    //all constructors body' )
         self.failUnless( len( tmp ) == 2 )
 
+class decls_snapshot_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = 'namespace xyz{ struct X{ int* get_ptr(); }; }'
+        snapshot = os.path.join( autoconfig.build_directory, 'decls_snapshot.pypp.bin' )
+        if os.path.exists( snapshot ):
+            os.remove( snapshot )
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , snapshot=snapshot )
+        self.failUnless( os.path.exists( snapshot ) )
+        self.failUnless( 'parsing' in mb.stats )
+        self.failUnless( 0 == mb.stats[ 'snapshot_loading' ].items )
+
+        mb2 = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , snapshot=snapshot )
+        #the declarations were loaded from the snapshot, GCC-XML did not run
+        self.failUnless( 'parsing' not in mb2.stats )
+        self.failUnless( 1 == mb2.stats[ 'snapshot_loading' ].items )
+        get_ptr = mb.mem_fun( 'get_ptr' )
+        get_ptr2 = mb2.mem_fun( 'get_ptr' )
+        self.failUnless( get_ptr is not get_ptr2 )
+        self.failUnless( get_ptr.ignore == get_ptr2.ignore )
+        self.failUnless( ( None is get_ptr.call_policies ) == ( None is get_ptr2.call_policies ) )
+
+        mb3 = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code + 'namespace xyz{ struct Y{}; }' ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , snapshot=snapshot )
+        self.failUnless( mb3.class_( 'Y' ) )
+        self.failUnless( 'parsing' in mb3.stats )
+        self.failUnless( 0 == mb3.stats[ 'snapshot_loading' ].items )
+
+class call_policies_on_demand_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = 'struct X{ const X& get_self() const; int* get_ptr(); X& self; };'
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        get_self = mb.mem_fun( 'get_self' )
+        self.failUnless( get_self.call_policies.is_predefined() )
+        get_ptr = mb.mem_fun( 'get_ptr' )
+        get_ptr.call_policies = module_builder.call_policies.return_internal_reference()
+        self.failUnless( get_ptr.call_policies.is_predefined() )
+        self_ = mb.var( 'self' )
+        self.failUnless( self_.getter_call_policies )
+        self.failUnless( self_.setter_call_policies )
+
+class class_level_defaults_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = 'struct X{ void do_smth(); int value; }; struct Y{};'
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        x = mb.class_( 'X' )
+        y = mb.class_( 'Y' )
+        #the mutable defaults are not created before the first use
+        for cls in ( x, y ):
+            self.failUnless( '_declaration_code' not in vars( cls ) )
+            self.failUnless( '_properties' not in vars( cls ) )
+        x.add_declaration_code( 'int i;' )
+        x.add_property( 'value', mb.mem_fun( 'do_smth' ) )
+        self.failUnless( '_declaration_code' in vars( x ) )
+        self.failUnless( '_declaration_code' not in vars( y ) )
+        self.failUnless( 1 == len( x.declaration_code ) )
+        self.failUnless( 1 == len( x.properties ) )
+        self.failUnless( not y.declaration_code and not y.properties )
+        do_smth = mb.mem_fun( 'do_smth' )
+        do_smth.add_override_precall_code( 'int i;' )
+        self.failUnless( [ 'int i;' ] == do_smth.override_precall_code )
+        self.failUnless( not do_smth.default_precall_code )
+        x.disable_messages( messages.W1020 )
+        self.failUnless( messages.W1020 in x.disabled_messages )
+        self.failUnless( not y.disabled_messages )
+
+class statistics_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = 'struct X{ void do_smth(); }; void do_smth( X& ){}'
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.build_code_creator( 'statistics' )
+        mb.write_module( os.path.join( autoconfig.build_directory, 'statistics.cpp' ) )
+        for name in ( 'parsing', 'defaults', 'prepare_decls', 'sorting'
+                      , 'visiting', 'dependencies', 'writing' ):
+            self.failUnless( name in mb.stats, name )
+            self.failUnless( 1 == mb.stats[ name ].calls )
+        self.failUnless( mb.stats[ 'prepare_decls' ].items )
+        self.failUnless( 1 == mb.stats[ 'writing' ].items )
+        self.failUnless( '"visiting"' in mb.stats.to_json() )
+
+class decls_index_tester_t( unittest.TestCase ):
+    def __write( self, name, code ):
+        fpath = os.path.join( autoconfig.build_directory, name )
+        f = file( fpath, 'w+' )
+        f.write( code )
+        f.close()
+        return fpath
+
+    def test( self ):
+        header_a = self.__write( 'decls_index_a.hpp', 'struct A{ void do_smth(); }; void do_smth();' )
+        header_b = self.__write( 'decls_index_b.hpp'
+                                 , 'struct B{ void do_smth(); bool operator==( const B& ) const; int operator()( int ); };'
+                                   'bool operator<( const B&, const B& ); enum E{ e };' )
+        mb = module_builder.module_builder_t(
+                [ header_a, header_b ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        self.failUnless( mb.class_( 'A', header_file=header_a ) is mb.global_ns.class_( 'A', header_file=header_a ) )
+        self.failUnlessRaises( declarations.matcher.declaration_not_found_t
+                               , mb.class_, 'A', header_file=header_b )
+        for header in ( header_a, header_b ):
+            expected = mb.global_ns.decls( header_file=header )
+            self.failUnless( list( expected ) == list( mb.decls( header_file=header ) ) )
+            expected = mb.global_ns.mem_funs( 'do_smth', header_file=header )
+            self.failUnless( list( expected ) == list( mb.mem_funs( 'do_smth', header_file=header ) ) )
+        expected = mb.global_ns.calldefs( 'do_smth', header_dir=autoconfig.build_directory )
+        self.failUnless( list( expected ) == list( mb.calldefs( 'do_smth', header_dir=autoconfig.build_directory ) ) )
+        self.failUnless( mb.enum( lambda decl: decl.name == 'E', header_file=header_b ) )
+        for symbol in ( '==', '()', '<' ):
+            expected = mb.global_ns.operators( symbol, header_file=header_b )
+            self.failUnless( 1 == len( expected ) )
+            self.failUnless( list( expected ) == list( mb.operators( symbol, header_file=header_b ) ) )
+            self.failUnless( list( expected ) == list( mb.operators( symbol=symbol, header_file=header_b ) ) )
+        self.failUnless( mb.member_operator( '==', header_file=header_b ) is mb.class_( 'B' ).operator( '==' ) )
+        self.failUnless( mb.free_operator( '<', header_file=header_b ) is mb.global_ns.free_operator( '<' ) )
+
+class rules_set_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = """
+            namespace xxx{ struct A{ void f1(); void impl_f2(); private: void f3(); }; void impl_f4(); }
+            namespace yyy{ struct B{}; }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        rules = module_builder.rules_set_t()
+        rules.exclude( name='.*' )
+        rules.include( name='::xxx', decl_type=module_builder.namespace_t )
+        rules.exclude( name='impl_.*', decl_type=module_builder.calldef_t )
+        rules.exclude( access_type=declarations.ACCESS_TYPES.PRIVATE )
+        affected = mb.apply_rules( rules )
+        self.failUnless( 4 == len( affected ) )
+        self.failUnless( 2 == affected[2] )
+        self.failUnless( mb.class_( 'A' ).ignore == False )
+        self.failUnless( mb.mem_fun( 'f1' ).ignore == False )
+        self.failUnless( mb.mem_fun( 'impl_f2' ).ignore == True )
+        self.failUnless( mb.mem_fun( 'f3' ).ignore == True )
+        self.failUnless( mb.free_fun( 'impl_f4' ).ignore == True )
+        self.failUnless( mb.class_( 'B' ).ignore == True )
+
+class creators_index_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = """
+            namespace xxx{
+                struct A{ int i; };
+                struct B : public A{ int j; };
+                bool operator==( const B&, const B& );
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'xxx' ).include()
+        mb.build_code_creator( 'creators_index' )
+        finder = code_creators.creator_finder
+        body = mb.code_creator.body
+        for decl in mb.decls( recursive=True ):
+            expected = finder.find_by_declaration( lambda d: d is decl, body.creators )
+            self.failUnless( expected == finder.find_by_declaration_instance( decl, body.creators ) )
+            unordered = finder.find_by_declaration_instance( decl, body.creators, ordered=False )
+            self.failUnless( set( map( id, expected ) ) == set( map( id, unordered ) ) )
+        expected = filter( lambda cc: isinstance( cc, code_creators.class_t )
+                           , code_creators.make_flatten( body.creators ) )
+        self.failUnless( expected == finder.find_by_class_instance( code_creators.class_t, body.creators ) )
+        b_creator = finder.find_by_declaration_instance( mb.class_( 'B' ), body )[0]
+        self.failUnless( finder.find_by_class_instance( code_creators.operator_t, b_creator ) )
+        b_creator.parent.remove_creator( b_creator )
+        self.failUnless( not finder.find_by_declaration_instance( mb.class_( 'B' ), body ) )
+        self.failUnless( not finder.find_by_class_instance( code_creators.operator_t, body ) )
+
+class flatten_tester_t( unittest.TestCase ):
+    def test( self ):
+        extmodule = code_creators.bpmodule_t( None )
+        body = code_creators.module_body_t( name='flatten' )
+        extmodule.adopt_creator( body )
+        scope = code_creators.module_body_t( name='scope' )
+        body.adopt_creator( scope )
+        a = code_creators.custom_text_t( 'a' )
+        scope.adopt_creator( a )
+        self.failUnless( [ extmodule, body, scope, a ] == code_creators.make_flatten( extmodule ) )
+        self.failUnless( [ scope, a ] == code_creators.make_flatten( body.creators ) )
+        b = code_creators.custom_text_t( 'b' )
+        body.adopt_creator( b, 0 )
+        self.failUnless( [ body, b, scope, a ] == code_creators.make_flatten( body ) )
+        self.failUnless( [ b, a ] == code_creators.creator_finder.find_by_class_instance(
+                                        code_creators.custom_text_t, body ) )
+        self.failUnless( [ a ] == code_creators.creator_finder.find_by_class_instance(
+                                        code_creators.custom_text_t, scope.creators ) )
+        body.remove_creator( scope )
+        self.failUnless( [ body, b ] == list( code_creators.make_flatten_generator( body ) ) )
+
+class declaration_creators_tester_t( unittest.TestCase ):
+    def test( self ):
+        extmodule = code_creators.bpmodule_t( None )
+        body = code_creators.module_body_t( name='declaration_creators' )
+        extmodule.adopt_creator( body )
+        texts = map( code_creators.custom_text_t, [ 'a', 'b', 'c' ] )
+        extmodule.adopt_declaration_creator( texts[0] )
+        extmodule.adopt_declaration_creators( texts[1:] )
+        self.failUnless( texts + [ body ] == extmodule.creators )
+        extmodule.adopt_declaration_creator( code_creators.custom_text_t( 'd' ) )
+        extmodule.remove_creator( texts[1] )
+        self.failUnless( [ texts[0], texts[2] ] == extmodule.creators[:2] )
+        self.failUnless( 'd' == extmodule.creators[2].text )
+        self.failUnless( body is extmodule.creators[3] )
+
+class sink_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = """
+            namespace xxx{
+                struct A{ int i; void do_smth(); virtual void do_virtual(); };
+                struct B{ enum color{ red, green }; void do_smth(); };
+                enum E{ e1, e2 };
+                int get_int();
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'xxx' ).include()
+        mb.build_code_creator( 'sink' )
+        sink = code_creators.sink_t()
+        mb.code_creator.render( sink )
+        self.failUnless( mb.code_creator.create() == sink.getvalue() )
+        class_creator = code_creators.creator_finder.find_by_declaration_instance(
+                            mb.class_( 'B' ), mb.code_creator.body )[0]
+        class_creator.create = lambda: 'register_B_class();'
+        sink = code_creators.sink_t()
+        class_creator.render( sink )
+        self.failUnless( 'register_B_class();' == sink.getvalue() )
+
+class code_cache_tester_t( unittest.TestCase ):
+    def test( self ):
+        body = code_creators.module_body_t( name='code_cache' )
+        text = code_creators.custom_text_t( 'a();' )
+        body.adopt_creator( text )
+        code_creators.code_creator_t.begin_code_caching()
+        try:
+            code = body.create()
+            self.failUnless( code is body.create() )
+            text.replace_code( 'b();' )
+            self.failUnless( 'b();' in body.create() )
+            body.adopt_creator( code_creators.custom_text_t( 'c();' ) )
+            self.failUnless( 'c();' in body.create() )
+        finally:
+            code_creators.code_creator_t.end_code_caching()
+        text.replace_code( None )
+        self.failUnless( 'a();' in body.create() )
+
+class smart_ptr_converters_tester_t( unittest.TestCase ):
+    def __converters( self, used_only ):
+        code = """
+            namespace boost{ template< class T > struct shared_ptr{ T* p; }; }
+            namespace xxx{
+                struct A{ virtual ~A(){} };
+                struct B : public A{};
+                struct C : public B{};
+                void do_a( boost::shared_ptr< A > a );
+                boost::shared_ptr< C > get_c();
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'xxx' ).include()
+        mb.build_code_creator( 'smart_ptr_converters', used_smart_ptr_converters_only=used_only )
+        converters = code_creators.creator_finder.find_by_class_instance(
+                        code_creators.smart_pointers_converter_t, mb.code_creator.body )
+        return map( lambda cc: ( cc.source.name, cc.target.name ), converters )
+
+    def test( self ):
+        all_converters = self.__converters( False )
+        self.failUnless( len( all_converters ) == len( set( all_converters ) ) )
+        self.failUnless( ( 'B', 'A' ) in all_converters )
+        used_converters = self.__converters( True )
+        self.failUnless( [ ( 'C', 'A' ) ] == used_converters )
+
+class namespace_alias_tester_t( unittest.TestCase ):
+    def test( self ):
+        body = code_creators.module_body_t( name='namespace_alias' )
+        body.adopt_creator( code_creators.namespace_alias_t( 'bp', '::boost::python' ) )
+        scope = code_creators.module_body_t( name='scope' )
+        body.adopt_creator( scope )
+        text = code_creators.custom_text_t( 'a();' )
+        scope.adopt_creator( text )
+        self.failUnless( 'bp::object' == code_creators.create_identifier( text, '::boost::python::object' ) )
+        self.failUnless( 'std::string' == code_creators.create_identifier( text, '::std::string' ) )
+        self.failUnless( 2 == len( scope.get_identifiers() ) )
+        scope.adopt_creator( code_creators.namespace_alias_t( 'xbp', '::boost::python' ), 0 )
+        self.failUnless( not scope.get_identifiers() )
+        self.failUnless( 'xbp::object' == code_creators.create_identifier( text, '::boost::python::object' ) )
+        alias = scope.creators[0]
+        alias.full_namespace_name = '::std'
+        self.failUnless( 'xbp::string' == code_creators.create_identifier( text, '::std::string' ) )
+        self.failUnless( 'bp::object' == code_creators.create_identifier( text, '::boost::python::object' ) )
+        scope.remove_creator( alias )
+        self.failUnless( 'std::string' == code_creators.create_identifier( text, '::std::string' ) )
+        self.failUnless( 'boost::python::object' == code_creators.create_identifier( body.creators[0], '::boost::python::object' ) )
+
+class parallel_rendering_tester_t( unittest.TestCase ):
+    def __write( self, jobs ):
+        code = """
+            namespace xxx{
+                struct A{ virtual int do_a(){ return 1; } };
+                struct B : public A{ virtual int do_b(){ return 2; } };
+                struct C{ enum color{ red, green }; void do_c( color ); };
+                struct D{ A a; B b; int do_d( int ); };
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        mb.namespace( 'xxx' ).include()
+        mb.build_code_creator( 'parallel_rendering' )
+        dir_name = os.path.join( autoconfig.build_directory, 'parallel_rendering_%d' % jobs )
+        written_files = mb.split_module( dir_name, jobs=jobs )
+        return dict( [ ( os.path.basename( f ), file( f ).read() ) for f in written_files ] )
+
+    def test( self ):
+        self.failUnless( self.__write( 1 ) == self.__write( 3 ) )
+
+class calldefs_groups_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = """
+            namespace xxx{
+                void f( int );
+                void f( double );
+                void g();
+                struct A{ void m( int ); void m( bool ); int n(); };
+            }
+            namespace yyy{ void h(); }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        xxx = mb.namespace( 'xxx' )
+        free_functions, name2overloads = xxx.get_calldefs_groups( declarations.free_function_t )
+        self.failUnless( list( xxx.free_functions( recursive=False ) ) == free_functions )
+        self.failUnless( list( xxx.free_functions( 'f', recursive=False ) ) == name2overloads[ 'f' ] )
+        a = xxx.class_( 'A' )
+        member_functions, name2overloads = a.get_calldefs_groups( declarations.member_function_t )
+        self.failUnless( list( a.member_functions( 'm' ) ) == name2overloads[ 'm' ] )
+        m_int = a.member_function( 'm', arg_types=[ 'int' ] )
+        m_bool = a.member_function( 'm', arg_types=[ 'bool' ] )
+        problematics = decl_wrappers.algorithm.registration_order.select_problematics( m_int )
+        self.failUnless( [ m_bool ] == problematics )
+        #the declarations count is not changed, but the groups are
+        f_double = xxx.free_function( 'f', arg_types=[ 'double' ] )
+        h = mb.free_function( 'h' )
+        xxx.remove_declaration( f_double )
+        h.parent.remove_declaration( h )
+        xxx.adopt_declaration( h )
+        free_functions, name2overloads = xxx.get_calldefs_groups( declarations.free_function_t )
+        self.failUnless( f_double not in free_functions )
+        self.failUnless( [ xxx.free_function( 'f' ) ] == name2overloads[ 'f' ] )
+        self.failUnless( [ h ] == name2overloads[ 'h' ] )
+
+class redefined_funcs_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = """
+            namespace xxx{
+                struct base{ virtual void do_nothing() = 0; };
+                struct derived : public base{ virtual void do_something() = 0; };
+                struct concrete : public derived{
+                    virtual void do_nothing(){}
+                    virtual void do_something(){}
+                };
+                struct base2{ virtual void f( int ){} void f( double ){} };
+                struct derived2 : public base2{};
+                struct derived3 : public base2{ virtual void f( int ){} };
+                struct derived4 : public base2{};
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        xxx = mb.namespace( 'xxx' )
+        xxx.include()
+        names = lambda cls: map( lambda f: f.name, xxx.class_( cls ).redefined_funcs() )
+        self.failUnless( [ 'do_nothing' ] == names( 'derived' ) )
+        self.failUnless( [] == names( 'concrete' ) )
+        redefined = xxx.class_( 'derived2' ).redefined_funcs()
+        self.failUnless( set( [ xxx.class_( 'base2' ).member_function( 'f', arg_types=[ 'int' ] )
+                                , xxx.class_( 'base2' ).member_function( 'f', arg_types=[ 'double' ] ) ] )
+                         == set( redefined ) )
+        self.failUnless( [] == names( 'derived3' ) )
+        f_int = xxx.class_( 'base2' ).member_function( 'f', arg_types=[ 'int' ] )
+        f_int.exclude()
+        self.failUnless( f_int not in xxx.class_( 'derived4' ).redefined_funcs() )
+
+class wrapper_needed_cache_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = """
+            namespace xxx{
+                struct A{
+                    void do_smth();
+                    virtual void do_virtual();
+                    struct B{ int* p; };
+                };
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        a = mb.class_( 'A' )
+        a.include()
+        members = a.get_exportable_members()
+        self.failUnless( a.member_function( 'do_smth' ) in members )
+        self.failUnless( a.is_wrapper_needed() )
+        version = a.config_version
+        a.member_function( 'do_smth' ).exclude()
+        self.failUnless( version < a.config_version )
+        self.failUnless( a.member_function( 'do_smth' ) not in a.get_exportable_members() )
+        a.member_function( 'do_virtual' ).exclude()
+        a.class_( 'B' ).variable( 'p' ).exclude()
+        self.failUnless( [] == a.is_wrapper_needed() )
+        a.add_wrapper_code( '//wrapper code' )
+        self.failUnless( [ messages.W1020 ] == a.is_wrapper_needed() )
+        explanation = a.is_wrapper_needed()
+        explanation.append( 'changed by caller' )
+        self.failUnless( [ messages.W1020 ] == a.is_wrapper_needed() )
+
+class readme_report_tester_t( unittest.TestCase ):
+    def __build( self, snapshot ):
+        code = """
+            namespace xxx{
+                struct A{ virtual int& get_value(); };
+                void do_smth( int& x );
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , snapshot=snapshot )
+        mb.namespace( 'xxx' ).include()
+        return mb
+
+    def test( self ):
+        from pyplusplus.creators_factory import readme_report
+        snapshot = os.path.join( autoconfig.build_directory, 'readme_report.pypp.bin' )
+        report_file = os.path.join( autoconfig.build_directory, 'readme_report.pypp.json' )
+        for file_ in ( snapshot, report_file ):
+            if os.path.exists( file_ ):
+                os.remove( file_ )
+        self.__build( snapshot ).build_code_creator( 'readme_report', readme_report_file=report_file )
+
+        mb = self.__build( snapshot )
+        key = readme_report.create_key( mb.decls_digest, mb.global_ns )
+        stored = readme_report.readme_report_t.load( report_file, key )
+        self.failUnless( stored and stored.entries )
+
+        decls = list( enumerate( declarations.make_flatten( mb.global_ns ) ) )
+        decls = filter( lambda ( decl_id, decl ): not decl.ignore and decl.readme(), decls )
+        serial = readme_report.create( decls, key )
+        parallel = readme_report.create( decls, key, jobs=2 )
+        self.failUnless( serial.entries == stored.entries )
+        self.failUnless( parallel.entries == stored.entries )
+
+        mb = self.__build( snapshot )
+        mb.free_function( 'do_smth' ).exclude()
+        changed_key = readme_report.create_key( mb.decls_digest, mb.global_ns )
+        self.failUnless( key != changed_key )
+        self.failUnless( None is readme_report.readme_report_t.load( report_file, changed_key ) )
+
+        mb = self.__build( snapshot )
+        get_value = mb.mem_fun( 'get_value' )
+        self.failUnless( 'deferred' == get_value.call_policies_state )
+        self.failUnless( key == readme_report.create_key( mb.decls_digest, mb.global_ns ) )
+        self.failUnless( 'deferred' == get_value.call_policies_state )
+        mb.class_( 'A' ).add_fake_constructors( mb.free_function( 'do_smth' ) )
+        self.failUnless( key != readme_report.create_key( mb.decls_digest, mb.global_ns ) )
+
+class alias_directives_tester_t( unittest.TestCase ):
+    def test( self ):
+        code = """
+            namespace xxx{
+                template< class T > struct holder{ T value; };
+            }
+            namespace pyplusplus{ namespace aliases{
+                typedef xxx::holder< int > holder_i;
+                typedef xxx::holder< int > holder_int;
+            } }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        holder = mb.class_( 'holder< int >' )
+        self.failUnless( 'holder_int' == holder.alias )
+        w1048 = filter( lambda msg: messages.find_out_message_id( msg ) == messages.W1048.identifier
+                        , holder.readme() )
+        self.failUnless( 1 == len( w1048 ) )
+        self.failUnless( w1048 == filter( lambda msg: messages.find_out_message_id( msg ) == messages.W1048.identifier
+                                          , holder.readme() ) )
+        holder.rename( 'int_holder' )
+        self.failUnless( 'int_holder' == holder.alias )
+
+class properties_index_tester_t( unittest.TestCase ):
+    class full_scan_recognizer_t( decl_wrappers.name_based_recognizer_t ):
+        def property_name_keys( self, mem_fun, is_getter ):
+            return None
+
+    class any_prefix_recognizer_t( decl_wrappers.name_based_recognizer_t ):
+        def find_out_prefixes( self, gname, sname ):
+            return ( gname[:-5], sname[:-5] )
+
+    def test( self ):
+        code = """
+            namespace xxx{
+                struct base{
+                    void set_size( int );
+                    int count() const;
+                };
+                struct A : public base{
+                    int size() const;
+                    int get_value() const;
+                    void set_value( int );
+                    int getWidth() const;
+                    void setWidth( int );
+                    void SetHeight( int );
+                    int Height() const;
+                    bool is_empty() const;
+                    void set_count( int );
+                    int empty;
+                };
+            }
+        """
+        mb = module_builder.module_builder_t(
+                [ module_builder.create_text_fc( code ) ]
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler() )
+        a = mb.class_( 'A' )
+        describe = lambda props: map( str, props )
+        indexed = describe( decl_wrappers.properties.find_properties( a ) )
+        full_scan = describe( decl_wrappers.properties.find_properties( a, self.full_scan_recognizer_t() ) )
+        self.failUnless( indexed == full_scan )
+        self.failUnless( 'value' in map( lambda prop: prop.name, decl_wrappers.properties.find_properties( a ) ) )
+        recognizer = self.any_prefix_recognizer_t()
+        self.failUnless( None is recognizer.property_name_keys( a.member_function( 'getWidth' ), True ) )
+        self.failUnless( 'Width' in map( lambda prop: prop.name
+                                         , decl_wrappers.properties.find_properties( a, recognizer ) ) )
+
+class incremental_parsing_tester_t( unittest.TestCase ):
+    class counting_cache_t( parser.file_cache_t ):
+        """per file declarations cache, which remembers the files found in it"""
+        def __init__( self, name ):
+            parser.file_cache_t.__init__( self, name )
+            self.hits = []
+
+        def cached_value( self, source_file, configuration ):
+            value = parser.file_cache_t.cached_value( self, source_file, configuration )
+            if None is not value:
+                self.hits.append( os.path.basename( source_file ) )
+            return value
+
+    def __write( self, name, code ):
+        fpath = os.path.join( autoconfig.build_directory, name )
+        f = file( fpath, 'w+' )
+        f.write( code )
+        f.close()
+        return fpath
+
+    def __build( self, files, snapshot, cache=None ):
+        return module_builder.module_builder_t(
+                files
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , snapshot=snapshot
+                , cache=cache )
+
+    def test( self ):
+        snapshot = os.path.join( autoconfig.build_directory, 'incremental.pypp.bin' )
+        for file_ in ( snapshot, snapshot + '.files' ):
+            if os.path.exists( file_ ):
+                os.remove( file_ )
+        files = [ self.__write( 'incremental_a.hpp', 'struct A{};' )
+                  , self.__write( 'incremental_b.hpp', 'struct B{};' ) ]
+        self.__build( files, snapshot )
+        self.failUnless( os.path.exists( snapshot + '.files' ) )
+
+        self.__write( 'incremental_b.hpp', 'struct B{}; struct C{};' )
+        #the same per file cache, the snapshot uses, which counts the cache hits
+        cache = self.counting_cache_t( snapshot + '.files' )
+        mb = self.__build( files, snapshot, cache )
+        mb.class_( 'A' )
+        mb.class_( 'C' )
+        #only the changed header was parsed again
+        self.failUnless( 'incremental_a.hpp' in cache.hits )
+        self.failUnless( 'incremental_b.hpp' not in cache.hits )
+        self.failUnless( 'parsing' in mb.stats )
+
+class parallel_parsing_tester_t( unittest.TestCase ):
+    def __build( self, jobs ):
+        files = [ 'enums_to_be_exported.hpp', 'free_functions_to_be_exported.hpp' ]
+        files = map( lambda f: os.path.join( autoconfig.data_directory, f ), files )
+        return module_builder.module_builder_t(
+                files
+                , gccxml_path=autoconfig.gccxml.executable
+                , compiler=pygccxml.utils.native_compiler.get_gccxml_compiler()
+                , jobs=jobs )
+
+    def test( self ):
+        sequential = map( declarations.full_name, self.__build( 1 ).decls( recursive=True ) )
+        parallel = map( declarations.full_name, self.__build( 2 ).decls( recursive=True ) )
+        self.failUnless( sequential == parallel )
+
 def create_suite():
     suite = unittest.TestSuite()
     suite.addTest( unittest.makeSuite(doc_extractor_tester_t))
@@ -316,10 +965,33 @@ def create_suite():
     suite.addTest( unittest.makeSuite(class_multiple_files_tester_t))
     suite.addTest( unittest.makeSuite(readme_tester_t))
     suite.addTest( unittest.makeSuite(split_sequence_tester_t))
+    suite.addTest( unittest.makeSuite(path_index_tester_t))
     suite.addTest( unittest.makeSuite(exclude_erronious_tester_t))
     suite.addTest( unittest.makeSuite(use_function_signature_bug_tester_t))
     suite.addTest( unittest.makeSuite(exclude_ellipsis_tester_t))
     suite.addTest( unittest.makeSuite(constructors_code_tester_t))
+    suite.addTest( unittest.makeSuite(decls_snapshot_tester_t))
+    suite.addTest( unittest.makeSuite(call_policies_on_demand_tester_t))
+    suite.addTest( unittest.makeSuite(class_level_defaults_tester_t))
+    suite.addTest( unittest.makeSuite(statistics_tester_t))
+    suite.addTest( unittest.makeSuite(decls_index_tester_t))
+    suite.addTest( unittest.makeSuite(rules_set_tester_t))
+    suite.addTest( unittest.makeSuite(creators_index_tester_t))
+    suite.addTest( unittest.makeSuite(flatten_tester_t))
+    suite.addTest( unittest.makeSuite(declaration_creators_tester_t))
+    suite.addTest( unittest.makeSuite(smart_ptr_converters_tester_t))
+    suite.addTest( unittest.makeSuite(sink_tester_t))
+    suite.addTest( unittest.makeSuite(code_cache_tester_t))
+    suite.addTest( unittest.makeSuite(namespace_alias_tester_t))
+    suite.addTest( unittest.makeSuite(parallel_rendering_tester_t))
+    suite.addTest( unittest.makeSuite(calldefs_groups_tester_t))
+    suite.addTest( unittest.makeSuite(redefined_funcs_tester_t))
+    suite.addTest( unittest.makeSuite(wrapper_needed_cache_tester_t))
+    suite.addTest( unittest.makeSuite(readme_report_tester_t))
+    suite.addTest( unittest.makeSuite(alias_directives_tester_t))
+    suite.addTest( unittest.makeSuite(properties_index_tester_t))
+    suite.addTest( unittest.makeSuite(incremental_parsing_tester_t))
+    suite.addTest( unittest.makeSuite(parallel_parsing_tester_t))
     return suite
 
 def run_suite():